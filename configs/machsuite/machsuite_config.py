@@ -19,7 +19,26 @@ system.clk_domain = SrcClockDomain(clock="4GHz",
 system.mem_mode = "timing"
 system.mem_ranges = [AddrRange("512MB")]
 
-system.cpu = O3CPU()
+# Warm-up: run this many instructions on a fast CPU first so the caches,
+# the children's tables and the bandit start the measured O3 run warm,
+# then switch to O3 and reset stats. 0 runs O3 from the start.
+warmup_insts = 0          # <---- EDIT THIS
+
+# "timing" trains caches, prefetchers and the bandit. "atomic" is faster
+# but only warms cache contents: BaseCache never invokes prefetchers in
+# atomic mode, so the children and the bandit stay cold.
+warmup_cpu_type = "timing"
+
+if warmup_insts > 0:
+    WarmupCPU = {"timing": TimingSimpleCPU,
+                 "atomic": AtomicSimpleCPU}[warmup_cpu_type]
+    system.mem_mode = WarmupCPU.memory_mode()
+    system.cpu = WarmupCPU(max_insts_any_thread=warmup_insts)
+    system.detailed_cpu = O3CPU(switched_out=True)
+    detailed_cpu = system.detailed_cpu
+else:
+    system.cpu = O3CPU()
+    detailed_cpu = system.cpu
 
 # ------------------------------------------------------------
 # 2. L1 + L2 Cache Hierarchy (MacheSuite recommended)
@@ -44,7 +63,7 @@ system.l2cache = L2Cache(
 # 3. Attach the ML Prefetch Controller *to the L2 Cache*
 # ------------------------------------------------------------
 system.l2cache.prefetcher = MLPrefetchController(
-    cpu             = system.cpu,
+    cpu             = detailed_cpu,
     cache_name      = "system.l2cache",
     current_action  = 0,
     ticks_per_epoch = 2_000_000,
@@ -53,6 +72,11 @@ system.l2cache.prefetcher = MLPrefetchController(
     debug_logging = False,  
     # optional but use if using custom trained qtable:
     # qtable_file   = "qtable_machsuite.bin",
+    # Alternatively, one Stride trained once for an arm per
+    # (degree, distance), in place of the Stride children below:
+    # stride_child     = StridePrefetcher(),
+    # stride_degrees   = [1, 2, 4],
+    # stride_distances = [0, 1, 2],
     children = [
         StridePrefetcher(degree=1, distance=1), 
         StridePrefetcher(degree=4, distance=2), 
@@ -62,6 +86,48 @@ system.l2cache.prefetcher = MLPrefetchController(
     ]
 )
 
+if warmup_insts > 0:
+    system.l2cache.prefetcher.warmup_cpu = system.cpu
+
+# Insert prefetched blocks at the LRU position of the small L2 until
+# their first demand hit, for the arms given a demotion of 1 (one entry
+# per child). The cautious degree-1 Stride inserts like demand blocks.
+prefetch_aware_insertion = False
+if prefetch_aware_insertion:
+    system.l2cache.replacement_policy = PrefetchAwareRP(
+        replacement_policy=LRURP())
+    system.l2cache.prefetcher.insertion_policy = \
+        system.l2cache.replacement_policy
+    system.l2cache.prefetcher.arm_prefetch_demotions = [0, 1, 1]
+
+# Record the L2 access stream labelled with the issuing child and the
+# active arm. Summarise it with util/decode_prefetch_trace.py.
+trace_prefetches = False
+if trace_prefetches:
+    system.l2cache.pf_trace = PrefetchTraceProbe(
+        controller=system.l2cache.prefetcher)
+
+# Put a second controller on the L1D and coordinate both levels: each
+# sees the other's miss rate and the prefetch overlap in its state, and
+# the L2 drops candidates the L1D has just prefetched.
+coordinate_l1d = False
+if coordinate_l1d:
+    system.cpu.dcache.prefetcher = MLPrefetchController(
+        cpu             = detailed_cpu,
+        cache_name      = "system.cpu.dcache",
+        ticks_per_epoch = 2_000_000,
+        children = [
+            StridePrefetcher(degree=1, distance=0),
+            TaggedPrefetcher(),
+        ]
+    )
+    if warmup_insts > 0:
+        system.cpu.dcache.prefetcher.warmup_cpu = system.cpu
+    system.pf_coordinator = MLPrefetchCoordinator(controllers=[
+        system.cpu.dcache.prefetcher,
+        system.l2cache.prefetcher,
+    ])
+
 #system.l2cache.prefetcher = TaggedPrefetcher( 
 #    degree = 4,
 #    distance = 2,
@@ -77,6 +143,13 @@ system.mem_ctrl.dram = HBM_2000_4H_1x64()
 system.mem_ctrl.dram.range = system.mem_ranges[0]
 system.mem_ctrl.port = system.membus.mem_side_ports
 
+# Feed the memory queue occupancy to the prefetch controller, which then
+# caps prefetching in epochs where the queues are saturated. Set
+# bandwidth_feature to also make the occupancy part of the RL state.
+throttle_on_mem_pressure = False
+if throttle_on_mem_pressure:
+    system.l2cache.prefetcher.mem_ctrls = [system.mem_ctrl]
+
 # ------------------------------------------------------------
 # 5. Port Wiring (explicit and version-safe)
 # ------------------------------------------------------------
@@ -132,6 +205,12 @@ system.workload = SEWorkload.init_compatible(machsuite_path)
 system.cpu.workload = process
 system.cpu.createThreads()
 
+if warmup_insts > 0:
+    detailed_cpu.workload = process
+    detailed_cpu.clk_domain = system.cpu.clk_domain
+    detailed_cpu.isa = system.cpu.isa
+    detailed_cpu.createThreads()
+
 root = Root(full_system=False, system=system)
 
 # ------------------------------------------------------------
@@ -140,5 +219,19 @@ root = Root(full_system=False, system=system)
 m5.instantiate()
 
 print("\n===== Starting ML Prefetch Controller + MacheSuite Test =====\n")
+
+if warmup_insts > 0:
+    print(f"Warming up for {warmup_insts} instructions "
+          f"({warmup_cpu_type} CPU)")
+    event = m5.simulate()
+    if event.getCause() != "a thread reached the max instruction count":
+        print(f"\nExited during warm-up @ tick {m5.curTick()} because: "
+              f"{event.getCause()}\n")
+        sys.exit(0)
+
+    m5.switchCpus(system, [(system.cpu, detailed_cpu)])
+    m5.stats.reset()
+    print(f"Switched to O3 @ tick {m5.curTick()}; stats reset")
+
 event = m5.simulate()
 print(f"\nExited @ tick {m5.curTick()} because: {event.getCause()}\n")
@@ -335,6 +335,7 @@ def define_constants(constants):
     constants.gem5_binary_fixture_name = "gem5"
     constants.xml_filename = "results.xml"
     constants.pickle_filename = "results.pickle"
+    constants.durations_filename = "durations.json"
     constants.pickle_protocol = highest_pickle_protocol
 
     # The root directory which all test names will be based off of.
@@ -377,6 +378,15 @@ def define_post_processors(config):
         if test_threads is not None:
             return (int(test_threads[0]),)
 
+    def shard_as_tuple(shard):
+        if shard is not None and shard[0] is not None:
+            index, _, count = shard[0].partition("/")
+            index, count = int(index), int(count)
+            if not 1 <= index <= count:
+                raise ValueError(f"Invalid shard '{shard[0]}'.")
+            return ((index, count),)
+        return shard
+
     def default_isa(isa):
         if not isa[0]:
             return [constants.supported_tags[constants.isa_tag_type]]
@@ -437,6 +447,7 @@ def define_post_processors(config):
     config._add_post_processor("host", default_host)
     config._add_post_processor("threads", threads_as_int)
     config._add_post_processor("test_threads", test_threads_as_int)
+    config._add_post_processor("shard", shard_as_tuple)
     config._add_post_processor(
         StorePositionalTagsAction.position_kword, compile_tag_regex
     )
@@ -611,6 +622,31 @@ def define_common_args(config):
             default=1,
             help="Number of threads to spawn to run concurrent tests with.",
         ),
+        Argument(
+            "--test-processes",
+            action="store_true",
+            default=False,
+            help="Run concurrent tests (see --test-threads) in separate "
+            "processes rather than threads.",
+        ),
+        Argument(
+            "--shard",
+            action="store",
+            default=None,
+            metavar="I/N",
+            help="Only run the I-th of N deterministic, roughly equal "
+            "shares of the selected suites (1 <= I <= N).",
+        ),
+        Argument(
+            "--result-cache",
+            action="store",
+            default=None,
+            metavar="FILE",
+            help="Skip suites that passed before with the same gem5 binary, "
+            "config, arguments and reference files, as recorded in FILE. "
+            "Only files named by tests and fixtures are hashed; modules a "
+            "config imports are not.",
+        ),
         Argument(
             "-v",
             action="count",
@@ -709,6 +745,9 @@ class RunParser(ArgParser):
         common_args.bin_path.add_to(parser)
         common_args.threads.add_to(parser)
         common_args.test_threads.add_to(parser)
+        common_args.test_processes.add_to(parser)
+        common_args.shard.add_to(parser)
+        common_args.result_cache.add_to(parser)
         common_args.isa.add_to(parser)
         common_args.variant.add_to(parser)
         common_args.length.add_to(parser)
@@ -794,6 +833,8 @@ class RerunParser(ArgParser):
         common_args.bin_path.add_to(parser)
         common_args.threads.add_to(parser)
         common_args.test_threads.add_to(parser)
+        common_args.test_processes.add_to(parser)
+        common_args.result_cache.add_to(parser)
         common_args.isa.add_to(parser)
         common_args.variant.add_to(parser)
         common_args.length.add_to(parser)
@@ -94,6 +94,12 @@ class Fixture:
         # If this fixtures is not a build of gem5, None is returned.
         return None
 
+    def cache_inputs(self):
+        # The inputs this fixture provides to the tests using it, used to
+        # key the result cache. Paths of existing files are hashed by
+        # content, anything else by value.
+        return ()
+
     def __str__(self):
         return f"{self.name} fixture"
 
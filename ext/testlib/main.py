@@ -27,14 +27,18 @@
 # Authors: Sean Wilson
 
 import itertools
+import json
+import math
 import os
 
 import testlib.configuration as configuration
 import testlib.handlers as handlers
+import testlib.helper as helper
 import testlib.loader as loader_mod
 import testlib.log as log
 import testlib.query as query
 import testlib.result as result
+import testlib.result_cache as result_cache
 import testlib.runner as runner
 import testlib.terminal as terminal
 import testlib.uid as uid
@@ -216,6 +220,57 @@ def filter_with_tags(loaded_library, filters):
     ]
 
 
+def shard_schedule(test_schedule, index, count):
+    """
+    Keep only the index-th (counting from 1) of count shares of the suites.
+
+    Suites are dealt out round-robin in order of their UIDs, so every machine
+    given the same suites and the same count selects disjoint shares that
+    together cover all the suites.
+    """
+    ordered = sorted(test_schedule.suites, key=lambda suite: str(suite.uid))
+    selected = set(ordered[index - 1 :: count])
+    test_schedule.suites = [
+        suite for suite in test_schedule.suites if suite in selected
+    ]
+
+
+def durations_path():
+    return os.path.join(
+        configuration.config.result_path,
+        configuration.constants.durations_filename,
+    )
+
+
+def load_durations():
+    """
+    Load how long each suite took the last time it was run, keyed by UID.
+    """
+    try:
+        with open(durations_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations):
+    helper.mkdir_p(configuration.config.result_path)
+    with open(durations_path(), "w") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def schedule_longest_first(test_schedule, durations):
+    """
+    Order the suites so that the ones which took longest last time start
+    first. Suites which have not been timed yet might be long, so they go
+    before all the others.
+    """
+    test_schedule.suites = sorted(
+        test_schedule.suites,
+        key=lambda suite: -durations.get(str(suite.uid), math.inf),
+    )
+
+
 # TODO Add results command for listing previous results.
 
 
@@ -303,6 +358,13 @@ def run_schedule(test_schedule, log_handler):
     * Global Fixture Teardown
     """
 
+    if configuration.config.shard:
+        shard_schedule(test_schedule, *configuration.config.shard)
+
+    durations = load_durations()
+    if configuration.config.test_threads > 1:
+        schedule_longest_first(test_schedule, durations)
+
     log_handler.schedule_finalized(test_schedule)
 
     log.test_log.message(terminal.separator())
@@ -319,10 +381,21 @@ def run_schedule(test_schedule, log_handler):
     if configuration.config.test_threads > 1:
         library_runner = runner.LibraryParallelRunner(test_schedule)
         library_runner.set_threads(configuration.config.test_threads)
+        library_runner.set_processes(configuration.config.test_processes)
     else:
         library_runner = runner.LibraryRunner(test_schedule)
+
+    cache = None
+    if configuration.config.result_cache:
+        cache = result_cache.ResultCache(configuration.config.result_cache)
+        library_runner.set_result_cache(cache)
     library_runner.run()
 
+    durations.update(library_runner.durations)
+    save_durations(durations)
+    if cache is not None:
+        cache.save()
+
     failed = log_handler.unsuccessful()
 
     log_handler.finish_testing()
@@ -0,0 +1,163 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Cache of suite results keyed by a hash of everything the suite depends on.
+
+A suite's key covers its UID, the file it was defined in, and the inputs
+named by its fixtures (e.g., the gem5 binary) and tests (e.g., the config
+script and its arguments, gold standard files). Inputs that are paths of
+existing files are hashed by content, anything else by value. A suite
+that passed with the same key before is not run again.
+
+Only the files that fixtures and tests name are hashed. Modules imported
+by a config script, for instance, are not, so a change to one of those
+alone does not invalidate a cached result.
+"""
+
+import hashlib
+import json
+import os
+
+import testlib.log as log
+from testlib.state import (
+    Result,
+    Status,
+)
+
+# Bumped whenever the way keys are computed changes.
+_VERSION = 1
+
+_READ_SIZE = 1 << 20
+
+
+class ResultCache:
+    def __init__(self, path):
+        """
+        :param path: The JSON file the cache is kept in. It is created on
+            the first ``save()`` if it doesn't exist.
+        """
+        self.path = path
+        # Content hashes of files, keyed by (path, size, mtime), so that
+        # inputs shared by many suites (e.g., the gem5 binary) are only
+        # read once.
+        self._file_hashes = {}
+        self.entries = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            log.test_log.warn(f"Ignoring malformed result cache {path}")
+            return
+        if data.get("version") == _VERSION:
+            self.entries = data.get("suites", {})
+
+    def _hash_file(self, path):
+        st = os.stat(path)
+        stamp = (path, st.st_size, st.st_mtime_ns)
+        digest = self._file_hashes.get(stamp)
+        if digest is None:
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_READ_SIZE), b""):
+                    h.update(chunk)
+            digest = h.hexdigest()
+            self._file_hashes[stamp] = digest
+        return digest
+
+    def _inputs(self, suite):
+        yield str(suite.uid)
+        yield suite.metadata.path
+        fixtures = list(suite.fixtures)
+        for test in suite:
+            fixtures.extend(test.fixtures)
+            yield str(test.uid)
+            yield from getattr(test.obj, "cache_inputs", ())
+        for fixture in fixtures:
+            yield fixture.name
+            yield from fixture.cache_inputs()
+
+    def key(self, suite):
+        """
+        :returns: The key of the suite's current inputs.
+        """
+        h = hashlib.sha256()
+        for item in self._inputs(suite):
+            if isinstance(item, str) and os.path.isfile(item):
+                item = (item, self._hash_file(item))
+            h.update(repr(item).encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def lookup(self, suite):
+        """
+        :returns: The cached entry if the suite passed before with the same
+            inputs, otherwise None.
+        """
+        entry = self.entries.get(str(suite.uid))
+        if entry is None or entry["result"] != Result.name(Result.Passed):
+            return None
+        if entry["key"] != self.key(suite):
+            return None
+        return entry
+
+    def replay(self, suite, entry):
+        """
+        Marks the suite and its tests with the results stored in ``entry``.
+        """
+        reason = "Result reused from the result cache"
+        suite.status = Status.Running
+        for test in suite:
+            test.status = Status.Running
+            test.result = Result(Result.Passed, reason)
+            time_ = entry["tests"].get(str(test.uid))
+            if time_ is not None:
+                test.time = time_
+            test.status = Status.Complete
+        suite.result = Result(Result.Passed, reason)
+        suite.status = Status.Complete
+
+    def record(self, suite):
+        """
+        Stores the result of a suite that has just run. The key is taken
+        after the run so that it covers inputs the suite's fixtures built.
+        """
+        self.entries[str(suite.uid)] = {
+            "key": self.key(suite),
+            "result": Result.name(suite.result.value),
+            "tests": {
+                str(test.uid): getattr(test.metadata, "time", None)
+                for test in suite
+            },
+        }
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": _VERSION, "suites": self.entries}, f)
+        os.replace(tmp, self.path)
@@ -38,7 +38,9 @@
 #
 # Authors: Sean Wilson
 
+import multiprocessing
 import multiprocessing.dummy
+import time
 import traceback
 
 import testlib.helper as helper
@@ -167,19 +169,150 @@ class SuiteRunner(RunnerPattern):
         self.testable.result = compute_aggregate_result(iter(self.testable))
 
 
+def run_suite_timed(suite):
+    """
+    Runs a suite and returns how long it took, in seconds of wall-clock time.
+    """
+    start = time.perf_counter()
+    suite.runner(suite).run()
+    return time.perf_counter() - start
+
+
+def replay_cached(result_cache, suites):
+    """
+    Replays the results of the suites that passed before with the same
+    inputs.
+
+    :returns: The suites that still have to be run, in their original order.
+    """
+    if result_cache is None:
+        return list(suites)
+
+    to_run = []
+    for suite in suites:
+        entry = result_cache.lookup(suite)
+        if entry is None:
+            to_run.append(suite)
+        else:
+            result_cache.replay(suite, entry)
+    return to_run
+
+
 class LibraryRunner(SuiteRunner):
-    pass
+    result_cache = None
+
+    def __init__(self, loaded_testable):
+        super().__init__(loaded_testable)
+        # Wall-clock time taken by each suite, keyed by the suite's UID.
+        self.durations = {}
+
+    def set_result_cache(self, result_cache):
+        """
+        Skip suites that passed before with the same inputs, and record the
+        results of those that run in the given
+        :class:`testlib.result_cache.ResultCache`.
+        """
+        self.result_cache = result_cache
+
+    def test(self):
+        for suite in replay_cached(self.result_cache, self.testable):
+            self.durations[str(suite.uid)] = run_suite_timed(suite)
+            if self.result_cache is not None:
+                self.result_cache.record(suite)
+        self.testable.result = compute_aggregate_result(iter(self.testable))
+
+
+# The suites run by a process pool. Worker processes are forked after this is
+# set, so they find the suites here rather than having them pickled.
+_pool_suites = None
+
+
+def _run_pooled_suite(index):
+    suite = _pool_suites[index]
+    duration = run_suite_timed(suite)
+    # Tests that were never run (e.g., skipped) have no time.
+    tests = [
+        (test.status, test.result, getattr(test.metadata, "time", None))
+        for test in suite
+    ]
+    return index, duration, suite.status, suite.result, tests
 
 
 class LibraryParallelRunner(RunnerPattern):
+    processes = False
+    result_cache = None
+
+    def __init__(self, loaded_testable):
+        super().__init__(loaded_testable)
+        # Wall-clock time taken by each suite, keyed by the suite's UID.
+        self.durations = {}
+
     def set_threads(self, threads):
         self.threads = threads
 
+    def set_processes(self, processes):
+        """
+        Run suites in a pool of worker processes rather than threads.
+
+        Only global fixtures are set up in this process. Suite and test
+        fixtures are set up in the worker running the suite, so fixtures
+        shared by several suites must be safe to set up from several
+        processes at once.
+        """
+        self.processes = processes
+
+    def set_result_cache(self, result_cache):
+        self.result_cache = result_cache
+
     def test(self):
-        pool = multiprocessing.dummy.Pool(self.threads)
-        pool.map(lambda suite: suite.runner(suite).run(), self.testable)
+        suites = replay_cached(self.result_cache, self.testable)
+        if self.processes:
+            self._test_processes(suites)
+        else:
+            self._test_threads(suites)
         self.testable.result = compute_aggregate_result(iter(self.testable))
 
+    def _test_threads(self, suites):
+        def run(suite):
+            self.durations[str(suite.uid)] = run_suite_timed(suite)
+            if self.result_cache is not None:
+                self.result_cache.record(suite)
+
+        pool = multiprocessing.dummy.Pool(self.threads)
+        # Hand out one suite at a time so that they start in schedule order.
+        pool.map(run, suites, chunksize=1)
+        pool.close()
+        pool.join()
+
+    def _test_processes(self, suites):
+        global _pool_suites
+
+        _pool_suites = suites
+        try:
+            # Workers report through the log, which is process safe, and
+            # return their results so that they can be recorded here too.
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(self.threads) as pool:
+                results = pool.imap_unordered(
+                    _run_pooled_suite, range(len(suites)), chunksize=1
+                )
+                for index, duration, status, result, tests in results:
+                    suite = suites[index]
+                    self.durations[str(suite.uid)] = duration
+                    # Set the metadata directly, the workers already logged
+                    # these updates.
+                    suite.metadata.status = status
+                    suite.metadata.result = result
+                    for test, (status, result, time_) in zip(suite, tests):
+                        test.metadata.status = status
+                        test.metadata.result = result
+                        if time_ is not None:
+                            test.metadata.time = time_
+                    if self.result_cache is not None:
+                        self.result_cache.record(suite)
+        finally:
+            _pool_suites = None
+
 
 class BrokenFixtureException(Exception):
     def __init__(self, fixture, testitem, trace):
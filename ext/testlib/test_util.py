@@ -51,11 +51,16 @@ class TestCase:
         TestCase.collector.collect(obj)
         return obj
 
-    def __init__(self, name=None, fixtures=tuple(), **kwargs):
+    def __init__(
+        self, name=None, fixtures=tuple(), cache_inputs=tuple(), **kwargs
+    ):
         self.fixtures = self.fixtures + list(fixtures)
         if name is None:
             name = self.__class__.__name__
         self.name = name
+        # Inputs of the test other than its fixtures (e.g., the config
+        # script it runs), used to key the result cache.
+        self.cache_inputs = list(cache_inputs)
 
 
 class TestFunction(TestCase):
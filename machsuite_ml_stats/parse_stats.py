@@ -48,6 +48,17 @@ METRIC_LIST = [
 
 GENERIC_REGEX = r"^{metric}\s+([\d\.Ee+-]+)"
 
+# Newer gem5 builds report the controller's per-action and per-arm stats
+# as vectors. Read those too, under the columns of the old names (for the
+# three-child config above, where OFF is action 3).
+PF = "system.l2cache.prefetcher."
+ALIASES = {PF + "actionUse_3": PF + "actionUse::OFF"}
+for i in range(3):
+    ALIASES[PF + f"actionUse_{i}"] = PF + f"actionUse::children{i}"
+    for stat in ("pfIssued", "pfUseful", "pfRedundant"):
+        ALIASES[PF + f"children{i}.{stat}"] = (
+            PF + f"arm{stat[0].upper()}{stat[1:]}::children{i}")
+
 files = sorted(glob.glob("stats_*_ml_prefetched.txt"))
 if not files:
     print("No stats_*_ml_prefetched.txt files found.")
@@ -70,10 +81,13 @@ for fname in files:
     # full-scan: keep the LAST match for each metric
     for line in lines:
         for metric in METRIC_LIST:
-            pattern = GENERIC_REGEX.replace("{metric}", re.escape(metric))
-            m = re.search(pattern, line)
-            if m:
-                row[metric] = m.group(1)  # overwrite previous values
+            for name in (metric, ALIASES.get(metric)):
+                if name is None:
+                    continue
+                pattern = GENERIC_REGEX.replace("{metric}", re.escape(name))
+                m = re.search(pattern, line)
+                if m:
+                    row[metric] = m.group(1)  # overwrite previous values
 
     rows.append(row)
 
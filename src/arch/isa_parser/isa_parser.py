@@ -37,7 +37,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import gzip
+import hashlib
+import io
 import os
+import pickle
 import re
 import sys
 import traceback
@@ -518,12 +522,38 @@ class InstObjParams:
 #
 
 
+# An output file of the parser. The contents are kept in memory and handed
+# to the parser when the file is closed, so that files can be written only
+# if they changed and the whole output can be cached.
+class OutputFile(io.StringIO):
+    def __init__(self, parser, name):
+        super().__init__()
+        self.parser = parser
+        self.name = name
+
+    def close(self):
+        if not self.closed:
+            self.parser.outputs[self.name] = self.getvalue()
+        super().close()
+
+
 class ISAParser(Grammar):
-    def __init__(self, output_dir, decoder_name="Decoder", verbose=False):
+    # Bump this when the format of the cached outputs changes.
+    cache_version = 1
+    # Most parses kept in the cache. The least recently used are removed.
+    cache_max_entries = 16
+
+    def __init__(
+        self, output_dir, decoder_name="Decoder", verbose=False, cache_dir=None
+    ):
         super().__init__()
         self.lex_kwargs["reflags"] = int(re.MULTILINE)
         self.output_dir = output_dir
         self.verbose = verbose
+        # If set, the outputs of a parse are stored here, keyed by a hash of
+        # everything that went into it, and reused by later parses of the
+        # same inputs.
+        self.cache_dir = cache_dir
         self.yacc_kwargs["debug"] = self.verbose
         self.yacc_kwargs["write_tables"] = False
 
@@ -547,6 +577,9 @@ class ISAParser(Grammar):
         self.files = {}
         self.splits = {}
 
+        # The contents of every output file, by name.
+        self.outputs = {}
+
         # isa_name / namespace identifier from namespace declaration.
         # before the namespace declaration, None.
         self.isa_name = None
@@ -1626,11 +1659,9 @@ StaticInstPtr
 
     def open(self, name, bare=False):
         """Open the output file for writing and include scary warning."""
-        filename = os.path.join(self.output_dir, name)
-        f = open(filename, "w")
-        if f:
-            if not bare:
-                f.write(ISAParser.scaremonger_template % self)
+        f = OutputFile(self, name)
+        if not bare:
+            f.write(ISAParser.scaremonger_template % self)
         return f
 
     def update(self, file, contents):
@@ -1640,6 +1671,109 @@ StaticInstPtr
         f.write(contents)
         f.close()
 
+    def write_outputs(self):
+        """Write the output files whose contents changed. Files that are
+        unchanged are left alone, so their timestamps don't change and
+        nothing that includes them is rebuilt."""
+        for name, contents in self.outputs.items():
+            filename = os.path.join(self.output_dir, name)
+            try:
+                with open(filename) as f:
+                    if f.read() == contents:
+                        continue
+            except OSError:
+                pass
+            with open(filename, "w") as f:
+                f.write(contents)
+
+    def cache_key(self, isa_desc_file, isa_desc):
+        """Hash everything the outputs of a parse depend on: the flattened
+        ISA description, the Python modules next to it (which let blocks may
+        import, e.g., microcode) and the parser itself."""
+        h = hashlib.sha256()
+
+        def add(data):
+            if isinstance(data, str):
+                data = data.encode()
+            h.update(len(data).to_bytes(8, "little"))
+            h.update(data)
+
+        def add_file(path):
+            add(path)
+            with open(path, "rb") as f:
+                add(f.read())
+
+        def py_files(top):
+            for root, dirs, files in os.walk(top):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".py"):
+                        yield os.path.join(root, name)
+
+        add(str(self.cache_version))
+        add(sys.version)
+        add(self.filename)
+        add(self.decoder_name)
+        add(isa_desc)
+
+        parser_dir = os.path.dirname(os.path.abspath(__file__))
+        for path in py_files(parser_dir):
+            add_file(path)
+        add_file(sys.modules[Grammar.__module__].__file__)
+        micro_asm = os.path.join(os.path.dirname(parser_dir), "micro_asm.py")
+        if os.path.exists(micro_asm):
+            add_file(micro_asm)
+
+        for path in py_files(os.path.dirname(os.path.abspath(isa_desc_file))):
+            add_file(path)
+
+        return h.hexdigest()
+
+    def load_cached(self, key):
+        path = os.path.join(self.cache_dir, key + ".pkl.gz")
+        try:
+            with gzip.open(path, "rb") as f:
+                self.outputs = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False
+        # Mark the entry as recently used, so pruning keeps it.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def store_cached(self, key):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, key + ".pkl.gz")
+        # Several builds may share the cache, so write to a private file and
+        # move it into place.
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp, "wb", compresslevel=1) as f:
+            pickle.dump(self.outputs, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self.prune_cache()
+
+    def prune_cache(self):
+        """Remove the least recently used entries beyond
+        cache_max_entries."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".pkl.gz"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    # Removed by a concurrent build.
+                    pass
+        entries.sort(reverse=True)
+        for _, path in entries[self.cache_max_entries :]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     # This regular expression matches '##include' directives
     includeRE = re.compile(
         r'^\s*##include\s+"(?P<filename>[^"]*)".*$', re.MULTILINE
@@ -1704,12 +1838,26 @@ StaticInstPtr
         # do this up front.
         isa_desc = self.read_and_flatten(isa_desc_file)
 
+        # If these exact inputs have been parsed before, just write out the
+        # files that parse produced.
+        key = None
+        if self.cache_dir:
+            key = self.cache_key(isa_desc_file, isa_desc)
+            if self.load_cached(key):
+                self.write_outputs()
+                ISAParser.AlreadyGenerated[isa_desc_file] = None
+                return
+
         # Initialize lineno tracker
         self.lex.lineno = LineTracker(isa_desc_file)
 
         # Parse.
         self.parse_string(isa_desc)
 
+        self.write_outputs()
+        if key:
+            self.store_cached(key)
+
         ISAParser.AlreadyGenerated[isa_desc_file] = None
 
     def parse_isa_desc(self, *args, **kwargs):
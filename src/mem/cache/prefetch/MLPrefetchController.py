@@ -1,6 +1,7 @@
 from m5.params import *
-from m5.SimObject import Parent
-from m5.objects import BasePrefetcher, QueuedPrefetcher, BaseCPU
+from m5.SimObject import Parent, SimObject
+from m5.objects import BasePrefetcher, QueuedPrefetcher, BaseCPU, MemCtrl
+from m5.objects import StridePrefetcher, PrefetchAwareRP
 
 class MLPrefetchController(QueuedPrefetcher):
     type = "MLPrefetchController"
@@ -12,6 +13,16 @@ class MLPrefetchController(QueuedPrefetcher):
         "List of child prefetchers managed by RL"
     )
 
+    # Optional parameterized Stride arms: one arm per (degree, distance)
+    # in the product of the two lists, all served by stride_child, so
+    # settings that only differ in aggressiveness share one PC table. The
+    # controller overrides the child's own degree and distance.
+    stride_child = Param.StridePrefetcher(NULL, "Stride prefetcher tuned "
+                                          "at run time (optional)")
+    stride_degrees = VectorParam.Int([], "Degrees of the stride arms")
+    stride_distances = VectorParam.Unsigned([], "Distances of the stride "
+                                            "arms")
+
     # Parent cache object name (string to avoid SimObject cycles)
     cache_name = Param.String("", "Name (path) of parent cache SimObject")
 
@@ -24,8 +35,95 @@ class MLPrefetchController(QueuedPrefetcher):
     # CPU pointer (needed for IPC-based reward)
     cpu = Param.BaseCPU("CPU pointer for IPC reward")
 
+    # Optional fast CPU that runs the warm-up phase before switching to
+    # `cpu`. IPC is read from whichever of the two is currently active.
+    warmup_cpu = Param.BaseCPU(NULL, "CPU active during warm-up (optional)")
+
+    # Optional prefetch-aware insertion: the cache's PrefetchAwareRP, and
+    # the demotion each arm inserts its prefetched blocks at.
+    insertion_policy = Param.PrefetchAwareRP(NULL, "Replacement policy "
+                                             "of the cache (optional)")
+    arm_prefetch_demotions = VectorParam.Unsigned([], "Prefetch demotion "
+                                                  "per arm (children, "
+                                                  "then stride grid)")
+
+    # Exploration RNG, private to this controller
+    seed = Param.UInt32(0, "Seed of the exploration RNG (0 = derive it "
+                        "from gem5's global seed and the controller name)")
+    reproducible = Param.Bool(False, "Do not load a saved Q-table, so a "
+                              "run only depends on its configuration, and "
+                              "save the learned one to the output directory")
+
     # Debug CSV logging
     debug_logging = Param.Bool(False, "Enable CSV logging for RL debugging")
 
     # NEW: persistent Q-table filename (optional)
     qtable_file = Param.String("", "Override Q-table filename (optional)")
+
+    # Optional state feature: working-set size, from SHARDS-style sampled
+    # reuse distances, binned against the cache capacity.
+    reuse_feature = Param.Bool(False, "Add a reuse-distance working-set "
+                               "bin to the RL state")
+    reuse_sample_rate = Param.Float(0.01, "Initial fraction of blocks "
+                                    "sampled for reuse distances")
+    reuse_max_samples = Param.Unsigned(4096, "Most blocks tracked by the "
+                                       "reuse sampler (bounds its cost)")
+    reuse_capacity = Param.MemorySize("0B", "Capacity working sets are "
+                                      "binned against (0 = cache size)")
+
+    # Optional set dueling: evaluate every arm each epoch on a few leader
+    # sets simulated in shadow tags. Costs (arms + 1) * shadow_leader_sets
+    # * ways tag entries, the arms being the children and the stride grid.
+    shadow_leader_sets = Param.Unsigned(0, "Leader sets per arm in the "
+                                        "shadow tags (0 = off)")
+    shadow_assoc = Param.Unsigned(0, "Ways per shadow set "
+                                  "(0 = cache associativity)")
+
+    # Optional memory bandwidth awareness: the queue occupancy of these
+    # memory controllers is sampled on every prefetch lookup.
+    mem_ctrls = VectorParam.MemCtrl([], "Memory controllers whose queue "
+                                    "occupancy is monitored (optional)")
+    bandwidth_feature = Param.Bool(False, "Add a memory queue occupancy "
+                                   "bin to the RL state (needs mem_ctrls)")
+    throttle_occupancy = Param.Float(0.8, "Mean queue occupancy over an "
+                                     "epoch that throttles prefetching in "
+                                     "the next one (above 1 = never)")
+    throttle_prefetches = Param.Unsigned(256, "Prefetches issued per "
+                                         "epoch while throttled")
+
+
+class MLPrefetchCoordinator(SimObject):
+    type = "MLPrefetchCoordinator"
+    cxx_class = "gem5::prefetch::MLPrefetchCoordinator"
+    cxx_header = "mem/cache/prefetch/ml_prefetch_coordinator.hh"
+
+    # Controllers of one cache hierarchy, e.g. on the L1D and the L2.
+    controllers = VectorParam.MLPrefetchController(
+        "Controllers, from the level closest to the CPU down"
+    )
+
+    joint_state = Param.Bool(True, "Add the other levels' miss rates and "
+                             "the inter-level prefetch overlap to each "
+                             "controller's state")
+    dedupe = Param.Bool(True, "Drop candidates an upper level has "
+                        "recently prefetched")
+    filter_entries = Param.Unsigned(4096, "Recent upper-level prefetches "
+                                    "remembered")
+    block_size = Param.Unsigned(Parent.cache_line_size, "Granularity "
+                                "prefetches are compared at")
+
+
+class MLPrefetchEpochManager(SimObject):
+    type = "MLPrefetchEpochManager"
+    cxx_class = "gem5::prefetch::MLPrefetchEpochManager"
+    cxx_header = "mem/cache/prefetch/ml_prefetch_epoch_manager.hh"
+
+    # Controllers whose epochs end together in one event, e.g. those of
+    # all per-core caches. Their own ticks_per_epoch is ignored.
+    controllers = VectorParam.MLPrefetchController(
+        "Controllers managed"
+    )
+
+    ticks_per_epoch = Param.Tick(1_000_000, "Epoch duration in ticks")
+    save_interval = Param.Unsigned(100, "Epochs between saving all "
+                                   "Q-tables (0 = only at exit)")
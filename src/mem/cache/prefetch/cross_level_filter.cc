@@ -0,0 +1,72 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#include "mem/cache/prefetch/cross_level_filter.hh"
+
+#include <algorithm>
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+CrossLevelFilter::CrossLevelFilter(size_t max_entries, unsigned blk_shift)
+    : maxEntries(std::max<size_t>(max_entries, 1)), blkShift(blk_shift)
+{
+    levels.reserve(maxEntries + 1);
+}
+
+void
+CrossLevelFilter::insert(Addr addr, int level)
+{
+    const Addr blk = addr >> blkShift;
+    auto it = levels.find(blk);
+    if (it != levels.end()) {
+        it->second = std::min(it->second, level);
+        return;
+    }
+
+    levels.emplace(blk, level);
+    order.push_back(blk);
+    if (order.size() > maxEntries) {
+        levels.erase(order.front());
+        order.pop_front();
+    }
+}
+
+bool
+CrossLevelFilter::coveredAbove(Addr addr, int level) const
+{
+    auto it = levels.find(addr >> blkShift);
+    return it != levels.end() && it->second < level;
+}
+
+} // namespace prefetch
+} // namespace gem5
@@ -0,0 +1,88 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#ifndef __MEM_CACHE_PREFETCH_CROSS_LEVEL_FILTER_HH__
+#define __MEM_CACHE_PREFETCH_CROSS_LEVEL_FILTER_HH__
+
+#include <cstddef>
+#include <deque>
+#include <unordered_map>
+
+#include "base/types.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+/**
+ * Recent prefetches of a cache hierarchy, remembered by the level that
+ * issued them (0 is closest to the CPU).
+ *
+ * A lower level does not need to prefetch a block an upper level has just
+ * prefetched: the upper level's request misses in the lower cache and
+ * fills it on the way. The filter answers whether that is the case for a
+ * candidate.
+ *
+ * At most max_entries blocks are remembered. The oldest one is forgotten
+ * first.
+ */
+class CrossLevelFilter
+{
+  public:
+    /**
+     * @param max_entries Most blocks remembered at once.
+     * @param blk_shift log2 of the granularity blocks are compared at.
+     */
+    CrossLevelFilter(size_t max_entries, unsigned blk_shift);
+
+    /** Remember that level prefetched the block holding addr. */
+    void insert(Addr addr, int level);
+
+    /** Whether a level above the given one recently prefetched addr. */
+    bool coveredAbove(Addr addr, int level) const;
+
+    /** Number of blocks currently remembered. */
+    size_t size() const { return levels.size(); }
+
+  private:
+    const size_t maxEntries;
+    const unsigned blkShift;
+
+    /** Uppermost level that prefetched each remembered block. */
+    std::unordered_map<Addr, int> levels;
+    /** Remembered blocks, oldest first. */
+    std::deque<Addr> order;
+};
+
+} // namespace prefetch
+} // namespace gem5
+
+#endif // __MEM_CACHE_PREFETCH_CROSS_LEVEL_FILTER_HH__
@@ -0,0 +1,88 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#include <gtest/gtest.h>
+
+#include "mem/cache/prefetch/cross_level_filter.hh"
+
+using namespace gem5;
+
+/** Only prefetches of upper levels cover a block. */
+TEST(CrossLevelFilterTest, CoveredAbove)
+{
+    prefetch::CrossLevelFilter filter(16, 6);
+
+    filter.insert(0x1000, 0);
+    filter.insert(0x2000, 1);
+
+    ASSERT_FALSE(filter.coveredAbove(0x1000, 0));
+    ASSERT_TRUE(filter.coveredAbove(0x1000, 1));
+    ASSERT_TRUE(filter.coveredAbove(0x1000, 2));
+    ASSERT_FALSE(filter.coveredAbove(0x2000, 1));
+    ASSERT_TRUE(filter.coveredAbove(0x2000, 2));
+    ASSERT_FALSE(filter.coveredAbove(0x3000, 1));
+}
+
+/** Blocks are compared at the filter's granularity. */
+TEST(CrossLevelFilterTest, BlockGranularity)
+{
+    prefetch::CrossLevelFilter filter(16, 6);
+
+    filter.insert(0x1008, 0);
+    ASSERT_TRUE(filter.coveredAbove(0x1000, 1));
+    ASSERT_TRUE(filter.coveredAbove(0x103f, 1));
+    ASSERT_FALSE(filter.coveredAbove(0x1040, 1));
+}
+
+/** A block keeps the uppermost level that prefetched it. */
+TEST(CrossLevelFilterTest, UppermostLevel)
+{
+    prefetch::CrossLevelFilter filter(16, 6);
+
+    filter.insert(0x1000, 1);
+    filter.insert(0x1000, 0);
+    filter.insert(0x1000, 2);
+    ASSERT_TRUE(filter.coveredAbove(0x1000, 1));
+    ASSERT_EQ(filter.size(), 1);
+}
+
+/** The oldest blocks are forgotten first. */
+TEST(CrossLevelFilterTest, Bounded)
+{
+    const size_t max_entries = 8;
+    prefetch::CrossLevelFilter filter(max_entries, 6);
+
+    for (Addr blk = 0; blk < 100; blk++) {
+        filter.insert(blk << 6, 0);
+        ASSERT_LE(filter.size(), max_entries);
+    }
+    ASSERT_FALSE(filter.coveredAbove(91 << 6, 1));
+    for (Addr blk = 92; blk < 100; blk++)
+        ASSERT_TRUE(filter.coveredAbove(blk << 6, 1));
+}
@@ -4,13 +4,20 @@
 #include <cmath>
 #include <cstdlib>
 #include <fstream>
+#include <random>
 #include <sstream>
 #include <iomanip>
 #include <cctype>
 
+#include "base/output.hh"
 #include "cpu/base.hh"
 #include "debug/MLPrefetcher.hh"
 #include "mem/cache/base.hh"
+#include "mem/cache/prefetch/ml_prefetch_coordinator.hh"
+#include "mem/cache/prefetch/stride.hh"
+#include "mem/cache/replacement_policies/prefetch_aware_rp.hh"
+#include "mem/mem_ctrl.hh"
+#include "params/BaseCache.hh"
 #include "sim/cur_tick.hh"
 #include "sim/sim_object.hh"
 
@@ -34,6 +41,21 @@ static constexpr double EXPLORE_DECAY  = 0.9995;
 // Max span for normalized accuracy based on miss-rate improvement.
 static constexpr double ACC_MAX_SPAN = 0.2; // 20 percentage points of miss-rate
 
+// Leader-set accesses an arm needs in an epoch for a shadow update.
+static constexpr uint64_t SHADOW_MIN_ACCESSES = 32;
+
+// FNV-1a, to derive per-instance seeds that are the same on every host.
+uint32_t
+nameHash(const std::string &name)
+{
+    uint32_t h = 2166136261u;
+    for (unsigned char c : name) {
+        h ^= c;
+        h *= 16777619u;
+    }
+    return h;
+}
+
 } // anonymous namespace
 
 namespace gem5
@@ -48,25 +70,72 @@ MLPrefetchController::MLPrefetchController(const Params &p)
       children(p.children.begin(), p.children.end()),
       currentAction(p.current_action),
       numActions(p.children.size() + 1),       // +1 for OFF bandit index
+      strideChild(p.stride_child),
       epoch_ticks(p.ticks_per_epoch),
       update_event([this]{ updateModel(); }, name() + ".update_event"),
+      rngSeed(p.seed ? p.seed :
+              (uint32_t)Random::globalSeed ^ nameHash(name())),
+      rng(Random::genRandom(rngSeed)),
+      reproducible(p.reproducible),
       learningRate(p.learning_rate),
       exploreRate(p.explore_rate),
       debugLogging(p.debug_logging),
       cpuPtr(p.cpu),
+      warmupCpuPtr(p.warmup_cpu),
       lastTotalOps(0),
       lastIpc(0.0),
-      lastIpcTick(curTick())
+      lastIpcTick(curTick()),
+      memCtrls(p.mem_ctrls.begin(), p.mem_ctrls.end()),
+      bandwidthFeature(p.bandwidth_feature),
+      throttleOccupancy(p.throttle_occupancy),
+      throttlePrefetches(p.throttle_prefetches),
+      shadowLeaderSets(p.shadow_leader_sets),
+      shadowAssoc(p.shadow_assoc),
+      insertionPolicy(p.insertion_policy),
+      armDemotions(p.arm_prefetch_demotions.begin(),
+                   p.arm_prefetch_demotions.end())
 {
+    if (strideChild) {
+        if (p.stride_degrees.empty() || p.stride_distances.empty()) {
+            fatal("MLPrefetchController '%s': stride_child needs "
+                  "stride_degrees and stride_distances\n", name());
+        }
+        strideMinDistance = *std::min_element(p.stride_distances.begin(),
+                                              p.stride_distances.end());
+        int reach = 0;
+        for (int degree : p.stride_degrees) {
+            if (degree < 1) {
+                fatal("MLPrefetchController '%s': stride degree %d is not "
+                      "positive\n", name(), degree);
+            }
+            for (int distance : p.stride_distances) {
+                strideGrid.push_back({degree, distance});
+                reach = std::max(reach, distance + degree);
+            }
+        }
+        numActions += strideGrid.size();
+
+        // Generate the candidates of every setting in one lookup.
+        strideChild->setAggressiveness(reach - strideMinDistance,
+                                       strideMinDistance);
+    } else if (!p.stride_degrees.empty() || !p.stride_distances.empty()) {
+        warn("MLPrefetchController '%s': stride grid ignored without "
+             "stride_child\n", name());
+    }
+
     if (currentAction < -1 ||
-        currentAction >= (int)children.size()) {
+        currentAction >= numArms()) {
         warn("MLPrefetchController '%s': initial action %d invalid, "
              "resetting to 0\n", name(), currentAction);
         currentAction = 0;
     }
+    // The first epoch runs the initial action, so the first update is
+    // about it; OFF is the last bandit index.
+    lastAction = currentAction == -1 ? numActions - 1 : currentAction;
 
-    if (cpuPtr)
-        lastTotalOps = cpuPtr->totalOps();
+    ipcCpu = activeCpu();
+    if (ipcCpu)
+        lastTotalOps = ipcCpu->totalOps();
     else
         warn("MLPrefetchController '%s': CPU pointer null; IPC reward disabled\n",
              name());
@@ -80,6 +149,21 @@ MLPrefetchController::MLPrefetchController(const Params &p)
     if (numActions >= 3)
         actionPenalties[2] = 0.03; // a bit more for 3rd, etc.
 
+    // Stride grid settings: scale with reach (distance + degree).
+    if (!strideGrid.empty()) {
+        auto reach = [](const StrideSetting &s)
+                     { return s.distance + s.degree; };
+        int lo = reach(strideGrid.front()), hi = lo;
+        for (const auto &s : strideGrid) {
+            lo = std::min(lo, reach(s));
+            hi = std::max(hi, reach(s));
+        }
+        for (size_t g = 0; g < strideGrid.size(); ++g) {
+            actionPenalties[children.size() + g] = hi > lo ?
+                0.03 * (reach(strideGrid[g]) - lo) / (hi - lo) : 0.0;
+        }
+    }
+
     // CSV init (once)
     if (debugLogging && !gCsvInitialized) {
         gCsvInitialized = true;
@@ -102,13 +186,54 @@ MLPrefetchController::MLPrefetchController(const Params &p)
             ch = '_';
     }
     qfileName = "qtable_" + safeName + ".bin";
+    // A reproducible run neither reads the shared table nor overwrites it,
+    // and parallel runs with their own output directories do not race.
+    qfileSaveName = reproducible ? simout.resolve(qfileName) : qfileName;
+
+    if (insertionPolicy && armDemotions.size() != (size_t)numArms()) {
+        fatal("MLPrefetchController '%s': arm_prefetch_demotions has %d "
+              "entries for %d arms\n", name(), armDemotions.size(),
+              numArms());
+    }
+
+    if (bandwidthFeature && memCtrls.empty()) {
+        fatal("MLPrefetchController '%s': bandwidth_feature needs "
+              "mem_ctrls\n", name());
+    }
+
+    if (p.reuse_feature) {
+        reuseSampler = std::make_unique<ReuseDistanceSampler>(
+            p.reuse_sample_rate, p.reuse_max_samples);
+        reuseCapacity = p.reuse_capacity; // bytes until startup()
+    }
+}
+
+void
+MLPrefetchController::regProbeListeners()
+{
+    Queued::regProbeListeners();
+
+    // The reuse sampler and the shadow tags need every access, not only
+    // the ones this prefetcher is configured to observe.
+    if ((reuseSampler || shadowLeaderSets > 0) && probeManager) {
+        accessListeners.push_back(
+            probeManager->connect<AccessListener>(*this, "Hit"));
+        accessListeners.push_back(
+            probeManager->connect<AccessListener>(*this, "Miss"));
+    }
 }
 
 void
 MLPrefetchController::startup()
 {
     // Load previously saved Q-table if available & compatible
-    loadQTable();
+    if (reproducible) {
+        inform("MLPrefetchController '%s': reproducible run, seed %u; "
+               "saved Q-table not loaded, saving to %s\n", name(), rngSeed,
+               qfileSaveName);
+    } else {
+        loadQTable();
+    }
 
     // Resolve BaseCache pointer from cacheName string param.
     if (!cacheName.empty()) {
@@ -120,15 +245,49 @@ MLPrefetchController::startup()
                  "BaseCache; miss-based state disabled.\n",
                  name(), cacheName.c_str());
         } else {
-            lastAccesses = cachePtr->getRuntimeAccesses();
-            lastMisses   = cachePtr->getRuntimeMisses();
+            lastAccesses = snapAccesses = cachePtr->getRuntimeAccesses();
+            lastMisses   = snapMisses   = cachePtr->getRuntimeMisses();
         }
     } else {
         warn("MLPrefetchController '%s': cache_name not set; "
              "miss-based state disabled.\n", name());
     }
 
-    schedule(update_event, curTick() + epoch_ticks);
+    if (reuseSampler && reuseCapacity == 0) {
+        if (cachePtr) {
+            auto &cp = dynamic_cast<const BaseCacheParams &>(
+                cachePtr->params());
+            reuseCapacity = cp.size;
+        } else {
+            warn("MLPrefetchController '%s': no cache size to compare "
+                 "working sets with; reuse feature disabled.\n", name());
+            reuseSampler.reset();
+        }
+    }
+    // The block size is only final once the parent cache has set it.
+    reuseCapacity /= blkSize;
+
+    if (shadowLeaderSets > 0) {
+        if (cachePtr) {
+            auto &cp = dynamic_cast<const BaseCacheParams &>(
+                cachePtr->params());
+            unsigned assoc = shadowAssoc ? shadowAssoc : cp.assoc;
+            shadowTags = std::make_unique<ArmShadowTags>(
+                numActions, cp.size / (blkSize * cp.assoc), assoc,
+                shadowLeaderSets, lBlkSize);
+            inform("MLPrefetchController '%s': %zu shadow tag entries for "
+                   "%d arms\n", name(), shadowTags->size(), numActions);
+        } else {
+            warn("MLPrefetchController '%s': no cache geometry for the "
+                 "shadow tags; set dueling disabled.\n", name());
+        }
+    }
+
+    // Apply the initial arm's insertion priority.
+    switchTo(currentAction);
+
+    if (!epochManager)
+        schedule(update_event, curTick() + epoch_ticks);
 }
 
 void
@@ -137,61 +296,47 @@ MLPrefetchController::regStats()
     // IMPORTANT: register all base/parent stats FIRST
     Queued::regStats();
 
-    // RL action usage (bandit index 0..3; 3 usually OFF)
-    actionUse0
-        .name(csprintf("%s.actionUse_0", name()))
-        .desc("Number of epochs where RL selected bandit index 0");
-    actionUse1
-        .name(csprintf("%s.actionUse_1", name()))
-        .desc("Number of epochs where RL selected bandit index 1");
-    actionUse2
-        .name(csprintf("%s.actionUse_2", name()))
-        .desc("Number of epochs where RL selected bandit index 2");
-    actionUse3
-        .name(csprintf("%s.actionUse_3", name()))
-        .desc("Number of epochs where RL selected bandit index 3 (OFF)");
-
-    // Per-child issued
-    child0PfIssued
-        .name(csprintf("%s.children0.pfIssued", name()))
-        .desc("Prefetches issued (attributed) to child 0");
-    child1PfIssued
-        .name(csprintf("%s.children1.pfIssued", name()))
-        .desc("Prefetches issued (attributed) to child 1");
-    child2PfIssued
-        .name(csprintf("%s.children2.pfIssued", name()))
-        .desc("Prefetches issued (attributed) to child 2");
-    child3PfIssued
-        .name(csprintf("%s.children3.pfIssued", name()))
-        .desc("Prefetches issued (attributed) to child 3");
-
-    // Per-child useful
-    child0PfUseful
-        .name(csprintf("%s.children0.pfUseful", name()))
-        .desc("Useful prefetches (demand hit prefetched line) for child 0");
-    child1PfUseful
-        .name(csprintf("%s.children1.pfUseful", name()))
-        .desc("Useful prefetches (demand hit prefetched line) for child 1");
-    child2PfUseful
-        .name(csprintf("%s.children2.pfUseful", name()))
-        .desc("Useful prefetches (demand hit prefetched line) for child 2");
-    child3PfUseful
-        .name(csprintf("%s.children3.pfUseful", name()))
-        .desc("Useful prefetches (demand hit prefetched line) for child 3");
-
-    // Per-child redundant
-    child0PfRedundant
-        .name(csprintf("%s.children0.pfRedundant", name()))
-        .desc("Redundant prefetch candidates (already tracked) for child 0");
-    child1PfRedundant
-        .name(csprintf("%s.children1.pfRedundant", name()))
-        .desc("Redundant prefetch candidates (already tracked) for child 1");
-    child2PfRedundant
-        .name(csprintf("%s.children2.pfRedundant", name()))
-        .desc("Redundant prefetch candidates (already tracked) for child 2");
-    child3PfRedundant
-        .name(csprintf("%s.children3.pfRedundant", name()))
-        .desc("Redundant prefetch candidates (already tracked) for child 3");
+    // RL action usage, per bandit index
+    actionUse
+        .init(numActions)
+        .name(csprintf("%s.actionUse", name()))
+        .desc("Number of epochs where RL selected each action");
+
+    // Per-arm issued, useful and redundant prefetches
+    armPfIssued
+        .init(numArms())
+        .name(csprintf("%s.armPfIssued", name()))
+        .desc("Prefetches issued (attributed) to each arm");
+    armPfUseful
+        .init(numArms())
+        .name(csprintf("%s.armPfUseful", name()))
+        .desc("Useful prefetches (demand hit prefetched line) per arm");
+    armPfRedundant
+        .init(numArms())
+        .name(csprintf("%s.armPfRedundant", name()))
+        .desc("Redundant prefetch candidates (already tracked) per arm");
+
+    for (int arm = 0; arm < numArms(); ++arm) {
+        const std::string sub = armStatName(arm);
+        actionUse.subname(arm, sub);
+        armPfIssued.subname(arm, sub);
+        armPfUseful.subname(arm, sub);
+        armPfRedundant.subname(arm, sub);
+    }
+    actionUse.subname(numActions - 1, "OFF");
+
+    seedStat
+        .scalar(rngSeed)
+        .name(csprintf("%s.rngSeed", name()))
+        .desc("Seed of the exploration RNG");
+
+    // Bandwidth throttling
+    pfThrottled
+        .name(csprintf("%s.pfThrottled", name()))
+        .desc("Prefetch candidates dropped by the bandwidth throttle");
+    throttledEpochs
+        .name(csprintf("%s.throttledEpochs", name()))
+        .desc("Epochs with prefetches capped by memory queue occupancy");
 }
 
 void
@@ -203,7 +348,7 @@ MLPrefetchController::notify(const CacheAccessProbeArg &acc,
         epochMisses++;
 
     if (!pfi.isCacheMiss()) {
-        Addr a = pfi.getAddr();
+        Addr a = blockAddress(pfi.getAddr());
         trackUsefulForAddr(a);
     }
 
@@ -222,6 +367,11 @@ MLPrefetchController::calculatePrefetch(
     // If we're OFF, we still want children to *train*, but we don't issue.
     const int active = currentAction;
 
+    if (!memCtrls.empty()) {
+        occupancySum += sampleOccupancy();
+        occupancySamples++;
+    }
+
     for (int i = 0; i < (int)children.size(); ++i) {
         auto *child = dynamic_cast<Queued*>(children[i]);
         if (!child)
@@ -230,20 +380,67 @@ MLPrefetchController::calculatePrefetch(
         std::vector<AddrPriority> tmp;
         child->calculatePrefetch(pfi, tmp, cache);
 
+        // Every child fills its own leader sets in the shadow tags.
+        if (shadowTags) {
+            for (const auto &ap : tmp)
+                shadowTags->prefetch(i, blockAddress(ap.first));
+        }
+
         // DEBUG: see if children are actually generating candidates
         DPRINTF(MLPrefetcher, "CHILD %d GENERATED %zu candidates\n",
                 i, tmp.size());
 
         // Only the RL-selected child actually issues prefetches
         if (i == active) {
-            for (const auto &ap : tmp) {
-                addresses.push_back(ap);
-                trackIssuedForChild(i, ap.first);
-            }
+            for (const auto &ap : tmp)
+                issueForArm(i, ap, addresses);
         }
         // For i != active: tmp is purely for training (Stride/Tagged update
         // internal tables), then we discard the candidates.
     }
+
+    if (strideChild) {
+        std::vector<AddrPriority> tmp;
+        strideChild->calculatePrefetch(pfi, tmp, cache);
+
+        // tmp holds the candidates of the largest reach, nearest first.
+        // A setting skips (distance - strideMinDistance) of them and
+        // takes the next degree ones.
+        for (size_t g = 0; g < strideGrid.size(); ++g) {
+            const int arm = children.size() + g;
+            const size_t first = std::min<size_t>(
+                strideGrid[g].distance - strideMinDistance, tmp.size());
+            const size_t last = std::min<size_t>(
+                first + strideGrid[g].degree, tmp.size());
+
+            if (shadowTags) {
+                for (size_t k = first; k < last; ++k)
+                    shadowTags->prefetch(arm, blockAddress(tmp[k].first));
+            }
+            if (arm == active) {
+                for (size_t k = first; k < last; ++k)
+                    issueForArm(arm, tmp[k], addresses);
+            }
+        }
+    }
+}
+
+void
+MLPrefetchController::issueForArm(int arm, const AddrPriority &ap,
+                                  std::vector<AddrPriority> &addresses)
+{
+    const Addr blk = blockAddress(ap.first);
+    if (coordinator && coordinator->filter(hierarchyLevel, blk))
+        return;
+    if (throttled && epochIssued >= throttlePrefetches) {
+        pfThrottled++;
+        return;
+    }
+    addresses.push_back(ap);
+    trackIssuedForChild(arm, blk);
+    epochIssued++;
+    if (coordinator)
+        coordinator->issued(hierarchyLevel, blk);
 }
 
 // ---- Discretization helpers ------------------------------------------------
@@ -277,6 +474,104 @@ MLPrefetchController::encodeAccuracy(double a) const
     return 2;                  // high
 }
 
+int
+MLPrefetchController::encodeWorkingSet()
+{
+    // Bin of the median reuse distance: 0 = fits in half the cache,
+    // 1 = around the cache size, 2 = well beyond it (streaming).
+    uint64_t total = reuseNear + reuseMid + reuseFar;
+    if (total > 0) {
+        if (2 * reuseNear >= total)
+            wsBin = 0;
+        else if (2 * (reuseNear + reuseMid) >= total)
+            wsBin = 1;
+        else
+            wsBin = 2;
+    }
+    // With no sampled access this epoch, keep the last bin.
+
+    reuseNear = reuseMid = reuseFar = 0;
+    return wsBin;
+}
+
+int
+MLPrefetchController::encodeOccupancy(double o) const
+{
+    // o is the mean occupancy of the busiest memory queue, in [0,1]
+    if (o < 0.25) return 0;    // idle
+    if (o < 0.60) return 1;    // loaded
+    return 2;                  // saturated
+}
+
+double
+MLPrefetchController::sampleOccupancy() const
+{
+    double o = 0.0;
+    for (auto *ctrl : memCtrls) {
+        o = std::max({o, ctrl->readQueueOccupancy(),
+                      ctrl->writeQueueOccupancy()});
+    }
+    return o;
+}
+
+void
+MLPrefetchController::observeAccess(const CacheAccessProbeArg &acc)
+{
+    const PacketPtr pkt = acc.pkt;
+    if (pkt->isEviction() || pkt->req->isCacheMaintenance())
+        return;
+
+    const Addr blk = blockAddress(pkt->getAddr());
+
+    if (shadowTags)
+        shadowTags->access(blk);
+
+    uint64_t distance;
+    if (!reuseSampler || !reuseSampler->access(blk, distance))
+        return;
+
+    if (distance == ReuseDistanceSampler::Cold)
+        reuseFar++;
+    else if (2 * distance <= reuseCapacity)
+        reuseNear++;
+    else if (distance <= 2 * reuseCapacity)
+        reuseMid++;
+    else
+        reuseFar++;
+}
+
+void
+MLPrefetchController::updateFromShadow(double reward)
+{
+    // Estimate the reward each arm that did not run would have earned:
+    // the reward of the arm that ran, corrected by the difference in hit
+    // rate over their leader sets (weighted like the accuracy term) and
+    // by their action penalties.
+    const auto &ran = shadowTags->score(lastAction);
+    if (ran.accesses >= SHADOW_MIN_ACCESSES) {
+        auto &row = qTable[lastState];
+        for (int a = 0; a < numActions; ++a) {
+            const auto &score = shadowTags->score(a);
+            if (a == lastAction || score.accesses < SHADOW_MIN_ACCESSES)
+                continue;
+
+            double diff = (score.hitRate() - ran.hitRate()) / ACC_MAX_SPAN;
+            diff = std::clamp(diff, -1.0, 1.0);
+            double estimate = reward + 0.5 * diff
+                            + actionPenalties[lastAction]
+                            - actionPenalties[a];
+
+            row[a] += learningRate * (estimate - row[a]);
+
+            DPRINTF(MLPrefetcher, "SHADOW arm %d hit rate %.3f (ran %d: "
+                    "%.3f), reward estimate %.3f\n", a, score.hitRate(),
+                    lastAction, ran.hitRate(), estimate);
+        }
+    }
+
+    shadowTags->resetScores();
+}
+
 // ---- RL core ----------------------------------------------------------------
 
 int
@@ -287,9 +582,9 @@ MLPrefetchController::selectAction(uint64_t state)
         row.resize(numActions, 0.0);
 
     // ε-greedy
-    double r = (double)random() / (double)RAND_MAX;
+    double r = std::uniform_real_distribution<double>(0.0, 1.0)(rng->gen);
     if (r < exploreRate) {
-        int i = random() % numActions;
+        int i = rng->random<int>(0, numActions - 1);
         return i;  // bandit index (0..numActions-1)
     }
 
@@ -304,6 +599,14 @@ MLPrefetchController::selectAction(uint64_t state)
     return bestIdx;
 }
 
+BaseCPU *
+MLPrefetchController::activeCpu() const
+{
+    if (warmupCpuPtr && !warmupCpuPtr->switchedOut())
+        return warmupCpuPtr;
+    return cpuPtr;
+}
+
 void
 MLPrefetchController::endEpoch()
 {
@@ -313,14 +616,11 @@ MLPrefetchController::endEpoch()
     double missRate = 0.0;
 
     if (cachePtr) {
-        uint64_t totalAccesses = cachePtr->getRuntimeAccesses();
-        uint64_t totalMissesC  = cachePtr->getRuntimeMisses();
-
-        uint64_t dAcc = totalAccesses - lastAccesses;
-        uint64_t dMis = totalMissesC  - lastMisses;
+        uint64_t dAcc = snapAccesses - lastAccesses;
+        uint64_t dMis = snapMisses   - lastMisses;
 
-        lastAccesses = totalAccesses;
-        lastMisses   = totalMissesC;
+        lastAccesses = snapAccesses;
+        lastMisses   = snapMisses;
 
         missRate = (dAcc > 0) ? (double)dMis / (double)dAcc : 0.0;
     }
@@ -331,14 +631,25 @@ MLPrefetchController::endEpoch()
     double newIpc = lastIpc;
     double ipcDelta = 0.0;
 
-    if (cpuPtr) {
-        uint64_t nowOps = cpuPtr->totalOps();
+    BaseCPU *cpu = activeCpu();
+
+    if (cpu && cpu != ipcCpu) {
+        // The warm-up CPU was switched out since the last epoch. Restart
+        // the op-count baseline on the new CPU so the switch itself does
+        // not show up as an IPC change.
+        ipcCpu       = cpu;
+        lastTotalOps = cpu->totalOps();
+        lastIpcTick  = curTick();
+        ipcRebased   = true;
+    } else if (cpu) {
+        uint64_t nowOps = cpu->totalOps();
         Tick now = curTick();
         Tick dt  = now - lastIpcTick;
 
         if (dt > 0) {
             newIpc = (double)(nowOps - lastTotalOps) / (double)dt;
-            ipcDelta = newIpc - lastIpc;
+            ipcDelta = ipcRebased ? 0.0 : newIpc - lastIpc;
+            ipcRebased = false;
         }
 
         lastTotalOps = nowOps;
@@ -375,6 +686,20 @@ MLPrefetchController::endEpoch()
     lastMissRate = missRate;
     lastIpc      = newIpc;
 
+    // Memory queue occupancy over the epoch. With no prefetch lookup
+    // this epoch, use the occupancy right now.
+    if (!memCtrls.empty()) {
+        memOccupancy = occupancySamples > 0 ?
+            occupancySum / occupancySamples : sampleOccupancy();
+        occupancySum = 0.0;
+        occupancySamples = 0;
+
+        throttled = memOccupancy >= throttleOccupancy;
+        if (throttled)
+            throttledEpochs++;
+        epochIssued = 0;
+    }
+
     // ------------------------
     // 4. Build discrete state from Δmiss, ΔIPC, accuracy.
     // ------------------------
@@ -383,6 +708,15 @@ MLPrefetchController::endEpoch()
     int accBin  = encodeAccuracy(accuracy);
 
     uint64_t state = (uint64_t)(accBin * 100 + missBin * 10 + ipcBin);
+    if (reuseSampler)
+        state += (uint64_t)encodeWorkingSet() * 1000;
+    if (bandwidthFeature)
+        state += (uint64_t)encodeOccupancy(memOccupancy) * 10000;
+    if (coordinator) {
+        coordinator->reportEpoch(hierarchyLevel, missRate);
+        if (coordinator->sharesState())
+            state += coordinator->state(hierarchyLevel) * 100000;
+    }
 
     // ------------------------
     // 5. Reward shaping: IPC sign + accuracy - action penalty.
@@ -413,13 +747,16 @@ MLPrefetchController::endEpoch()
         row[lastAction] = oldVal + learningRate * (reward - oldVal);
     }
 
+    if (shadowTags)
+        updateFromShadow(reward);
+
     // ------------------------
     // 7. Select next action (ε-greedy with decaying ε).
     // ------------------------
     int nextBanditIdx = selectAction(state);
 
     // Map bandit index to semantic action:
-    // 0..children.size()-1 → that child
+    // 0..numArms()-1 → that arm
     // last index (numActions-1) → OFF (-1)
     int nextAction;
     if (nextBanditIdx == numActions - 1)
@@ -428,13 +765,7 @@ MLPrefetchController::endEpoch()
         nextAction = nextBanditIdx;
 
     // Track action usage stats (bandit indices)
-    switch (nextBanditIdx) {
-      case 0: actionUse0++; break;
-      case 1: actionUse1++; break;
-      case 2: actionUse2++; break;
-      case 3: actionUse3++; break;
-      default: break;
-    }
+    actionUse[nextBanditIdx]++;
 
     // Decay exploration rate.
     exploreRate = std::max(EXPLORE_MIN, exploreRate * EXPLORE_DECAY);
@@ -471,9 +802,19 @@ MLPrefetchController::endEpoch()
     epochMisses   = 0;
 }
 
+void
+MLPrefetchController::snapshotCounters()
+{
+    if (cachePtr) {
+        snapAccesses = cachePtr->getRuntimeAccesses();
+        snapMisses   = cachePtr->getRuntimeMisses();
+    }
+}
+
 void
 MLPrefetchController::updateModel()
 {
+    snapshotCounters();
     endEpoch();
 
     // Persist Q-table every epoch (you can make this periodic if desired)
@@ -485,8 +826,12 @@ MLPrefetchController::updateModel()
 void
 MLPrefetchController::switchTo(int index)
 {
-    // index is semantic: -1 = OFF, >=0 = child index.
+    // index is semantic: -1 = OFF, >=0 = arm index.
     currentAction = index;
+
+    // OFF issues nothing, so the last demotion can stay.
+    if (insertionPolicy && index >= 0)
+        insertionPolicy->setPrefetchDemotion(armDemotions[index]);
 }
 
 // ---- Per-child tracking helpers -------------------------------------------
@@ -504,13 +849,7 @@ MLPrefetchController::trackIssuedForChild(int childIndex, Addr addr)
     auto it = childPfTable.find(addr);
     if (it != childPfTable.end()) {
         // Redundant prefetch candidate: already tracked.
-        switch (childIndex) {
-          case 0: child0PfRedundant++; break;
-          case 1: child1PfRedundant++; break;
-          case 2: child2PfRedundant++; break;
-          case 3: child3PfRedundant++; break;
-          default: break;
-        }
+        armPfRedundant[childIndex]++;
         // Overwrite with newest metadata.
         it->second.actionIndex = childIndex;
         it->second.issueTick   = curTick();
@@ -520,14 +859,8 @@ MLPrefetchController::trackIssuedForChild(int childIndex, Addr addr)
         meta.issueTick   = curTick();
         childPfTable.emplace(addr, meta);
 
-        // Count as an issued prefetch attributed to this child.
-        switch (childIndex) {
-          case 0: child0PfIssued++; break;
-          case 1: child1PfIssued++; break;
-          case 2: child2PfIssued++; break;
-          case 3: child3PfIssued++; break;
-          default: break;
-        }
+        // Count as an issued prefetch attributed to this arm.
+        armPfIssued[childIndex]++;
     }
 }
 
@@ -540,26 +873,95 @@ MLPrefetchController::trackUsefulForAddr(Addr addr)
 
     int childIndex = it->second.actionIndex;
 
-    switch (childIndex) {
-      case 0: child0PfUseful++; break;
-      case 1: child1PfUseful++; break;
-      case 2: child2PfUseful++; break;
-      case 3: child3PfUseful++; break;
-      default: break;
-    }
+    armPfUseful[childIndex]++;
+
+    lastUsefulAddr  = addr;
+    lastUsefulChild = childIndex;
 
     // Remove so we don't double-count usefulness.
     childPfTable.erase(it);
 }
 
+int
+MLPrefetchController::issuingChild(Addr addr) const
+{
+    Addr blk = blockAddress(addr);
+    auto it = childPfTable.find(blk);
+    if (it != childPfTable.end())
+        return it->second.actionIndex;
+    return blk == lastUsefulAddr ? lastUsefulChild : -1;
+}
+
+void
+MLPrefetchController::setCoordinator(MLPrefetchCoordinator *coord,
+                                     int level)
+{
+    fatal_if(coordinator, "MLPrefetchController '%s' is coordinated twice",
+             name());
+    coordinator = coord;
+    hierarchyLevel = level;
+}
+
+void
+MLPrefetchController::setEpochManager(MLPrefetchEpochManager *manager)
+{
+    fatal_if(epochManager, "MLPrefetchController '%s' has two epoch "
+             "managers", name());
+    epochManager = manager;
+}
+
+std::string
+MLPrefetchController::armName(int arm) const
+{
+    if (arm < (int)children.size())
+        return children[arm]->name();
+    const auto &s = strideGrid[arm - children.size()];
+    return csprintf("%s(degree=%d,distance=%d)", strideChild->name(),
+                    s.degree, s.distance);
+}
+
+std::string
+MLPrefetchController::armStatName(int arm) const
+{
+    // Drop this controller's path, e.g. "children0", and turn anything
+    // that is not a name character into '_'.
+    std::string full = armName(arm);
+    const std::string prefix = name() + ".";
+    if (full.compare(0, prefix.size(), prefix) == 0)
+        full = full.substr(prefix.size());
+
+    std::string sub;
+    for (char ch : full) {
+        if (std::isalnum(static_cast<unsigned char>(ch)))
+            sub += ch;
+        else if (!sub.empty() && sub.back() != '_')
+            sub += '_';
+    }
+    while (!sub.empty() && sub.back() == '_')
+        sub.pop_back();
+    return sub;
+}
+
 // ---- Q-table persistence + children signature -----------------------------
 
 std::string
 MLPrefetchController::childrenSignature() const
 {
     std::ostringstream oss;
-    for (auto *c : children) {
-        oss << c->name() << ";";
+    for (int arm = 0; arm < numArms(); ++arm) {
+        oss << armName(arm) << ";";
+    }
+    // The reuse, bandwidth and joint features change the state space.
+    if (reuseSampler)
+        oss << "reuse;";
+    if (bandwidthFeature)
+        oss << "bandwidth;";
+    if (coordinator && coordinator->sharesState())
+        oss << "joint" << coordinator->numLevels() << ";";
+    // Arms inserting at different priorities are different actions.
+    if (insertionPolicy) {
+        for (unsigned d : armDemotions)
+            oss << "demotion" << d << ";";
     }
     return oss.str();
 }
@@ -567,10 +969,10 @@ MLPrefetchController::childrenSignature() const
 void
 MLPrefetchController::saveQTable() const
 {
-    std::ofstream out(qfileName, std::ios::binary | std::ios::trunc);
+    std::ofstream out(qfileSaveName, std::ios::binary | std::ios::trunc);
     if (!out.is_open()) {
         warn("MLPrefetchController: could not save Q-table to %s\n",
-             qfileName.c_str());
+             qfileSaveName.c_str());
         return;
     }
 
@@ -599,7 +1001,7 @@ MLPrefetchController::saveQTable() const
 
     out.close();
     inform("MLPrefetchController: Q-table saved (%s, %llu states)\n",
-           qfileName.c_str(), (unsigned long long)qTable.size());
+           qfileSaveName.c_str(), (unsigned long long)qTable.size());
 }
 
 void
@@ -3,10 +3,14 @@
 
 #include <vector>
 #include <map>
+#include <memory>
 #include <string>
 #include <unordered_map>
 
+#include "base/random.hh"
 #include "mem/cache/prefetch/queued.hh"
+#include "mem/cache/prefetch/reuse_sampler.hh"
+#include "mem/cache/prefetch/shadow_tags.hh"
 #include "params/MLPrefetchController.hh"
 #include "sim/eventq.hh"
 
@@ -17,9 +21,23 @@ class BaseCPU;
 class BaseCache;
 class CacheAccessor;
 
+namespace memory
+{
+class MemCtrl;
+} // namespace memory
+
+namespace replacement_policy
+{
+class PrefetchAware;
+} // namespace replacement_policy
+
 namespace prefetch
 {
 
+class MLPrefetchCoordinator;
+class MLPrefetchEpochManager;
+class Stride;
+
 /**
  * MLPrefetchController
  *
@@ -29,6 +47,49 @@ namespace prefetch
  *   - ΔIPC      (change in IPC)
  *   - accuracy  (normalized improvement in smoothed miss rate)
  *
+ * With stride_child, one Stride instance provides an arm per
+ * (degree, distance) in the product of stride_degrees and
+ * stride_distances, after the children's arms. The instance is set to
+ * the largest reach of the grid, so one lookup trains its PC table once
+ * and yields the candidates of every setting: the arm (d, k) issues the
+ * d candidates that follow the first k strides.
+ *
+ * With reuse_feature, the state also holds a working-set bin estimated
+ * from sampled reuse distances of all accesses to the cache (see
+ * ReuseDistanceSampler), which tells streaming phases from reuse-heavy
+ * ones.
+ *
+ * With shadow_leader_sets, a few sets of the cache are leaders for each
+ * arm and are simulated in shadow tags (see ArmShadowTags). Every epoch
+ * the arms that did not run are also updated, from the reward of the
+ * arm that ran corrected by the difference in shadow hit rates.
+ *
+ * With mem_ctrls, the read/write queue occupancy of the memory
+ * controllers is sampled on every prefetch lookup. After an epoch whose
+ * mean occupancy reaches throttle_occupancy, at most throttle_prefetches
+ * prefetches are issued in the next epoch, so prefetches do not starve
+ * demand misses of memory bandwidth. With bandwidth_feature, an
+ * occupancy bin is also part of the state.
+ *
+ * With an MLPrefetchCoordinator, the controller is one level of a
+ * hierarchy: its state also holds the coordinator's joint state, and
+ * candidates an upper level has just prefetched may be dropped.
+ *
+ * With an MLPrefetchEpochManager, the controller does not schedule its
+ * own epochs: the manager ends the epochs of all its controllers in one
+ * event and saves their Q-tables every few epochs.
+ *
+ * With insertion_policy, a PrefetchAware replacement policy of the cache,
+ * every arm also sets the demotion its prefetched blocks are inserted at
+ * (arm_prefetch_demotions), so the bandit learns the insertion priority
+ * along with the prefetcher.
+ *
+ * Exploration draws from a private RNG seeded from seed, or else from
+ * gem5's global seed and the controller's name, and the seed is part of
+ * the stats. With reproducible, the saved Q-table is not loaded either,
+ * so a run only depends on its configuration, and the table the run
+ * learns is saved to the output directory rather than over the shared one.
+ *
  * Reward is shaped from:
  *   - IPC delta sign
  *   - accuracy (centered around 0)
@@ -53,6 +114,48 @@ class MLPrefetchController : public Queued
                 const PrefetchInfo &pfi) override;
 
     void regStats() override;
+    void regProbeListeners() override;
+
+    /** Child prefetchers, indexed by semantic child index. */
+    const std::vector<Base *> &getChildren() const { return children; }
+
+    /** Number of arms: the children, then the Stride grid settings. */
+    int numArms() const { return numActions - 1; }
+
+    /** Name of an arm, the child's name for the children's arms. */
+    std::string armName(int arm) const;
+
+    /** Short form of armName() usable as a stat subname. */
+    std::string armStatName(int arm) const;
+
+    /** Currently active arm, or -1 when OFF. */
+    int activeChild() const { return currentAction; }
+
+    /**
+     * Arm whose prefetch brought in the block holding addr, or -1 if
+     * none is known. Also answers for the block whose first demand hit
+     * was just attributed, so the result does not depend on whether it
+     * is asked before or after this controller sees that hit.
+     */
+    int issuingChild(Addr addr) const;
+
+    /** Called by the coordinator of the hierarchy this is level of. */
+    void setCoordinator(MLPrefetchCoordinator *coord, int level);
+
+    /** Called by the manager that ends this controller's epochs. */
+    void setEpochManager(MLPrefetchEpochManager *manager);
+
+    /**
+     * Read the cache counters the next epoch update uses. A manager reads
+     * those of all its controllers before updating any of them.
+     */
+    void snapshotCounters();
+
+    /** End the current epoch: update the Q-table and pick an action. */
+    void endEpoch();
+
+    /** Save the Q-table to disk. */
+    void saveQTable() const;
 
   private:
     // ---- Parent cache (resolved via cache_name string in params) ----
@@ -61,8 +164,19 @@ class MLPrefetchController : public Queued
 
     // ---- RL child prefetchers + action space ----
     std::vector<Base *> children;
-    int currentAction;    // semantic: -1 = OFF, >=0 = index into children
-    int numActions;       // children.size() + 1 (for OFF)
+    int currentAction;    // semantic: -1 = OFF, >=0 = arm index
+    int numActions;       // numArms() + 1 (for OFF)
+
+    // ---- Parameterized Stride arms (optional) ----
+    struct StrideSetting
+    {
+        int degree;
+        int distance;
+    };
+
+    Stride *strideChild;                   // null if no grid
+    std::vector<StrideSetting> strideGrid; // arm children.size() + i
+    int strideMinDistance = 0;             // distance the child runs at
 
     // ---- Epoch timing ----
     const Tick epoch_ticks;
@@ -71,6 +185,11 @@ class MLPrefetchController : public Queued
     // ---- Cache stats snapshots for REAL miss rate ----
     uint64_t lastAccesses = 0;
     uint64_t lastMisses   = 0;
+    uint64_t snapAccesses = 0;  // read by snapshotCounters()
+    uint64_t snapMisses   = 0;
+
+    // Ends the epochs instead of update_event, if set.
+    MLPrefetchEpochManager *epochManager = nullptr;
 
     // ---- Notify-based stats (debug only, not used for RL) ----
     uint64_t epochAccesses = 0;
@@ -89,6 +208,12 @@ class MLPrefetchController : public Queued
     int      lastAction  = 0;   // bandit index (0..numActions-1)
     double   lastReward  = 0.0;
 
+    // ---- Exploration RNG ----
+    const uint32_t rngSeed;
+    Random::RandomPtr rng;
+    const bool reproducible;   // ignore saved Q-tables
+    statistics::Value seedStat;
+
     // ---- RL hyperparameters ----
     double learningRate;
     double exploreRate;         // decays over time
@@ -97,6 +222,9 @@ class MLPrefetchController : public Queued
 
     // ---- IPC-based reward tracking ----
     BaseCPU *cpuPtr       = nullptr;
+    BaseCPU *warmupCpuPtr = nullptr;  // fast CPU used before the switch
+    BaseCPU *ipcCpu       = nullptr;  // CPU lastTotalOps was sampled from
+    bool     ipcRebased   = false;    // skip ΔIPC right after a CPU switch
     uint64_t lastTotalOps = 0;
     double   lastIpc      = 0.0;  // last epoch's IPC (for ΔIPC & reward)
     Tick     lastIpcTick  = 0;
@@ -104,7 +232,7 @@ class MLPrefetchController : public Queued
     // ---- Per-child prefetch attribution ----
     struct ChildPfMeta
     {
-        int  actionIndex;  // semantic child index (0..children.size()-1)
+        int  actionIndex;  // arm index (0..numArms()-1)
         Tick issueTick;
     };
 
@@ -112,52 +240,107 @@ class MLPrefetchController : public Queued
     std::unordered_map<Addr, ChildPfMeta> childPfTable;
     static const size_t MaxTrackedPrefetches = 2048;
 
-    // ---- Stats: RL action usage (bandit indices) ----
-    statistics::Scalar actionUse0;
-    statistics::Scalar actionUse1;
-    statistics::Scalar actionUse2;
-    statistics::Scalar actionUse3;
-
-    // ---- Stats: per-child issued / useful / redundant prefetches ----
-    // These are indexed by *semantic* child index: 0,1,2,...
-    // (OFF action has no children and no per-child stats.)
-    statistics::Scalar child0PfIssued;
-    statistics::Scalar child1PfIssued;
-    statistics::Scalar child2PfIssued;
-    statistics::Scalar child3PfIssued;
-
-    statistics::Scalar child0PfUseful;
-    statistics::Scalar child1PfUseful;
-    statistics::Scalar child2PfUseful;
-    statistics::Scalar child3PfUseful;
-
-    statistics::Scalar child0PfRedundant;
-    statistics::Scalar child1PfRedundant;
-    statistics::Scalar child2PfRedundant;
-    statistics::Scalar child3PfRedundant;
+    // Last block credited as useful and its child (see issuingChild()).
+    Addr lastUsefulAddr  = MaxAddr;
+    int  lastUsefulChild = -1;
+
+    // ---- Stats: RL action usage (bandit indices, OFF last) ----
+    statistics::Vector actionUse;
+
+    // ---- Stats: per-arm issued / useful / redundant prefetches ----
+    // These are indexed by arm. OFF issues nothing and has no entry.
+    statistics::Vector armPfIssued;
+    statistics::Vector armPfUseful;
+    statistics::Vector armPfRedundant;
+
+    // ---- Listeners on every cache access (reuse / shadow tags) ----
+    class AccessListener : public ProbeListenerArgBase<CacheAccessProbeArg>
+    {
+      public:
+        AccessListener(MLPrefetchController &_parent, std::string name)
+            : ProbeListenerArgBase(std::move(name)), parent(_parent)
+        {}
+
+        void notify(const CacheAccessProbeArg &arg) override
+        {
+            parent.observeAccess(arg);
+        }
+
+      private:
+        MLPrefetchController &parent;
+    };
+
+    std::vector<ProbeListenerPtr<>> accessListeners;
+
+    // ---- Sampled reuse-distance state feature (optional) ----
+    std::unique_ptr<ReuseDistanceSampler> reuseSampler; // null if disabled
+    uint64_t reuseCapacity = 0;  // blocks working sets are compared with
+
+    // Sampled accesses this epoch by reuse distance relative to capacity:
+    // up to half of it, up to twice it, and beyond (or first use).
+    uint64_t reuseNear = 0;
+    uint64_t reuseMid  = 0;
+    uint64_t reuseFar  = 0;
+    int      wsBin     = 0;     // last working-set bin
+
+    // ---- Memory bandwidth pressure (optional) ----
+    std::vector<memory::MemCtrl *> memCtrls;  // empty if disabled
+    const bool bandwidthFeature;    // add an occupancy bin to the state
+    const double throttleOccupancy; // epoch mean occupancy that throttles
+    const unsigned throttlePrefetches; // prefetch budget while throttled
+
+    double   occupancySum     = 0.0;  // sampled occupancy this epoch
+    uint64_t occupancySamples = 0;
+    double   memOccupancy     = 0.0;  // mean occupancy of last epoch
+    bool     throttled        = false;
+    uint64_t epochIssued      = 0;    // prefetches issued this epoch
+
+    statistics::Scalar pfThrottled;
+    statistics::Scalar throttledEpochs;
+
+    // ---- Set-dueling shadow evaluation of all arms (optional) ----
+    const unsigned shadowLeaderSets;  // leader sets per arm, 0 = off
+    const unsigned shadowAssoc;       // 0 = cache associativity
+    std::unique_ptr<ArmShadowTags> shadowTags;  // built at startup
+
+    // ---- Prefetch-aware insertion, chosen per arm (optional) ----
+    replacement_policy::PrefetchAware *insertionPolicy;
+    std::vector<unsigned> armDemotions;  // indexed by arm
+
+    // ---- Multi-level coordination (optional) ----
+    MLPrefetchCoordinator *coordinator = nullptr;
+    int hierarchyLevel = 0;     // 0 = closest to the CPU
 
     // ---- Q-table persistence support ----
     std::string qfileName;     // file to save/load Q-table
+    std::string qfileSaveName; // in the output dir when reproducible
     bool qtableLoaded = false; // diagnostic
 
     // Build child signature (stable identity)
     std::string childrenSignature() const;
 
-    // Save Q-table to disk
-    void saveQTable() const;
-
     // Load Q-table from disk (if exists and compatible)
     void loadQTable();
 
     // ---- Internal helpers ----
     void updateModel();
-    void endEpoch();
 
     int  encodeDeltaMiss(double d) const;
     int  encodeDeltaIpc(double d) const;
     int  encodeAccuracy(double a) const;
+    int  encodeWorkingSet();
+    int  encodeOccupancy(double o) const;
+    double sampleOccupancy() const; // busiest memory queue right now
+    void updateFromShadow(double reward);
     int  selectAction(uint64_t state);
-    void switchTo(int index);   // semantic index in [-1, children.size()-1]
+    BaseCPU *activeCpu() const;  // warm-up CPU until switched out, else cpu
+    void switchTo(int index);   // semantic index in [-1, numArms()-1]
+
+    void observeAccess(const CacheAccessProbeArg &acc);
+
+    // Issue a candidate of an arm, unless the bandwidth throttle is on.
+    void issueForArm(int arm, const AddrPriority &ap,
+                     std::vector<AddrPriority> &addresses);
 
     void trackIssuedForChild(int childIndex, Addr addr);
     void trackUsefulForAddr(Addr addr);
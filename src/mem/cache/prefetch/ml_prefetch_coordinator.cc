@@ -0,0 +1,161 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#include "mem/cache/prefetch/ml_prefetch_coordinator.hh"
+
+#include "base/cprintf.hh"
+#include "base/intmath.hh"
+#include "base/logging.hh"
+#include "mem/cache/prefetch/ml_prefetch_controller.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+MLPrefetchCoordinator::MLPrefetchCoordinator(const Params &p)
+    : SimObject(p),
+      controllers(p.controllers.begin(), p.controllers.end()),
+      jointState(p.joint_state),
+      dedupe(p.dedupe),
+      recent(p.filter_entries, floorLog2(p.block_size)),
+      missRates(controllers.size(), 0.0),
+      stats(this, controllers.size())
+{
+    fatal_if(controllers.size() < 2,
+             "MLPrefetchCoordinator '%s' needs at least two controllers",
+             name());
+    fatal_if(!isPowerOf2(p.block_size),
+             "MLPrefetchCoordinator '%s': block size %d is not a power "
+             "of 2", name(), p.block_size);
+
+    for (int level = 0; level < numLevels(); ++level)
+        controllers[level]->setCoordinator(this, level);
+}
+
+bool
+MLPrefetchCoordinator::filter(int level, Addr addr)
+{
+    // Level 0 has nothing above it.
+    if (level == 0)
+        return false;
+
+    stats.candidates[level]++;
+    epochCandidates++;
+    if (!recent.coveredAbove(addr, level))
+        return false;
+
+    stats.covered[level]++;
+    epochCovered++;
+    if (!dedupe)
+        return false;
+
+    stats.dropped[level]++;
+    return true;
+}
+
+void
+MLPrefetchCoordinator::issued(int level, Addr addr)
+{
+    // Only the levels above the lowest one cover anything.
+    if (level < numLevels() - 1)
+        recent.insert(addr, level);
+}
+
+void
+MLPrefetchCoordinator::reportEpoch(int level, double miss_rate)
+{
+    missRates[level] = miss_rate;
+
+    if (level == numLevels() - 1) {
+        // Keep the last overlap through epochs without candidates.
+        if (epochCandidates > 0)
+            overlap = (double)epochCovered / (double)epochCandidates;
+        epochCandidates = 0;
+        epochCovered = 0;
+    }
+}
+
+int
+MLPrefetchCoordinator::encodeMissRate(double m)
+{
+    if (m < 0.05) return 0;    // mostly hits
+    if (m < 0.30) return 1;    // moderate
+    return 2;                  // mostly misses
+}
+
+int
+MLPrefetchCoordinator::encodeOverlap(double o)
+{
+    if (o < 0.05) return 0;    // levels prefetch different blocks
+    if (o < 0.25) return 1;    // some duplication
+    return 2;                  // heavy duplication
+}
+
+uint64_t
+MLPrefetchCoordinator::state(int level) const
+{
+    uint64_t s = 0;
+    for (int l = 0; l < numLevels(); ++l) {
+        if (l != level)
+            s = s * 3 + encodeMissRate(missRates[l]);
+    }
+    return s * 3 + encodeOverlap(overlap);
+}
+
+MLPrefetchCoordinator::CoordinatorStats::CoordinatorStats(
+    MLPrefetchCoordinator *parent, int levels)
+    : statistics::Group(parent),
+      ADD_STAT(candidates, statistics::units::Count::get(),
+               "Prefetch candidates checked against the upper levels"),
+      ADD_STAT(covered, statistics::units::Count::get(),
+               "Candidates recently prefetched by an upper level"),
+      ADD_STAT(dropped, statistics::units::Count::get(),
+               "Covered candidates dropped by the dedupe filter"),
+      ADD_STAT(overlap, statistics::units::Ratio::get(),
+               "Fraction of the candidates prefetched by an upper level",
+               covered / candidates)
+{
+    using namespace statistics;
+
+    candidates.init(levels).flags(nozero);
+    covered.init(levels).flags(nozero);
+    dropped.init(levels).flags(nozero);
+    for (int level = 0; level < levels; ++level) {
+        const std::string sub = csprintf("level%d", level);
+        candidates.subname(level, sub);
+        covered.subname(level, sub);
+        dropped.subname(level, sub);
+    }
+    overlap.flags(nozero | nonan);
+}
+
+} // namespace prefetch
+} // namespace gem5
@@ -0,0 +1,128 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#ifndef __MEM_CACHE_PREFETCH_ML_PREFETCH_COORDINATOR_HH__
+#define __MEM_CACHE_PREFETCH_ML_PREFETCH_COORDINATOR_HH__
+
+#include <cstdint>
+#include <vector>
+
+#include "base/statistics.hh"
+#include "base/types.hh"
+#include "mem/cache/prefetch/cross_level_filter.hh"
+#include "params/MLPrefetchCoordinator.hh"
+#include "sim/sim_object.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+class MLPrefetchController;
+
+/**
+ * Coordinates MLPrefetchControllers attached to the levels of one cache
+ * hierarchy, e.g. on the L1D and the L2. Level 0 is the controller
+ * closest to the CPU.
+ *
+ * With joint_state, every controller adds to its own state the miss-rate
+ * bins of the other levels and a bin of the inter-level prefetch overlap:
+ * the fraction of the candidates of the lower levels that an upper level
+ * had already prefetched.
+ *
+ * With dedupe, such candidates are dropped (see CrossLevelFilter), since
+ * the upper level's prefetch fills the lower cache anyway.
+ *
+ * The controllers keep their own epochs. Each reports its miss rate at
+ * the end of its epoch, and the overlap is measured over the epochs of
+ * the lowest level.
+ */
+class MLPrefetchCoordinator : public SimObject
+{
+  public:
+    PARAMS(MLPrefetchCoordinator);
+    MLPrefetchCoordinator(const Params &p);
+
+    /** Number of coordinated levels. */
+    int numLevels() const { return controllers.size(); }
+
+    /** Whether the controllers add the joint state to their own. */
+    bool sharesState() const { return jointState; }
+
+    /**
+     * Check a candidate of the controller at level against the recent
+     * prefetches of the levels above it.
+     *
+     * @return Whether the candidate should be dropped.
+     */
+    bool filter(int level, Addr addr);
+
+    /** Record a prefetch issued by the controller at level. */
+    void issued(int level, Addr addr);
+
+    /** Record the miss rate of level over its last epoch. */
+    void reportEpoch(int level, double miss_rate);
+
+    /** Joint state seen by level, in [0, 3^numLevels()). */
+    uint64_t state(int level) const;
+
+  private:
+    static int encodeMissRate(double m);
+    static int encodeOverlap(double o);
+
+    std::vector<MLPrefetchController *> controllers;
+    const bool jointState;
+    const bool dedupe;
+
+    CrossLevelFilter recent;
+
+    std::vector<double> missRates;   // last reported, per level
+    uint64_t epochCandidates = 0;    // lower-level candidates checked
+    uint64_t epochCovered    = 0;    // of which prefetched above
+    double   overlap         = 0.0;  // covered fraction, last epoch
+
+    struct CoordinatorStats : public statistics::Group
+    {
+        CoordinatorStats(MLPrefetchCoordinator *parent, int levels);
+
+        /** Candidates checked against the upper levels, per level. */
+        statistics::Vector candidates;
+        /** Candidates an upper level had already prefetched. */
+        statistics::Vector covered;
+        /** Covered candidates that were dropped. */
+        statistics::Vector dropped;
+        statistics::Formula overlap;
+    } stats;
+};
+
+} // namespace prefetch
+} // namespace gem5
+
+#endif // __MEM_CACHE_PREFETCH_ML_PREFETCH_COORDINATOR_HH__
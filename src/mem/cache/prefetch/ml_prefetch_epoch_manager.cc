@@ -0,0 +1,102 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#include "mem/cache/prefetch/ml_prefetch_epoch_manager.hh"
+
+#include "base/logging.hh"
+#include "mem/cache/prefetch/ml_prefetch_controller.hh"
+#include "sim/core.hh"
+#include "sim/cur_tick.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+MLPrefetchEpochManager::MLPrefetchEpochManager(const Params &p)
+    : SimObject(p),
+      controllers(p.controllers.begin(), p.controllers.end()),
+      epochTicks(p.ticks_per_epoch),
+      saveInterval(p.save_interval),
+      epochEvent([this]{ processEpoch(); }, name() + ".epoch_event"),
+      stats(this)
+{
+    fatal_if(epochTicks == 0,
+             "MLPrefetchEpochManager '%s': ticks_per_epoch is 0", name());
+
+    for (auto *ctrl : controllers)
+        ctrl->setEpochManager(this);
+
+    registerExitCallback([this]() { saveAll(); });
+}
+
+void
+MLPrefetchEpochManager::startup()
+{
+    schedule(epochEvent, curTick() + epochTicks);
+}
+
+void
+MLPrefetchEpochManager::processEpoch()
+{
+    // Read every cache before any controller switches its action.
+    for (auto *ctrl : controllers)
+        ctrl->snapshotCounters();
+    for (auto *ctrl : controllers)
+        ctrl->endEpoch();
+    stats.epochs++;
+
+    if (saveInterval > 0 && ++epochsSinceSave >= saveInterval)
+        saveAll();
+
+    schedule(epochEvent, curTick() + epochTicks);
+}
+
+void
+MLPrefetchEpochManager::saveAll()
+{
+    for (auto *ctrl : controllers)
+        ctrl->saveQTable();
+    epochsSinceSave = 0;
+    stats.qtableSaves++;
+}
+
+MLPrefetchEpochManager::EpochManagerStats::EpochManagerStats(
+    MLPrefetchEpochManager *parent)
+    : statistics::Group(parent),
+      ADD_STAT(epochs, statistics::units::Count::get(),
+               "Epochs ended for all controllers"),
+      ADD_STAT(qtableSaves, statistics::units::Count::get(),
+               "Times the Q-tables of all controllers were saved")
+{
+}
+
+} // namespace prefetch
+} // namespace gem5
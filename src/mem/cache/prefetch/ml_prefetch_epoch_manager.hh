@@ -0,0 +1,96 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#ifndef __MEM_CACHE_PREFETCH_ML_PREFETCH_EPOCH_MANAGER_HH__
+#define __MEM_CACHE_PREFETCH_ML_PREFETCH_EPOCH_MANAGER_HH__
+
+#include <vector>
+
+#include "base/statistics.hh"
+#include "base/types.hh"
+#include "params/MLPrefetchEpochManager.hh"
+#include "sim/eventq.hh"
+#include "sim/sim_object.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+class MLPrefetchController;
+
+/**
+ * Ends the epochs of many MLPrefetchControllers, e.g. those of the
+ * per-core caches of a large system, in a single event.
+ *
+ * Every ticks_per_epoch, the manager reads the cache counters of all its
+ * controllers, then ends each controller's epoch in the order they are
+ * listed. All of them therefore share the same epoch boundaries, and the
+ * event queue holds one event instead of one per controller. The
+ * controllers' own ticks_per_epoch is ignored.
+ *
+ * Q-tables are saved every save_interval epochs, all in one pass, and
+ * again at exit, instead of by every controller on every epoch.
+ */
+class MLPrefetchEpochManager : public SimObject
+{
+  public:
+    PARAMS(MLPrefetchEpochManager);
+    MLPrefetchEpochManager(const Params &p);
+
+    void startup() override;
+
+  private:
+    /** End the epoch of every controller. */
+    void processEpoch();
+
+    /** Save the Q-table of every controller. */
+    void saveAll();
+
+    std::vector<MLPrefetchController *> controllers;
+    const Tick epochTicks;
+    const unsigned saveInterval;
+
+    unsigned epochsSinceSave = 0;
+    EventFunctionWrapper epochEvent;
+
+    struct EpochManagerStats : public statistics::Group
+    {
+        EpochManagerStats(MLPrefetchEpochManager *parent);
+
+        statistics::Scalar epochs;
+        statistics::Scalar qtableSaves;
+    } stats;
+};
+
+} // namespace prefetch
+} // namespace gem5
+
+#endif // __MEM_CACHE_PREFETCH_ML_PREFETCH_EPOCH_MANAGER_HH__
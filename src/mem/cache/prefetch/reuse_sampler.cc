@@ -0,0 +1,152 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include "mem/cache/prefetch/reuse_sampler.hh"
+
+#include <algorithm>
+#include <cassert>
+#include <cmath>
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+ReuseDistanceSampler::ReuseDistanceSampler(double rate, size_t max_samples)
+    : maxSamples(std::max<size_t>(max_samples, 1)),
+      threshold(std::clamp<uint64_t>(
+          (uint64_t)std::ceil(rate * HashModulus), 1, HashModulus)),
+      // Room for maxSamples accesses between compactions.
+      tree(2 * maxSamples + 1, 0)
+{
+    lastUse.reserve(maxSamples + 1);
+}
+
+uint64_t
+ReuseDistanceSampler::hash(Addr blk_addr)
+{
+    // splitmix64 finalizer
+    uint64_t x = blk_addr;
+    x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL;
+    x = x ^ (x >> 31);
+    return x % HashModulus;
+}
+
+double
+ReuseDistanceSampler::rate() const
+{
+    return (double)threshold / (double)HashModulus;
+}
+
+void
+ReuseDistanceSampler::treeAdd(uint64_t time, int delta)
+{
+    for (; time < tree.size(); time += time & -time)
+        tree[time] += delta;
+}
+
+uint64_t
+ReuseDistanceSampler::treePrefix(uint64_t time) const
+{
+    uint64_t sum = 0;
+    for (; time > 0; time -= time & -time)
+        sum += tree[time];
+    return sum;
+}
+
+void
+ReuseDistanceSampler::compact()
+{
+    std::vector<std::pair<uint64_t, Addr>> order;
+    order.reserve(lastUse.size());
+    for (const auto &entry : lastUse)
+        order.emplace_back(entry.second, entry.first);
+    std::sort(order.begin(), order.end());
+
+    std::fill(tree.begin(), tree.end(), 0);
+    now = 0;
+    for (const auto &entry : order) {
+        lastUse[entry.second] = ++now;
+        treeAdd(now, 1);
+    }
+}
+
+void
+ReuseDistanceSampler::shrink()
+{
+    assert(!byHash.empty());
+    uint64_t top = byHash.rbegin()->first;
+    while (!byHash.empty() && byHash.rbegin()->first == top) {
+        Addr blk = byHash.rbegin()->second;
+        byHash.erase(std::prev(byHash.end()));
+        auto it = lastUse.find(blk);
+        treeAdd(it->second, -1);
+        lastUse.erase(it);
+    }
+    threshold = top;
+}
+
+bool
+ReuseDistanceSampler::access(Addr blk_addr, uint64_t &distance)
+{
+    const uint64_t h = hash(blk_addr);
+    if (h >= threshold)
+        return false;
+
+    if (now + 1 >= tree.size())
+        compact();
+
+    auto it = lastUse.find(blk_addr);
+    if (it == lastUse.end()) {
+        distance = Cold;
+        lastUse.emplace(blk_addr, ++now);
+        byHash.emplace(h, blk_addr);
+        treeAdd(now, 1);
+        if (lastUse.size() > maxSamples) {
+            shrink();
+            // The new block itself may have been dropped.
+            if (h >= threshold)
+                return false;
+        }
+        return true;
+    }
+
+    // Distinct sampled blocks used since the last use of this one.
+    uint64_t sampled = lastUse.size() - treePrefix(it->second);
+    distance = (uint64_t)std::llround((double)sampled / rate());
+
+    treeAdd(it->second, -1);
+    it->second = ++now;
+    treeAdd(now, 1);
+    return true;
+}
+
+} // namespace prefetch
+} // namespace gem5
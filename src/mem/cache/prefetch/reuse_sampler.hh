@@ -0,0 +1,122 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef __MEM_CACHE_PREFETCH_REUSE_SAMPLER_HH__
+#define __MEM_CACHE_PREFETCH_REUSE_SAMPLER_HH__
+
+#include <cstdint>
+#include <limits>
+#include <set>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include "base/types.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+/**
+ * Sampled reuse (stack) distance estimator, after SHARDS (Waldspurger et
+ * al., FAST'15).
+ *
+ * A block is sampled if a hash of its address falls below a threshold, so
+ * either every access to a block is seen or none is. Stack distances are
+ * measured exactly among the sampled blocks and scaled by the inverse of
+ * the sample rate.
+ *
+ * At most maxSamples distinct blocks are tracked. When a new block would
+ * exceed that, the threshold is lowered to drop the blocks with the
+ * largest hashes (fixed-size SHARDS), so memory is bounded and the
+ * effective rate adapts to the footprint. An access to an unsampled block
+ * costs one hash; a sampled one costs O(log maxSamples), amortized.
+ */
+class ReuseDistanceSampler
+{
+  public:
+    /** Distance reported for the first access to a sampled block. */
+    static constexpr uint64_t Cold = std::numeric_limits<uint64_t>::max();
+
+    /**
+     * @param rate Initial fraction of blocks sampled, in (0, 1].
+     * @param max_samples Most distinct blocks tracked at once.
+     */
+    ReuseDistanceSampler(double rate, size_t max_samples);
+
+    /**
+     * Record an access.
+     *
+     * @param blk_addr Block-aligned address of the access.
+     * @param distance Set to the estimated stack distance, in blocks, or
+     *        to Cold, if the access is sampled.
+     * @return Whether the access was sampled.
+     */
+    bool access(Addr blk_addr, uint64_t &distance);
+
+    /** Current fraction of blocks sampled. */
+    double rate() const;
+
+    /** Number of distinct blocks currently tracked. */
+    size_t tracked() const { return lastUse.size(); }
+
+  private:
+    /** Hashes are reduced modulo this before comparing to threshold. */
+    static constexpr uint64_t HashModulus = uint64_t(1) << 24;
+
+    static uint64_t hash(Addr blk_addr);
+
+    /** Fenwick tree helpers over access timestamps (1-based). */
+    void treeAdd(uint64_t time, int delta);
+    uint64_t treePrefix(uint64_t time) const;
+
+    /** Renumber the live timestamps to 1..n and rebuild the tree. */
+    void compact();
+
+    /** Drop the blocks with the largest hashes, lowering threshold. */
+    void shrink();
+
+    const size_t maxSamples;
+    uint64_t threshold;
+
+    /** Timestamp of the last access to each tracked block. */
+    std::unordered_map<Addr, uint64_t> lastUse;
+    /** Tracked blocks ordered by hash, to find the ones to drop. */
+    std::set<std::pair<uint64_t, Addr>> byHash;
+
+    /** Fenwick tree marking the timestamps that are a last use. */
+    std::vector<int> tree;
+    uint64_t now = 0;
+};
+
+} // namespace prefetch
+} // namespace gem5
+
+#endif // __MEM_CACHE_PREFETCH_REUSE_SAMPLER_HH__
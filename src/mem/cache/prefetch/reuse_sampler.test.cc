@@ -0,0 +1,108 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include <gtest/gtest.h>
+
+#include <cstdint>
+
+#include "mem/cache/prefetch/reuse_sampler.hh"
+
+using namespace gem5;
+
+/** With every block sampled, distances are exact stack distances. */
+TEST(ReuseDistanceSamplerTest, ExactWhenFullySampled)
+{
+    prefetch::ReuseDistanceSampler sampler(1.0, 1024);
+    uint64_t distance;
+
+    // A B C A B B: A is cold, then reused after B and C.
+    for (Addr blk : {0x0, 0x40, 0x80}) {
+        ASSERT_TRUE(sampler.access(blk, distance));
+        ASSERT_EQ(distance, prefetch::ReuseDistanceSampler::Cold);
+    }
+    ASSERT_TRUE(sampler.access(0x0, distance));
+    ASSERT_EQ(distance, 2);
+    ASSERT_TRUE(sampler.access(0x40, distance));
+    ASSERT_EQ(distance, 2);
+    ASSERT_TRUE(sampler.access(0x40, distance));
+    ASSERT_EQ(distance, 0);
+}
+
+/** Distances stay exact across timestamp compactions. */
+TEST(ReuseDistanceSamplerTest, Compaction)
+{
+    prefetch::ReuseDistanceSampler sampler(1.0, 8);
+    uint64_t distance;
+
+    // Loop over 4 blocks many more times than the timestamp space.
+    for (int iter = 0; iter < 100; iter++) {
+        for (Addr blk = 0; blk < 4; blk++) {
+            ASSERT_TRUE(sampler.access(blk * 64, distance));
+            if (iter > 0) {
+                ASSERT_EQ(distance, 3);
+            }
+        }
+    }
+}
+
+/** The number of tracked blocks never exceeds the limit. */
+TEST(ReuseDistanceSamplerTest, BoundedSamples)
+{
+    const size_t max_samples = 64;
+    prefetch::ReuseDistanceSampler sampler(1.0, max_samples);
+    uint64_t distance;
+
+    for (Addr blk = 0; blk < 100000; blk++) {
+        sampler.access(blk * 64, distance);
+        ASSERT_LE(sampler.tracked(), max_samples);
+    }
+    ASSERT_LT(sampler.rate(), 0.01);
+}
+
+/** Scaled distances approximate the true distance of a cyclic pattern. */
+TEST(ReuseDistanceSamplerTest, ScaledEstimate)
+{
+    const Addr footprint = 20000;
+    prefetch::ReuseDistanceSampler sampler(0.05, 4096);
+    uint64_t distance;
+    uint64_t sum = 0;
+    uint64_t count = 0;
+
+    for (int iter = 0; iter < 3; iter++) {
+        for (Addr blk = 0; blk < footprint; blk++) {
+            if (sampler.access(blk * 64, distance) && iter > 0) {
+                ASSERT_NE(distance, prefetch::ReuseDistanceSampler::Cold);
+                sum += distance;
+                count++;
+            }
+        }
+    }
+    ASSERT_GT(count, 0);
+    double mean = (double)sum / count;
+    ASSERT_NEAR(mean, footprint - 1, 0.25 * footprint);
+}
@@ -0,0 +1,139 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include "mem/cache/prefetch/shadow_tags.hh"
+
+#include <algorithm>
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+ArmShadowTags::ArmShadowTags(unsigned num_arms, uint64_t num_sets,
+                             unsigned assoc, unsigned leaders_per_arm,
+                             unsigned blk_shift)
+    : numSets(std::max<uint64_t>(num_sets, 1)),
+      assoc(std::max(assoc, 1u)),
+      blkShift(blk_shift),
+      setSlot(numSets, -1),
+      scores(num_arms)
+{
+    // Split the sets into one constituency per leader, each holding one
+    // leader set of every arm at its start.
+    uint64_t leaders = std::min<uint64_t>(leaders_per_arm,
+                                          numSets / std::max(num_arms, 1u));
+    if (leaders == 0 || num_arms == 0)
+        return;
+    uint64_t constituency = numSets / leaders;
+
+    for (uint64_t c = 0; c < leaders; c++) {
+        for (unsigned arm = 0; arm < num_arms; arm++) {
+            setSlot[c * constituency + arm] = slotArm.size();
+            slotArm.push_back(arm);
+        }
+    }
+    entries.resize(slotArm.size() * this->assoc);
+}
+
+int
+ArmShadowTags::slotOf(Addr blk_addr) const
+{
+    return setSlot[(blk_addr >> blkShift) % numSets];
+}
+
+ArmShadowTags::Entry *
+ArmShadowTags::find(int slot, Addr blk_addr)
+{
+    Entry *ways = &entries[slot * assoc];
+    for (unsigned w = 0; w < assoc; w++) {
+        if (ways[w].valid && ways[w].blkAddr == blk_addr)
+            return &ways[w];
+    }
+    return nullptr;
+}
+
+void
+ArmShadowTags::insert(int slot, Addr blk_addr, bool prefetched)
+{
+    Entry *ways = &entries[slot * assoc];
+    Entry *victim = &ways[0];
+    for (unsigned w = 0; w < assoc && victim->valid; w++) {
+        if (!ways[w].valid || ways[w].lastUse < victim->lastUse)
+            victim = &ways[w];
+    }
+    victim->blkAddr = blk_addr;
+    victim->lastUse = ++clock;
+    victim->valid = true;
+    victim->prefetched = prefetched;
+}
+
+void
+ArmShadowTags::access(Addr blk_addr)
+{
+    int slot = slotOf(blk_addr);
+    if (slot < 0)
+        return;
+
+    Score &score = scores[slotArm[slot]];
+    score.accesses++;
+
+    Entry *entry = find(slot, blk_addr);
+    if (!entry) {
+        insert(slot, blk_addr, false);
+        return;
+    }
+
+    score.hits++;
+    if (entry->prefetched) {
+        score.useful++;
+        entry->prefetched = false;
+    }
+    entry->lastUse = ++clock;
+}
+
+void
+ArmShadowTags::prefetch(unsigned arm, Addr blk_addr)
+{
+    int slot = slotOf(blk_addr);
+    if (slot < 0 || slotArm[slot] != arm || find(slot, blk_addr))
+        return;
+
+    scores[arm].prefetches++;
+    insert(slot, blk_addr, true);
+}
+
+void
+ArmShadowTags::resetScores()
+{
+    std::fill(scores.begin(), scores.end(), Score());
+}
+
+} // namespace prefetch
+} // namespace gem5
@@ -0,0 +1,134 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef __MEM_CACHE_PREFETCH_SHADOW_TAGS_HH__
+#define __MEM_CACHE_PREFETCH_SHADOW_TAGS_HH__
+
+#include <cstdint>
+#include <vector>
+
+#include "base/types.hh"
+
+namespace gem5
+{
+
+namespace prefetch
+{
+
+/**
+ * Shadow tags for evaluating several prefetcher arms at once, in the
+ * style of set dueling (Qureshi et al., ISCA'07).
+ *
+ * A few sets of the cache are leaders for each arm. The shadow tags of a
+ * leader set model that set as if its arm were the only prefetcher: every
+ * demand access to the set is looked up (and filled on a miss), and only
+ * the candidates of the leader's arm are inserted. The real cache is not
+ * affected. Each arm's hit rate over its leader sets then estimates how
+ * it would perform, whether or not it is the active arm.
+ *
+ * Memory is num_arms * leaders_per_arm * assoc entries.
+ */
+class ArmShadowTags
+{
+  public:
+    struct Score
+    {
+        uint64_t accesses = 0;
+        uint64_t hits = 0;
+        /** Prefetched blocks inserted, and the ones later hit. */
+        uint64_t prefetches = 0;
+        uint64_t useful = 0;
+
+        double hitRate() const
+        {
+            return accesses ? (double)hits / (double)accesses : 0.0;
+        }
+    };
+
+    /**
+     * @param num_arms Number of arms, each gets its own leader sets.
+     * @param num_sets Number of sets in the real cache.
+     * @param assoc Ways per shadow set.
+     * @param leaders_per_arm Leader sets per arm. Lowered if the cache has
+     *        too few sets for all of them.
+     * @param blk_shift log2 of the block size.
+     */
+    ArmShadowTags(unsigned num_arms, uint64_t num_sets, unsigned assoc,
+                  unsigned leaders_per_arm, unsigned blk_shift);
+
+    /** A demand access to the block at blk_addr. */
+    void access(Addr blk_addr);
+
+    /** A prefetch candidate of the given arm. */
+    void prefetch(unsigned arm, Addr blk_addr);
+
+    const Score &score(unsigned arm) const { return scores[arm]; }
+
+    /** Start a new measurement interval. The tags are kept. */
+    void resetScores();
+
+    /** Number of shadow tag entries. */
+    size_t size() const { return entries.size(); }
+
+  private:
+    struct Entry
+    {
+        Addr blkAddr = 0;
+        uint64_t lastUse = 0;
+        bool valid = false;
+        bool prefetched = false;
+    };
+
+    /** Leader slot of the set holding blk_addr, or -1 for followers. */
+    int slotOf(Addr blk_addr) const;
+
+    /** Way of blk_addr in the slot, or nullptr. */
+    Entry *find(int slot, Addr blk_addr);
+
+    /** Replace the LRU way of the slot with blk_addr. */
+    void insert(int slot, Addr blk_addr, bool prefetched);
+
+    const uint64_t numSets;
+    const unsigned assoc;
+    const unsigned blkShift;
+
+    /** Leader slot of each set, -1 for followers. */
+    std::vector<int> setSlot;
+    /** Arm each leader slot belongs to. */
+    std::vector<unsigned> slotArm;
+    /** assoc entries per leader slot. */
+    std::vector<Entry> entries;
+
+    std::vector<Score> scores;
+    uint64_t clock = 0;
+};
+
+} // namespace prefetch
+} // namespace gem5
+
+#endif // __MEM_CACHE_PREFETCH_SHADOW_TAGS_HH__
@@ -0,0 +1,102 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include <gtest/gtest.h>
+
+#include "mem/cache/prefetch/shadow_tags.hh"
+
+using namespace gem5;
+
+namespace
+{
+
+// 64 sets of 64-byte blocks, 2 ways.
+const unsigned NumSets = 64;
+const unsigned BlkShift = 6;
+
+Addr
+blockIn(unsigned set, unsigned tag)
+{
+    return ((Addr)tag * NumSets + set) << BlkShift;
+}
+
+} // anonymous namespace
+
+/** Only leader sets are tracked, each for one arm. */
+TEST(ArmShadowTagsTest, LeaderSets)
+{
+    // 2 arms with 4 leaders each: sets 0,1 / 16,17 / 32,33 / 48,49.
+    prefetch::ArmShadowTags shadow(2, NumSets, 2, 4, BlkShift);
+    ASSERT_EQ(shadow.size(), 2 * 4 * 2);
+
+    shadow.access(blockIn(0, 0));
+    shadow.access(blockIn(17, 0));
+    shadow.access(blockIn(2, 0));
+    ASSERT_EQ(shadow.score(0).accesses, 1);
+    ASSERT_EQ(shadow.score(1).accesses, 1);
+}
+
+/** Demand accesses hit in an LRU set of the given associativity. */
+TEST(ArmShadowTagsTest, DemandLRU)
+{
+    prefetch::ArmShadowTags shadow(1, NumSets, 2, 1, BlkShift);
+
+    shadow.access(blockIn(0, 1));
+    shadow.access(blockIn(0, 2));
+    shadow.access(blockIn(0, 1));  // hit, 2 becomes LRU
+    shadow.access(blockIn(0, 3));  // evicts 2
+    shadow.access(blockIn(0, 1));  // hit
+    shadow.access(blockIn(0, 2));  // miss
+    ASSERT_EQ(shadow.score(0).accesses, 6);
+    ASSERT_EQ(shadow.score(0).hits, 2);
+}
+
+/** Prefetches only fill the leaders of their own arm. */
+TEST(ArmShadowTagsTest, PrefetchUseful)
+{
+    prefetch::ArmShadowTags shadow(2, NumSets, 2, 1, BlkShift);
+
+    shadow.prefetch(0, blockIn(0, 5));
+    shadow.prefetch(0, blockIn(1, 5));  // set 1 leads arm 1: ignored
+    shadow.prefetch(0, blockIn(0, 5));  // already present
+    ASSERT_EQ(shadow.score(0).prefetches, 1);
+    ASSERT_EQ(shadow.score(1).prefetches, 0);
+
+    shadow.access(blockIn(0, 5));
+    shadow.access(blockIn(0, 5));
+    shadow.access(blockIn(1, 5));
+    ASSERT_EQ(shadow.score(0).hits, 2);
+    ASSERT_EQ(shadow.score(0).useful, 1);
+    ASSERT_EQ(shadow.score(1).hits, 0);
+    ASSERT_DOUBLE_EQ(shadow.score(0).hitRate(), 1.0);
+
+    shadow.resetScores();
+    ASSERT_EQ(shadow.score(0).accesses, 0);
+    shadow.access(blockIn(0, 5));
+    ASSERT_EQ(shadow.score(0).hits, 1);
+}
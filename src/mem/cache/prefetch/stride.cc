@@ -92,6 +92,13 @@ Stride::Stride(const StridePrefetcherParams &p)
 {
 }
 
+void
+Stride::setAggressiveness(int _degree, int _distance)
+{
+    degree = _degree;
+    distance = _distance;
+}
+
 Stride::PCTable&
 Stride::findTable(int context)
 {
@@ -103,7 +103,7 @@ class Stride : public Queued
 
     const bool useRequestorId;
 
-    const int degree;
+    int degree;
 
     /** How far ahead of the demand stream to start prefetching.
      *
@@ -111,7 +111,7 @@ class Stride : public Queued
      * prefetch, then generate `degree` prefetches at `stride`
      * intervals. A value of zero indicates no skip.
      */
-    const int distance;
+    int distance;
 
     /**
      * Information used to create a new PC table. All of them behave equally.
@@ -174,6 +174,13 @@ class Stride : public Queued
   public:
     Stride(const StridePrefetcherParams &p);
 
+    /**
+     * Change the degree and distance of the generated prefetches. Lets a
+     * controller tune one instance instead of training several that only
+     * differ in aggressiveness.
+     */
+    void setAggressiveness(int degree, int distance);
+
     void calculatePrefetch(const PrefetchInfo &pfi,
                            std::vector<AddrPriority> &addresses,
                            const CacheAccessor &cache) override;
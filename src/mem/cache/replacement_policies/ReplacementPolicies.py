@@ -175,3 +175,19 @@ class WeightedLRURP(LRURP):
     type = "WeightedLRURP"
     cxx_class = "gem5::replacement_policy::WeightedLRU"
     cxx_header = "mem/cache/replacement_policies/weighted_lru_rp.hh"
+
+
+class PrefetchAwareRP(BaseReplacementPolicy):
+    type = "PrefetchAwareRP"
+    cxx_class = "gem5::replacement_policy::PrefetchAware"
+    cxx_header = "mem/cache/replacement_policies/prefetch_aware_rp.hh"
+
+    replacement_policy = Param.BaseReplacementPolicy(
+        LRURP(), "Policy ordering the blocks of the same priority"
+    )
+    prefetch_demotion = Param.Unsigned(
+        1,
+        "Levels below demand blocks prefetched blocks are inserted at, "
+        "until their first demand hit. 0 inserts them like demand blocks, "
+        "1 evicts them before any demand block.",
+    )
@@ -0,0 +1,192 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#include "mem/cache/replacement_policies/prefetch_aware_rp.hh"
+
+#include <algorithm>
+#include <vector>
+
+#include "base/logging.hh"
+#include "mem/packet.hh"
+#include "params/PrefetchAwareRP.hh"
+
+namespace gem5
+{
+
+namespace replacement_policy
+{
+
+PrefetchAware::PrefetchAware(const Params &p)
+  : Base(p), replPolicy(p.replacement_policy),
+    prefetchDemotion(p.prefetch_demotion), stats(this)
+{
+    fatal_if(replPolicy == nullptr,
+        "The wrapped replacement policy must be instantiated");
+}
+
+bool
+PrefetchAware::isPrefetch(const PacketPtr pkt)
+{
+    return pkt->cmd.isHWPrefetch() || pkt->cmd.isSWPrefetch();
+}
+
+void
+PrefetchAware::setPrefetchDemotion(unsigned demotion)
+{
+    prefetchDemotion = demotion;
+}
+
+void
+PrefetchAware::invalidate(
+    const std::shared_ptr<ReplacementData>& replacement_data)
+{
+    std::shared_ptr<PrefetchAwareReplData> casted_replacement_data =
+        std::static_pointer_cast<PrefetchAwareReplData>(replacement_data);
+    casted_replacement_data->valid = false;
+    casted_replacement_data->demotion = 0;
+    replPolicy->invalidate(casted_replacement_data->replData);
+}
+
+void
+PrefetchAware::touch(const std::shared_ptr<ReplacementData>& replacement_data,
+    const PacketPtr pkt)
+{
+    std::shared_ptr<PrefetchAwareReplData> casted_replacement_data =
+        std::static_pointer_cast<PrefetchAwareReplData>(replacement_data);
+
+    // Only demand accesses show the block is useful; hits of prefetches
+    // from the levels above do not.
+    if (casted_replacement_data->demotion > 0 && !isPrefetch(pkt)) {
+        casted_replacement_data->demotion = 0;
+        stats.promotions++;
+    }
+    replPolicy->touch(casted_replacement_data->replData, pkt);
+}
+
+void
+PrefetchAware::touch(
+    const std::shared_ptr<ReplacementData>& replacement_data) const
+{
+    std::shared_ptr<PrefetchAwareReplData> casted_replacement_data =
+        std::static_pointer_cast<PrefetchAwareReplData>(replacement_data);
+    replPolicy->touch(casted_replacement_data->replData);
+}
+
+void
+PrefetchAware::reset(const std::shared_ptr<ReplacementData>& replacement_data,
+    const PacketPtr pkt)
+{
+    std::shared_ptr<PrefetchAwareReplData> casted_replacement_data =
+        std::static_pointer_cast<PrefetchAwareReplData>(replacement_data);
+    casted_replacement_data->valid = true;
+    casted_replacement_data->demotion =
+        isPrefetch(pkt) ? prefetchDemotion : 0;
+    if (casted_replacement_data->demotion > 0)
+        stats.demotedInsertions++;
+    replPolicy->reset(casted_replacement_data->replData, pkt);
+}
+
+void
+PrefetchAware::reset(
+    const std::shared_ptr<ReplacementData>& replacement_data) const
+{
+    // Without a packet (e.g. a block moved within the tags), the block is
+    // treated as a demand block.
+    std::shared_ptr<PrefetchAwareReplData> casted_replacement_data =
+        std::static_pointer_cast<PrefetchAwareReplData>(replacement_data);
+    casted_replacement_data->valid = true;
+    casted_replacement_data->demotion = 0;
+    replPolicy->reset(casted_replacement_data->replData);
+}
+
+ReplaceableEntry*
+PrefetchAware::getVictim(const ReplacementCandidates& candidates) const
+{
+    // There must be at least one replacement candidate
+    assert(candidates.size() > 0);
+
+    // Restrict the candidates to the most demoted ones, unless one is
+    // invalid: the wrapped policy already prefers invalid entries.
+    unsigned demotion = 0;
+    for (const auto& candidate : candidates) {
+        std::shared_ptr<PrefetchAwareReplData> data =
+            std::static_pointer_cast<PrefetchAwareReplData>(
+            candidate->replacementData);
+        if (!data->valid) {
+            demotion = 0;
+            break;
+        }
+        demotion = std::max(demotion, data->demotion);
+    }
+
+    // Re-route the candidates' replacement data to the wrapped policy's
+    ReplacementCandidates pool;
+    std::vector<std::shared_ptr<ReplacementData>> original_data;
+    for (auto& candidate : candidates) {
+        std::shared_ptr<PrefetchAwareReplData> data =
+            std::static_pointer_cast<PrefetchAwareReplData>(
+            candidate->replacementData);
+        original_data.push_back(data);
+        candidate->replacementData = data->replData;
+        if (data->demotion == demotion || demotion == 0)
+            pool.push_back(candidate);
+    }
+
+    ReplaceableEntry* victim = replPolicy->getVictim(pool);
+
+    for (int i = 0; i < candidates.size(); i++) {
+        candidates[i]->replacementData = original_data[i];
+    }
+
+    if (demotion > 0)
+        stats.demotedEvictions++;
+
+    return victim;
+}
+
+std::shared_ptr<ReplacementData>
+PrefetchAware::instantiateEntry()
+{
+    return std::shared_ptr<PrefetchAwareReplData>(
+        new PrefetchAwareReplData(replPolicy->instantiateEntry()));
+}
+
+PrefetchAware::PrefetchAwareStats::PrefetchAwareStats(
+    statistics::Group* parent)
+  : statistics::Group(parent),
+    ADD_STAT(demotedInsertions,
+             "Prefetched blocks inserted below demand priority"),
+    ADD_STAT(promotions, "Demoted blocks promoted by a demand hit"),
+    ADD_STAT(demotedEvictions,
+             "Demoted blocks evicted before any demand hit")
+{
+}
+
+} // namespace replacement_policy
+} // namespace gem5
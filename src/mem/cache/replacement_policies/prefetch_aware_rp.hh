@@ -0,0 +1,129 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+
+#ifndef __MEM_CACHE_REPLACEMENT_POLICIES_PREFETCH_AWARE_RP_HH__
+#define __MEM_CACHE_REPLACEMENT_POLICIES_PREFETCH_AWARE_RP_HH__
+
+#include <memory>
+
+#include "base/statistics.hh"
+#include "mem/cache/replacement_policies/base.hh"
+
+namespace gem5
+{
+
+struct PrefetchAwareRPParams;
+
+namespace replacement_policy
+{
+
+/**
+ * Wraps a replacement policy to insert prefetched blocks at a lower
+ * priority than demand blocks.
+ *
+ * A block filled by a prefetch is demoted by the current prefetch
+ * demotion: victims are chosen among the most demoted valid candidates
+ * first, using the wrapped policy to pick one of them. A demotion of 1
+ * thus evicts unused prefetched blocks before any demand block, like an
+ * insertion at the LRU position or with a distant re-reference
+ * prediction; larger values also order prefetched blocks among
+ * themselves. The first demand hit on a prefetched block promotes it to
+ * the priority of demand blocks.
+ *
+ * The demotion can be changed at run time, e.g. by the arm of an
+ * MLPrefetchController, and applies to the blocks inserted afterwards.
+ */
+class PrefetchAware : public Base
+{
+  protected:
+    struct PrefetchAwareReplData : ReplacementData
+    {
+        /** Replacement data of the wrapped policy. */
+        std::shared_ptr<ReplacementData> replData;
+        bool valid = false;
+        /** Levels below demand blocks, 0 once promoted. */
+        unsigned demotion = 0;
+
+        PrefetchAwareReplData(
+            const std::shared_ptr<ReplacementData>& repl_data)
+          : ReplacementData(), replData(repl_data)
+        {
+        }
+    };
+
+    /** Policy ordering the blocks of the same priority. */
+    Base* const replPolicy;
+
+    /** Demotion of the prefetched blocks inserted from now on. */
+    unsigned prefetchDemotion;
+
+    mutable struct PrefetchAwareStats : public statistics::Group
+    {
+        PrefetchAwareStats(statistics::Group* parent);
+
+        /** Prefetched blocks inserted below demand priority. */
+        statistics::Scalar demotedInsertions;
+
+        /** Demoted blocks promoted by a demand hit. */
+        statistics::Scalar promotions;
+
+        /** Demoted blocks evicted before any demand hit. */
+        statistics::Scalar demotedEvictions;
+    } stats;
+
+    /** Whether pkt is a prefetch, or the response to one. */
+    static bool isPrefetch(const PacketPtr pkt);
+
+  public:
+    PARAMS(PrefetchAwareRP);
+    PrefetchAware(const Params &p);
+    ~PrefetchAware() = default;
+
+    /** Set the demotion of the prefetched blocks inserted from now on. */
+    void setPrefetchDemotion(unsigned demotion);
+
+    void invalidate(const std::shared_ptr<ReplacementData>& replacement_data)
+                                                                    override;
+    void touch(const std::shared_ptr<ReplacementData>& replacement_data,
+        const PacketPtr pkt) override;
+    void touch(const std::shared_ptr<ReplacementData>& replacement_data) const
+                                                                     override;
+    void reset(const std::shared_ptr<ReplacementData>& replacement_data,
+        const PacketPtr pkt) override;
+    void reset(const std::shared_ptr<ReplacementData>& replacement_data) const
+                                                                     override;
+    ReplaceableEntry* getVictim(const ReplacementCandidates& candidates) const
+                                                                     override;
+    std::shared_ptr<ReplacementData> instantiateEntry() override;
+};
+
+} // namespace replacement_policy
+} // namespace gem5
+
+#endif // __MEM_CACHE_REPLACEMENT_POLICIES_PREFETCH_AWARE_RP_HH__
@@ -203,6 +203,27 @@ HBMCtrl::readQueueFullPC1(unsigned int neededEntries) const
     return rdsize_new > (readBufferSize/2);
 }
 
+double
+HBMCtrl::readQueueOccupancy() const
+{
+    const unsigned int limit = readBufferSize/2;
+    if (limit == 0)
+        return 0.0;
+    return (double)std::max(pc0Int->readQueueSize + respQueue.size(),
+                            pc1Int->readQueueSize + respQueuePC1.size()) /
+        limit;
+}
+
+double
+HBMCtrl::writeQueueOccupancy() const
+{
+    const unsigned int limit = writeBufferSize/2;
+    if (limit == 0)
+        return 0.0;
+    return (double)std::max(pc0Int->writeQueueSize,
+                            pc1Int->writeQueueSize) / limit;
+}
+
 bool
 HBMCtrl::recvTimingReq(PacketPtr pkt)
 {
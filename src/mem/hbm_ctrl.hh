@@ -90,6 +90,13 @@ class HBMCtrl : public MemCtrl
   public:
     HBMCtrl(const HBMCtrlParams &p);
 
+    /**
+     * Each pseudo channel has half of the buffers, so the occupancy is
+     * that of the fuller pseudo channel, to reach 1 when either is full.
+     */
+    double readQueueOccupancy() const override;
+    double writeQueueOccupancy() const override;
+
     void pruneRowBurstTick();
     void pruneColBurstTick();
 
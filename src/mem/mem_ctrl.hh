@@ -741,6 +741,32 @@ class MemCtrl : public qos::MemCtrl
         return nextReqEvent.scheduled();
     }
 
+    /**
+     * Fraction of the read buffer in use, counting the responses still
+     * to be sent like readQueueFull() does.
+     *
+     * @return occupancy in [0, 1]
+     */
+    virtual double
+    readQueueOccupancy() const
+    {
+        return readBufferSize == 0 ? 0.0 :
+            (double)(totalReadQueueSize + respQueue.size()) /
+            readBufferSize;
+    }
+
+    /**
+     * Fraction of the write buffer in use.
+     *
+     * @return occupancy in [0, 1]
+     */
+    virtual double
+    writeQueueOccupancy() const
+    {
+        return writeBufferSize == 0 ? 0.0 :
+            (double)totalWriteQueueSize / writeBufferSize;
+    }
+
     /**
      * restart the controller
      * This can be used by interfaces to restart the
@@ -0,0 +1,175 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include "mem/probes/prefetch_trace.hh"
+
+#include <cstring>
+
+#include "base/callback.hh"
+#include "base/cprintf.hh"
+#include "base/logging.hh"
+#include "mem/cache/base.hh"
+#include "mem/cache/prefetch/ml_prefetch_controller.hh"
+#include "params/PrefetchTraceProbe.hh"
+#include "sim/byteswap.hh"
+#include "sim/core.hh"
+#include "sim/cur_tick.hh"
+
+namespace gem5
+{
+
+namespace
+{
+
+const char TraceMagic[8] = {'G', '5', 'P', 'F', 'T', 'R', '0', '1'};
+
+} // anonymous namespace
+
+PrefetchTraceProbe::PrefetchTraceProbe(const PrefetchTraceProbeParams &p)
+    : SimObject(p),
+      cache(p.cache),
+      controller(p.controller)
+{
+    std::string filename = p.trace_file.empty() ?
+        name() + ".pftrace" : p.trace_file;
+    // Binary and never gzipped, so the records can be mapped directly.
+    traceStream = simout.create(filename, true, true);
+
+    buffer.reserve(BufferRecords);
+
+    registerExitCallback([this]() { closeStream(); });
+}
+
+void
+PrefetchTraceProbe::regProbeListeners()
+{
+    ProbeManager *mgr = cache->getProbeManager();
+    listeners.push_back(
+        mgr->connect<AccessListener>(*this, "Hit", Event::Hit));
+    listeners.push_back(
+        mgr->connect<AccessListener>(*this, "Miss", Event::Miss));
+    listeners.push_back(
+        mgr->connect<AccessListener>(*this, "Fill", Event::Fill));
+}
+
+void
+PrefetchTraceProbe::startup()
+{
+    // Records store arm indices in an int8_t.
+    fatal_if(controller && controller->numArms() > INT8_MAX,
+             "%s: %s has %d arms, more than a trace record can label (%d)\n",
+             name(), controller->name(), controller->numArms(), INT8_MAX);
+
+    std::string children;
+    if (controller) {
+        for (int arm = 0; arm < controller->numArms(); ++arm) {
+            children += csprintf("%s\"%s\"", children.empty() ? "" : ", ",
+                                 controller->armName(arm));
+        }
+    }
+
+    std::string header = csprintf(
+        "{\"version\": 1, \"cache\": \"%s\", \"controller\": \"%s\", "
+        "\"children\": [%s], \"tick_freq\": %d, \"record_size\": %d}",
+        cache->name(), controller ? controller->name() : "", children,
+        sim_clock::Frequency, sizeof(Record));
+    size_t pad = (8 - (sizeof(TraceMagic) + sizeof(uint32_t) +
+                       header.size()) % 8) % 8;
+    header.append(pad, ' ');
+
+    uint32_t length = htole<uint32_t>(header.size());
+    std::ostream &os = *traceStream->stream();
+    os.write(TraceMagic, sizeof(TraceMagic));
+    os.write(reinterpret_cast<const char *>(&length), sizeof(length));
+    os.write(header.data(), header.size());
+}
+
+void
+PrefetchTraceProbe::record(const CacheAccessProbeArg &arg, Event event)
+{
+    const PacketPtr pkt = arg.pkt;
+    const bool prefetch = pkt->cmd.isHWPrefetch() || pkt->cmd.isSWPrefetch();
+
+    // Demand fills repeat what the miss already said.
+    if (event == Event::Fill && !prefetch)
+        return;
+
+    const Addr addr = pkt->getAddr();
+
+    uint8_t flags = 0;
+    if (prefetch)
+        flags |= Prefetch;
+    if (event == Event::Hit)
+        flags |= Hit;
+    if (event == Event::Fill)
+        flags |= Fill;
+    if (event == Event::Hit &&
+        arg.cache.hasBeenPrefetched(addr, pkt->isSecure()))
+        flags |= PrefetchedBlock;
+
+    Addr pc = 0;
+    if (pkt->req->hasPC()) {
+        pc = pkt->req->getPC();
+        flags |= ValidPC;
+    }
+
+    Record rec = {};
+    rec.tick = htole<uint64_t>(curTick());
+    rec.addr = htole<uint64_t>(addr);
+    rec.pc = htole<uint64_t>(pc);
+    rec.flags = flags;
+    rec.child = controller ? controller->issuingChild(addr) : -1;
+    rec.arm = controller ? controller->activeChild() : -1;
+
+    buffer.push_back(rec);
+    if (buffer.size() >= BufferRecords)
+        flush();
+}
+
+void
+PrefetchTraceProbe::flush()
+{
+    if (buffer.empty())
+        return;
+    traceStream->stream()->write(
+        reinterpret_cast<const char *>(buffer.data()),
+        buffer.size() * sizeof(Record));
+    buffer.clear();
+}
+
+void
+PrefetchTraceProbe::closeStream()
+{
+    if (!traceStream)
+        return;
+    flush();
+    simout.close(traceStream);
+    traceStream = nullptr;
+}
+
+} // namespace gem5
@@ -0,0 +1,150 @@
+/*
+ * Copyright (c) 2026 The Regents of The University of California
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef __MEM_PROBES_PREFETCH_TRACE_HH__
+#define __MEM_PROBES_PREFETCH_TRACE_HH__
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+#include "base/output.hh"
+#include "mem/cache/cache_probe_arg.hh"
+#include "sim/probe/probe.hh"
+#include "sim/sim_object.hh"
+
+namespace gem5
+{
+
+struct PrefetchTraceProbeParams;
+class BaseCache;
+
+namespace prefetch
+{
+class MLPrefetchController;
+} // namespace prefetch
+
+/**
+ * Records the access stream of a cache, labelled with prefetch
+ * information, as fixed-size binary records.
+ *
+ * The probe listens to the cache's Hit, Miss and Fill probe points. Every
+ * hit and miss is recorded, and so is every fill caused by a prefetch.
+ * When an MLPrefetchController is given, each record also carries the
+ * child whose prefetch brought the block in and the arm that was active
+ * at the time. Both are arm indices: the controller's children come
+ * first, then its Stride grid settings, and the header names them all.
+ * Records hold them in an int8_t, so the controller may have at most 127
+ * arms.
+ *
+ * The file starts with an 8-byte magic and a little-endian uint32 giving
+ * the length of a JSON header (padded so records start 8-byte aligned),
+ * followed by little-endian Record structs. util/decode_prefetch_trace.py
+ * reads it.
+ */
+class PrefetchTraceProbe : public SimObject
+{
+  public:
+    PrefetchTraceProbe(const PrefetchTraceProbeParams &params);
+
+    void regProbeListeners() override;
+    void startup() override;
+
+    enum RecordFlags : uint8_t
+    {
+        /** A prefetch request, or a fill caused by one. */
+        Prefetch = 0x01,
+        /** The access hit in the cache. */
+        Hit = 0x02,
+        /** The record is a fill rather than an access. */
+        Fill = 0x04,
+        /** The access hit a block brought in by a prefetch. */
+        PrefetchedBlock = 0x08,
+        /** The pc field is valid. */
+        ValidPC = 0x10,
+    };
+
+    struct Record
+    {
+        uint64_t tick;
+        uint64_t addr;
+        uint64_t pc;
+        uint8_t flags;
+        /** Child that prefetched the block, -1 if none or unknown. */
+        int8_t child;
+        /** Arm active when the record was taken, -1 for OFF or unknown. */
+        int8_t arm;
+        uint8_t reserved[5];
+    };
+    static_assert(sizeof(Record) == 32, "Record must be 32 bytes");
+
+  private:
+    enum class Event { Hit, Miss, Fill };
+
+    class AccessListener : public ProbeListenerArgBase<CacheAccessProbeArg>
+    {
+      public:
+        AccessListener(PrefetchTraceProbe &_parent, std::string name,
+                       Event _event)
+            : ProbeListenerArgBase(std::move(name)), parent(_parent),
+              event(_event)
+        {}
+
+        void notify(const CacheAccessProbeArg &arg) override
+        {
+            parent.record(arg, event);
+        }
+
+      private:
+        PrefetchTraceProbe &parent;
+        const Event event;
+    };
+
+    void record(const CacheAccessProbeArg &arg, Event event);
+
+    /** Write out the buffered records. */
+    void flush();
+
+    /** Flush and close the trace on exit. */
+    void closeStream();
+
+    BaseCache *cache;
+    prefetch::MLPrefetchController *controller;
+
+    OutputStream *traceStream = nullptr;
+
+    /** Records are written in batches of this many. */
+    static const size_t BufferRecords = 4096;
+    std::vector<Record> buffer;
+
+    std::vector<ProbeListenerPtr<>> listeners;
+};
+
+} // namespace gem5
+
+#endif // __MEM_PROBES_PREFETCH_TRACE_HH__
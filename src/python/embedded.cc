@@ -91,8 +91,11 @@ EmbeddedPython::getCode() const
 bool
 EmbeddedPython::addModule() const
 {
+    // Decompressing and unmarshalling is deferred until the module is
+    // actually imported.
     auto importer = py::module_::import("importer");
-    importer.attr("add_module")(abspath, modpath, getCode());
+    importer.attr("add_module")(abspath, modpath,
+            py::cpp_function([this]() { return getCode(); }));
     return true;
 }
 
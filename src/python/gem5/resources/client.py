@@ -48,6 +48,10 @@ from ..gem5_default_config import config
 from .client_api.azure_functions_client import AzureFunctionsAPIClient
 from .client_api.client_query import ClientQuery
 from .client_api.jsonclient import JSONClient
+from .manifest import (
+    lookup_resource_json,
+    record_resource_json,
+)
 
 
 def getFileContent(file_path: Path) -> Dict:
@@ -169,6 +173,14 @@ def get_resource_json_obj(
                          current build. If ``None``, filtering based on compatibility
                          is not performed.
     """
+    # A process sharing the resources resolved by another (see
+    # `gem5.resources.manifest`) does not need to query the clients again.
+    resource_json = lookup_resource_json(
+        resource_id, resource_version, clients, gem5_version
+    )
+    if resource_json is not None:
+        return resource_json
+
     _get_clientwrapper()
     if resource_version:
         client_queries = [
@@ -179,7 +191,13 @@ def get_resource_json_obj(
 
     # We will return a list when we refactor ontain_resources to handle multiple
     # resources
-    return _get_resource_json_obj_from_client(client_queries, clients)[0]
+    resource_json = _get_resource_json_obj_from_client(
+        client_queries, clients
+    )[0]
+    record_resource_json(
+        resource_id, resource_version, clients, gem5_version, resource_json
+    )
+    return resource_json
 
 
 def get_multiple_resource_json_obj(
@@ -53,9 +53,14 @@ from ..utils.progress_bar import (
 from ..utils.socks_ssl_context import get_proxy_context
 from .client import get_resource_json_obj
 from .client import list_resources as client_list_resources
+from .manifest import (
+    is_recording,
+    is_verified,
+    record_verified,
+)
 from .md5_utils import (
-    md5_dir,
-    md5_file,
+    cached_md5,
+    remove_cached_md5,
 )
 
 """
@@ -249,6 +254,13 @@ def get_resource(
     # same resources at once. The timeout here is somewhat arbitarily put at 15
     # minutes.Most resources should be downloaded and decompressed in this
     # timeframe, even on the most constrained of systems.
+    #
+    # If another process already verified the resource for this one (see
+    # `gem5.resources.manifest`) and it is unchanged, neither the lock nor
+    # the verification are needed.
+    if is_verified(to_path):
+        return
+
     with FileLock(f"{to_path}.lock", timeout=900):
         resource_json = get_resource_json_obj(
             resource_name,
@@ -258,14 +270,14 @@ def get_resource(
         )
 
         if os.path.exists(to_path):
-            if os.path.isfile(to_path):
-                md5 = md5_file(Path(to_path))
-            else:
-                md5 = md5_dir(Path(to_path))
+            # The verified md5 is kept next to the resource, so an unchanged
+            # resource is not hashed again on every call.
+            md5 = cached_md5(Path(to_path))
 
             if md5 == resource_json.get("md5sum"):
                 # In this case, the file has already been download, no need to
                 # do so again.
+                record_verified(to_path)
                 return
             elif download_md5_mismatch or "md5sum" not in resource_json:
                 # In the case the the md5sum is not present in the resource
@@ -276,6 +288,7 @@ def get_resource(
                     os.remove(to_path)
                 else:
                     shutil.rmtree(to_path)
+                remove_cached_md5(Path(to_path))
                 if "md5sum" not in resource_json:
                     warn(
                         f"The 'md5sum' field of {resource_name}, version "
@@ -449,6 +462,13 @@ def get_resource(
                 safe_extract(f, unpack_to)
             os.remove(download_dest)
 
+        # When recording resources for other processes, verify the download
+        # here so that none of them has to.
+        if is_recording() and cached_md5(Path(to_path)) == resource_json.get(
+            "md5sum"
+        ):
+            record_verified(to_path)
+
 
 def _file_uri_to_path(uri: str) -> Optional[Path]:
     """
@@ -0,0 +1,187 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A manifest of resolved and verified resources, shared between processes.
+
+Running many simulations of the same configuration in parallel (e.g., with
+``gem5.utils.multisim``) would otherwise have every process look up the same
+resources in the resource clients and take the lock of, and verify, every
+local resource again. Instead, one process records the resources it resolves
+and verifies and saves them to a manifest. Processes started with the
+``GEM5_RESOURCE_MANIFEST`` environment variable set to the path of that
+manifest reuse its entries, and only fall back to the clients and the
+downloader for resources which are not in it or which changed since.
+
+The manifest is only read by the processes using it, never written.
+"""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from .md5_utils import _stat_signature
+
+# The environment variable giving the path to the manifest to use.
+MANIFEST_ENV = "GEM5_RESOURCE_MANIFEST"
+
+_MANIFEST_VERSION = 1
+
+# The manifest being recorded by this process, if any.
+_recording: Optional[Dict[str, Any]] = None
+
+# The manifest given by `MANIFEST_ENV`, loaded on first use.
+_shared: Optional[Dict[str, Any]] = None
+
+
+def _empty_manifest() -> Dict[str, Any]:
+    return {"version": _MANIFEST_VERSION, "resources": {}, "verified": {}}
+
+
+def _query_key(
+    resource_id: str,
+    resource_version: Optional[str],
+    clients: Optional[List[str]],
+    gem5_version: Optional[str],
+) -> str:
+    return json.dumps(
+        [
+            resource_id,
+            resource_version,
+            sorted(clients) if clients else None,
+            gem5_version,
+        ]
+    )
+
+
+def _get_shared() -> Dict[str, Any]:
+    global _shared
+    if _shared is None:
+        _shared = _empty_manifest()
+        path = os.environ.get(MANIFEST_ENV)
+        if path:
+            with open(path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == _MANIFEST_VERSION:
+                _shared = manifest
+    return _shared
+
+
+def start_recording() -> None:
+    """Start recording the resources resolved and verified by this process."""
+    global _recording
+    _recording = _empty_manifest()
+
+
+def is_recording() -> bool:
+    return _recording is not None
+
+
+def stop_recording() -> Dict[str, Any]:
+    """
+    Stop recording and return the manifest recorded.
+
+    :returns: The manifest, as a JSON-serializable dictionary.
+    """
+    global _recording
+    manifest = _recording if _recording is not None else _empty_manifest()
+    _recording = None
+    return manifest
+
+
+def save_manifest(manifest: Dict[str, Any], path: Path) -> None:
+    """
+    Save a manifest returned by ``stop_recording`` to ``path``.
+
+    :param manifest: The manifest to save.
+    :param path: The path to save the manifest to.
+    """
+    tmp = Path(f"{path}.{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, path)
+
+
+def lookup_resource_json(
+    resource_id: str,
+    resource_version: Optional[str],
+    clients: Optional[List[str]],
+    gem5_version: Optional[str],
+) -> Optional[Dict]:
+    """
+    Get the resource JSON object of a query from the shared manifest.
+
+    :returns: The resource JSON object, or ``None`` if the query is not in the
+              manifest.
+    """
+    resource_json = _get_shared()["resources"].get(
+        _query_key(resource_id, resource_version, clients, gem5_version)
+    )
+    # Callers are free to modify the object they get.
+    return copy.deepcopy(resource_json)
+
+
+def record_resource_json(
+    resource_id: str,
+    resource_version: Optional[str],
+    clients: Optional[List[str]],
+    gem5_version: Optional[str],
+    resource_json: Dict,
+) -> None:
+    """Record the resource JSON object a query resolved to, if recording."""
+    if _recording is not None:
+        _recording["resources"][
+            _query_key(resource_id, resource_version, clients, gem5_version)
+        ] = copy.deepcopy(resource_json)
+
+
+def is_verified(to_path: str) -> bool:
+    """
+    Whether the shared manifest records the resource at ``to_path`` as
+    verified, and it has not changed since. Only file metadata is read.
+    """
+    signature = _get_shared()["verified"].get(os.path.abspath(to_path))
+    if signature is None:
+        return False
+    try:
+        return _stat_signature(Path(to_path)) == signature
+    except OSError:
+        return False
+
+
+def record_verified(to_path: str) -> None:
+    """Record the resource at ``to_path`` as verified, if recording."""
+    if _recording is not None:
+        _recording["verified"][os.path.abspath(to_path)] = _stat_signature(
+            Path(to_path)
+        )
@@ -26,8 +26,33 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Type
+from typing import (
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+)
+
+# Files are read in chunks of this size when hashing.
+_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files up to this size in a directory are read ahead on worker threads.
+_READ_AHEAD_MAX_SIZE = 16 * 1024 * 1024
+
+# Number of worker threads reading ahead.
+_READ_AHEAD_WORKERS = 8
+
+# Upper bounds on the data, and on the number of files, read ahead but not
+# yet hashed.
+_READ_AHEAD_MAX_BYTES = 64 * 1024 * 1024
+_READ_AHEAD_MAX_FILES = 64
+
+# Suffix of the sidecar file used by ``cached_md5``.
+_CACHE_SUFFIX = ".md5cache"
 
 
 def _md5_update_from_file(
@@ -50,21 +75,86 @@ def _md5_update_from_file(
         desc=f"Computing md5sum on {filename}",
         total=filename.stat().st_size,
     ) as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
             hash.update(chunk)
     return hash
 
 
+def _dir_entries(directory: Path) -> Iterator[Tuple[str, Optional[Path]]]:
+    """
+    Yields the ``(name, file)`` pairs hashed for a directory, in order. The
+    file is None for entries that are not regular files.
+    """
+    for path in sorted(directory.iterdir(), key=lambda p: str(p).lower()):
+        if path.is_file():
+            yield path.name, path
+        else:
+            yield path.name, None
+            if path.is_dir():
+                yield from _dir_entries(path)
+
+
+def _read_ahead_size(path: Optional[Path]) -> Optional[int]:
+    """
+    Returns the size of ``path`` if it is a file small enough to be read
+    ahead, and None otherwise.
+    """
+    if path is None:
+        return None
+    size = path.stat().st_size
+    return size if size <= _READ_AHEAD_MAX_SIZE else None
+
+
+def _read_file(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def _md5_update_from_dir(
     directory: Path, hash: Type[hashlib.md5]
 ) -> Type[hashlib.md5]:
     assert directory.is_dir()
-    for path in sorted(directory.iterdir(), key=lambda p: str(p).lower()):
-        hash.update(path.name.encode())
-        if path.is_file():
-            hash = _md5_update_from_file(path, hash)
-        elif path.is_dir():
-            hash = _md5_update_from_dir(path, hash)
+
+    # The digest covers all the names and contents as a single stream, so
+    # the hashing itself is sequential. Small files are read ahead on
+    # worker threads so that reading several files overlaps with hashing.
+    entries = [
+        (name, path, _read_ahead_size(path))
+        for name, path in _dir_entries(directory)
+    ]
+    pending = {}
+    in_flight = 0
+    ahead = 0
+    with ThreadPoolExecutor(_READ_AHEAD_WORKERS) as pool:
+        for i, (name, path, size) in enumerate(entries):
+            # Read ahead while the window has room. An empty window always
+            # takes one file, so the entry about to be hashed is read ahead
+            # even when it alone is over the byte budget.
+            ahead = max(ahead, i)
+            while (
+                ahead < len(entries) and len(pending) < _READ_AHEAD_MAX_FILES
+            ):
+                ahead_size = entries[ahead][2]
+                if ahead_size is not None:
+                    if (
+                        pending
+                        and in_flight + ahead_size > _READ_AHEAD_MAX_BYTES
+                    ):
+                        break
+                    pending[ahead] = pool.submit(_read_file, entries[ahead][1])
+                    in_flight += ahead_size
+                ahead += 1
+
+            data = None
+            if i in pending:
+                data = pending.pop(i).result()
+                in_flight -= size
+
+            hash.update(name.encode())
+            if data is not None:
+                hash.update(data)
+            elif path is not None:
+                hash = _md5_update_from_file(path, hash)
     return hash
 
 
@@ -105,3 +195,78 @@ def md5_dir(directory: Path) -> str:
         if empty files are included or filenames are changed.
     """
     return str(_md5_update_from_dir(directory, hashlib.md5()).hexdigest())
+
+
+def _stat_signature(path: Path) -> str:
+    """
+    Summarizes the size, modification and change times, and inode of
+    ``path`` and, for a directory, of everything under it. No file data is
+    read.
+    """
+    sig = hashlib.sha256()
+
+    def add(rel: str, st: os.stat_result) -> None:
+        sig.update(
+            repr(
+                (rel, st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+            ).encode()
+        )
+
+    add(".", path.stat())
+    if path.is_dir():
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(dirs + files):
+                full = os.path.join(root, name)
+                add(os.path.relpath(full, path), os.lstat(full))
+    return sig.hexdigest()
+
+
+def _cache_path(path: Path) -> Path:
+    return path.with_name(path.name + _CACHE_SUFFIX)
+
+
+def cached_md5(path: Path) -> str:
+    """
+    Gets the md5 value of a file or directory like ``md5``, but keeps it in
+    a sidecar file next to ``path`` (``<path>.md5cache``). The value is
+    reused for as long as the size, modification and change times, and
+    inode of ``path`` and of everything under it are unchanged, so an
+    unmodified resource is not read again.
+
+    :param path: The path to get the md5 of.
+    """
+    path = Path(path)
+    cache = _cache_path(path)
+    signature = _stat_signature(path)
+
+    try:
+        with open(cache) as f:
+            entry = json.load(f)
+        if entry.get("signature") == signature:
+            return entry["md5"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    value = md5(path)
+
+    # Only record the value if nothing changed while it was computed.
+    if _stat_signature(path) == signature:
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump({"signature": signature, "md5": value}, f)
+            os.replace(tmp, cache)
+        except OSError:
+            # E.g., a read-only resource directory. The value is still
+            # correct, it just will not be reused.
+            pass
+    return value
+
+
+def remove_cached_md5(path: Path) -> None:
+    """Removes the sidecar file ``cached_md5`` keeps for ``path``, if any."""
+    try:
+        os.remove(_cache_path(Path(path)))
+    except FileNotFoundError:
+        pass
@@ -23,8 +23,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF
 # THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import errno
+import fcntl
 import os
+import signal
+import threading
 import time
 
 
@@ -32,15 +34,24 @@ class FileLockException(Exception):
     pass
 
 
+class _LockTimeout(Exception):
+    pass
+
+
 class FileLock:
     """A file locking mechanism that has context-manager support so
-    you can use it in a with statement. This should be relatively cross
-    compatible as it doesn't rely on ``msvcrt`` or ``fcntl`` for the locking.
+    you can use it in a with statement. The lock is an ``fcntl`` (``flock``)
+    lock on the lock file, so it is released by the kernel when the holding
+    process exits, even if it crashes, and waiting processes are woken up as
+    soon as it is released rather than polling for it.
     """
 
     def __init__(self, file_name, timeout=10, delay=0.05):
         """Prepare the file locker. Specify the file to lock and optionally
-        the maximum timeout and the delay between each attempt to lock.
+        the maximum timeout. ``delay`` is only used when the lock is waited
+        for from a thread other than the main thread, where a blocking wait
+        cannot be interrupted at the timeout, as the delay between each
+        attempt to lock.
         """
         if timeout is not None and delay is None:
             raise ValueError(
@@ -53,51 +64,73 @@ class FileLock:
         self.delay = delay
 
     def acquire(self):
-        """Acquire the lock, if possible. If the lock is in use, it check again
-        every ``wait`` seconds. It does this until it either gets the lock or
-        exceeds ``timeout`` number of seconds, in which case it throws
-        an exception.
+        """Acquire the lock, if possible. If the lock is in use, this blocks
+        until it is released or ``timeout`` seconds have passed, in which case
+        it throws an exception. If ``timeout`` is ``None`` an exception is
+        thrown straight away.
         """
-        start_time = time.time()
-        while True:
+        fd = os.open(self.lockfile, os.O_CREAT | os.O_RDWR)
+        try:
             try:
-                self.fd = os.open(
-                    self.lockfile, os.O_CREAT | os.O_EXCL | os.O_RDWR
-                )
-                self.is_locked = True  # moved to ensure tag only when locked
-                break
-            except OSError as e:
-                if e.errno != errno.EEXIST:
-                    raise
-                solution_message = (
-                    "This is likely due to the existence"
-                    " of the lock file '{}'. If there's no other process"
-                    " the lock file, you can manually delete the lock file and"
-                    " rerun the script.".format(self.lockfile)
-                )
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
                 if self.timeout is None:
                     raise FileLockException(
-                        "Could not acquire lock on {}. {}".format(
-                            self.file_name, solution_message
-                        )
+                        "Could not acquire lock on {}. It is held by "
+                        "another process.".format(self.file_name)
                     )
-                if (time.time() - start_time) >= self.timeout:
+                if not self._wait(fd):
                     raise FileLockException(
-                        f"Timeout occured. {solution_message}"
+                        "Timeout occured waiting for the lock on {}, held "
+                        "by another process.".format(self.file_name)
                     )
+        except BaseException:
+            os.close(fd)
+            raise
+        self.fd = fd
+        self.is_locked = True
+
+    def _wait(self, fd):
+        """Block until the lock on ``fd`` is acquired. Returns ``False`` if
+        ``timeout`` seconds pass first.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            # Signals are only delivered to the main thread, so poll.
+            deadline = time.monotonic() + self.timeout
+            while time.monotonic() < deadline:
                 time.sleep(self.delay)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return True
+                except BlockingIOError:
+                    pass
+            return False
+
+        def on_alarm(signum, frame):
+            raise _LockTimeout()
 
-    #        self.is_locked = True
+        previous = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return True
+        except _LockTimeout:
+            return False
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
 
     def release(self):
-        """Get rid of the lock by deleting the lockfile.
+        """Release the lock.
 
-        When working in a ``with`` statement, this gets automatically
+        The lock file itself is left in place: removing it would let another
+        process lock a new file of the same name while the old one is still
+        locked. When working in a ``with`` statement, this gets automatically
         called at the end.
         """
         if self.is_locked:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
             os.close(self.fd)
-            os.unlink(self.lockfile)
             self.is_locked = False
 
     def __enter__(self):
@@ -118,7 +151,5 @@ class FileLock:
             self.release()
 
     def __del__(self):
-        """Make sure that the FileLock instance doesn't leave a lockfile
-        lying around.
-        """
+        """Make sure that the FileLock instance doesn't keep the lock held."""
         self.release()
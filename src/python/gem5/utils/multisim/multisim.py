@@ -47,15 +47,25 @@ config script is passed as a string referencing the config script as a module.
 This script is then passed to the child processes to load.
 
 2. The config script cannot accept parameters. It must be parameterless.
+
+3. The resources obtained by the config script are resolved and verified once,
+while determining the simulations to run, and recorded in a manifest in the
+output directory (see `gem5.resources.manifest`). The child processes reuse
+it instead of each querying the resource clients and verifying the resources
+again.
 """
 
 import importlib
+import json
 import multiprocessing
+import os
 import signal
 import time
 from multiprocessing import Lock
 from pathlib import Path
 from typing import (
+    Any,
+    Dict,
     Optional,
     Set,
 )
@@ -125,6 +135,51 @@ def _get_num_processes_child_process(
     num_processes_dict["num_processes"] = _num_processes
 
 
+def _prepare_child_process(prepared_dict, module_path: Path) -> None:
+    """Get the ids of the simulations to be run, the number of processes to
+    run them with and the manifest of the resources they obtain.
+
+    Like `_get_simulator_ids_child_process`, this is run in a child process
+    which loads the module (config script). Loading it obtains the resources
+    it uses, which are recorded as they are resolved and verified.
+    """
+    from ...resources import manifest
+
+    manifest.start_recording()
+    _load_module(module_path)
+    global _multi_sim, _num_processes
+    prepared_dict["ids"] = [sim.get_id() for sim in _multi_sim]
+    prepared_dict["num_processes"] = _num_processes
+    # Sent as a string as the manager only pickles the top level.
+    prepared_dict["manifest"] = json.dumps(manifest.stop_recording())
+
+
+def prepare(config_module_path: Path) -> Dict[str, Any]:
+    """Load the config script once, in a child process, to determine the ids
+    of the simulations to run and the number of processes to use, and to
+    obtain the resources the simulations use.
+
+    This does the work of `get_simulator_ids` and `get_num_processes` in a
+    single child process.
+
+    :returns: A dictionary with the "ids", the "num_processes" and the
+              resource "manifest" (see `gem5.resources.manifest`).
+    """
+    manager = multiprocessing.Manager()
+    prepared_dict = manager.dict()
+    p = multiprocessing.Process(
+        target=_prepare_child_process,
+        args=(prepared_dict, config_module_path),
+    )
+    p.start()
+    p.join()
+    return {
+        "ids": prepared_dict["ids"],
+        "num_processes": prepared_dict["num_processes"],
+        "manifest": json.loads(prepared_dict["manifest"]),
+    }
+
+
 def get_simulator_ids(config_module_path: Path) -> list[str]:
     """This is a  hack to determine the IDs of the simulations we are to run.
     The only way we can know is by importing the module, which we can only do
@@ -197,9 +252,11 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
     )
 
     # Get the simulator IDs. This both provides us a list of targets
-    # and, by-proxy, the number of jobs.
-    ids = get_simulator_ids(module_path)
-    max_num_processes = get_num_processes(module_path)
+    # and, by-proxy, the number of jobs. This also resolves and verifies the
+    # resources used, once for all the simulations.
+    prepared = prepare(module_path)
+    ids = prepared["ids"]
+    max_num_processes = prepared["num_processes"]
 
     assert len(_multi_sim) == 0, (
         "Simulators instantiated in main thread instead of child thread "
@@ -211,6 +268,17 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
         "configuration script."
     )
 
+    # Share the resources resolved with the child processes, which inherit
+    # the environment.
+    import m5
+
+    from ...resources import manifest
+
+    os.makedirs(m5.options.outdir, exist_ok=True)
+    manifest_path = Path(m5.options.outdir) / "resource_manifest.json"
+    manifest.save_manifest(prepared["manifest"], manifest_path)
+    os.environ[manifest.MANIFEST_ENV] = str(manifest_path.absolute())
+
     active_processes = []
     remaining_ids = list(ids).copy()
     process_lock = Lock()
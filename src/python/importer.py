@@ -44,7 +44,9 @@ class ByteCodeLoader(importlib.abc.Loader):
 
 # Simple importer that allows python to import data from a dict of
 # code objects.  The keys are the module path, and the items are the
-# filename and bytecode of the file.
+# filename and bytecode of the file.  The bytecode can also be given as a
+# callable returning it, which is then only called the first time the
+# module is imported.
 class CodeImporter:
     def __init__(self):
         self.modules = {}
@@ -62,6 +64,9 @@ class CodeImporter:
             return None
 
         abspath, code = self.modules[fullname]
+        if callable(code):
+            code = code()
+            self.modules[fullname] = (abspath, code)
 
         if self.override and os.path.exists(abspath):
             src = open(abspath).read()
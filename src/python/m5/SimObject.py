@@ -210,6 +210,10 @@ class MetaSimObject(type):
         # translate to the new type.
         cls._deprecated_params = multidict()
 
+        # Names of the params whose type is a subclass of a given SimObject
+        # type, filled in lazily by _params_of_type(). Dict[type, List[str]]
+        cls._param_type_index = {}
+
         # class or instance attributes
         cls._values = multidict()  # param values
         cls._hr_values = multidict()  # human readable param values
@@ -314,6 +318,7 @@ class MetaSimObject(type):
         assert not hasattr(pdesc, "name")
         pdesc.name = name
         cls._params[name] = pdesc
+        cls._param_type_index.clear()
         if hasattr(pdesc, "default"):
             cls._set_param(name, pdesc.default, pdesc)
 
@@ -755,6 +760,14 @@ class SimObject(metaclass=MetaSimObject):
         self._instantiated = False  # really "cloned"
         self._init_called = True  # Checked so subclasses don't forget __init__
 
+        # Set by freezeHierarchy() once the hierarchy can no longer change
+        self._frozen_path = None
+        self._frozen_descendants = None
+
+        # Children that are instances of a given type, filled in lazily by
+        # _children_of_type(). Dict[type, List[SimObject]]
+        self._child_type_index = {}
+
         # Clone children specified at class level.  No need for a
         # multidict here since we will be cloning everything.
         # Do children before parameter values so that children that
@@ -976,6 +989,7 @@ class SimObject(metaclass=MetaSimObject):
         child = self._children[name]
         child.clear_parent(self)
         del self._children[name]
+        self._child_type_index.clear()
 
     # Add a new child to this object.
     def add_child(self, name, child):
@@ -996,6 +1010,7 @@ class SimObject(metaclass=MetaSimObject):
         if not isNullPointer(child):
             child.set_parent(self, name)
             self._children[name] = child
+            self._child_type_index.clear()
 
     # Take SimObject-valued parameters that haven't been explicitly
     # assigned as children and make them children of the object that
@@ -1014,6 +1029,8 @@ class SimObject(metaclass=MetaSimObject):
                 self.add_child(key, val)
 
     def path(self):
+        if self._frozen_path is not None:
+            return self._frozen_path
         if not self._parent:
             return f"<orphan {self.__class__}>"
         elif isinstance(self._parent, MetaSimObject):
@@ -1040,17 +1057,46 @@ class SimObject(metaclass=MetaSimObject):
     def ini_str(self):
         return self.path()
 
+    # find_any() is called on every ancestor of an object for each of its
+    # Parent.any params, so objects with many children (e.g., the system
+    # of a many-core board) would otherwise be rescanned for every proxy.
+    # Both lookups below are cached per type.
+    def _children_of_type(self, ptype):
+        matches = self._child_type_index.get(ptype)
+        if matches is None:
+            matches = [
+                child
+                for child in self._children.values()
+                if isinstance(child, ptype)
+            ]
+            self._child_type_index[ptype] = matches
+        return matches
+
+    def _params_of_type(self, ptype):
+        index = self.__class__._param_type_index
+        pnames = index.get(ptype)
+        if pnames is None:
+            # DictParams are not supported
+            pnames = [
+                pname
+                for pname, pdesc in self._params.items()
+                if not isinstance(pdesc, DictParamDesc)
+                and issubclass(pdesc.ptype, ptype)
+            ]
+            index[ptype] = pnames
+        return pnames
+
     def find_any(self, ptype):
         if isinstance(self, ptype):
             return self, True
 
         found_obj = None
-        for child in self._children.values():
+        for child in self._children_of_type(ptype):
             visited = False
             if hasattr(child, "_visited"):
                 visited = getattr(child, "_visited")
 
-            if isinstance(child, ptype) and not visited:
+            if not visited:
                 if found_obj != None and child != found_obj:
                     raise AttributeError(
                         "parent.any matched more than one: %s %s"
@@ -1058,19 +1104,14 @@ class SimObject(metaclass=MetaSimObject):
                     )
                 found_obj = child
         # search param space
-        for pname, pdesc in self._params.items():
-            if isinstance(pdesc, DictParamDesc):
-                # DictParams are not supported
-                continue
-
-            if issubclass(pdesc.ptype, ptype):
-                match_obj = self._values[pname]
-                if found_obj != None and found_obj != match_obj:
-                    raise AttributeError(
-                        "parent.any matched more than one: %s and %s"
-                        % (found_obj.path, match_obj.path)
-                    )
-                found_obj = match_obj
+        for pname in self._params_of_type(ptype):
+            match_obj = self._values[pname]
+            if found_obj != None and found_obj != match_obj:
+                raise AttributeError(
+                    "parent.any matched more than one: %s and %s"
+                    % (found_obj.path, match_obj.path)
+                )
+            found_obj = match_obj
         return found_obj, found_obj != None
 
     def find_all(self, ptype):
@@ -1095,15 +1136,10 @@ class SimObject(metaclass=MetaSimObject):
                     child_all, done = child.find_all(ptype)
                     all.update(dict(zip(child_all, [done] * len(child_all))))
         # search param space
-        for pname, pdesc in self._params.items():
-            if isinstance(pdesc, DictParamDesc):
-                # DictParams are not supported
-                continue
-
-            if issubclass(pdesc.ptype, ptype):
-                match_obj = self._values[pname]
-                if not isproxy(match_obj) and not isNullPointer(match_obj):
-                    all[match_obj] = True
+        for pname in self._params_of_type(ptype):
+            match_obj = self._values[pname]
+            if not isproxy(match_obj) and not isNullPointer(match_obj):
+                all[match_obj] = True
         # Also make sure to sort the keys based on the objects' path to
         # ensure that the order is the same on all hosts
         return sorted(all.keys(), key=lambda o: o.path()), True
@@ -1307,6 +1343,9 @@ class SimObject(metaclass=MetaSimObject):
         return self._ccObject
 
     def descendants(self):
+        if self._frozen_descendants is not None:
+            yield from self._frozen_descendants
+            return
         yield self
         # The order of the dict is implementation dependent, so sort
         # it based on the key (name) to ensure the order is the same
@@ -1314,6 +1353,18 @@ class SimObject(metaclass=MetaSimObject):
         for name, child in sorted(self._children.items()):
             yield from child.descendants()
 
+    # Walk the hierarchy once and cache the list of descendants and the path
+    # of each of them. This is done once all params are fixed, after which
+    # the hierarchy must not change. Returns the list of descendants.
+    def freezeHierarchy(self):
+        objs = list(self.descendants())
+        # Parents come before their children, so each path() call only
+        # appends to the already frozen path of the parent.
+        for obj in objs:
+            obj._frozen_path = obj.path()
+        self._frozen_descendants = objs
+        return objs
+
     # Call C++ to create C++ object corresponding to this object
     def createCCObject(self):
         if self.abstract:
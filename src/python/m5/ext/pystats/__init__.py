@@ -30,7 +30,10 @@ from .group import (
     SimObjectGroup,
     SimObjectVectorGroup,
 )
-from .jsonloader import JsonLoader
+from .jsonloader import (
+    JsonLoader,
+    LazySimStat,
+)
 from .serializable_stat import SerializableStat
 from .simstat import SimStat
 from .statistic import (
@@ -25,13 +25,25 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import json
+import re
+from functools import lru_cache
 from json.decoder import JSONDecodeError
 from typing import (
     IO,
+    Any,
+    Dict,
+    List,
+    Pattern,
+    Tuple,
     Union,
 )
 
-from .group import Group
+from .abstract_stat import AbstractStat
+from .group import (
+    Group,
+    SimObjectGroup,
+    SimObjectVectorGroup,
+)
 from .simstat import SimStat
 from .statistic import (
     Distribution,
@@ -39,6 +51,45 @@ from .statistic import (
     Statistic,
 )
 
+_STATISTIC_TYPES = (
+    "Scalar",
+    "Distribution",
+    "Vector",
+    "Vector2d",
+    "SparseHist",
+)
+
+
+def _json_to_simstat(d: dict) -> Union[SimStat, Statistic, Group]:
+    if "type" in d:
+        if d["type"] == "Scalar":
+            d.pop("type", None)
+            return Scalar(**d)
+
+        elif d["type"] == "Distribution":
+            d.pop("type", None)
+            return Distribution(**d)
+
+        elif d["type"] == "Group":
+            return Group(**d)
+
+        elif d["type"] == "SimObject":
+            d.pop("type", None)
+            return SimObjectGroup(**d)
+
+        elif d["type"] == "SimObjectVector":
+            return SimObjectVectorGroup(value=d["value"])
+
+        elif d["type"] == "Vector":
+            d.pop("type", None)
+            d.pop("time_conversion", None)
+            return Vector(d)
+
+        else:
+            raise ValueError(f"SimStat object has invalid type {d['type']}")
+    else:
+        return SimStat(**d)
+
 
 class JsonLoader(json.JSONDecoder):
     """
@@ -61,29 +112,7 @@ class JsonLoader(json.JSONDecoder):
         super().__init__(self, object_hook=self.__json_to_simstat)
 
     def __json_to_simstat(self, d: dict) -> Union[SimStat, Statistic, Group]:
-        if "type" in d:
-            if d["type"] == "Scalar":
-                d.pop("type", None)
-                return Scalar(**d)
-
-            elif d["type"] == "Distribution":
-                d.pop("type", None)
-                return Distribution(**d)
-
-            elif d["type"] == "Group":
-                return Group(**d)
-
-            elif d["type"] == "Vector":
-                d.pop("type", None)
-                d.pop("time_conversion", None)
-                return Vector(d)
-
-            else:
-                raise ValueError(
-                    f"SimStat object has invalid type {d['type']}"
-                )
-        else:
-            return SimStat(**d)
+        return _json_to_simstat(d)
 
 
 def load(json_file: IO) -> SimStat:
@@ -105,3 +134,165 @@ def load(json_file: IO) -> SimStat:
 
     simstat_object = json.load(json_file, cls=JsonLoader)
     return simstat_object
+
+
+@lru_cache(maxsize=256)
+def _compile(regex: str) -> Pattern:
+    return re.compile(regex)
+
+
+def _materialize(raw: Any) -> Any:
+    """Converts a decoded JSON value into PyStats objects bottom-up, the same
+    way ``JsonLoader``'s ``object_hook`` does."""
+    if isinstance(raw, dict):
+        return _json_to_simstat({k: _materialize(v) for k, v in raw.items()})
+    if isinstance(raw, list):
+        return [_materialize(v) for v in raw]
+    return raw
+
+
+class LazySimStat:
+    """
+    A SimStat loaded from JSON where the PyStats objects are only built for
+    the parts that are asked for.
+
+    Loading decodes the JSON into plain dictionaries and indexes the path of
+    every group and statistic in a single pass. ``find()`` and ``get()``
+    search that index and only materialize the matching subtrees, which are
+    cached. Use ``materialize()`` to build the full ``SimStat``.
+
+    Usage
+    -----
+
+    .. code-block::
+
+            import m5.ext.pystats as pystats
+
+            with open(path) as f:
+                stats = pystats.jsonloader.load_lazy(f)
+
+            stats.get("system.l2cache.overallMisses")
+            stats.find("overallMisses")
+
+    """
+
+    def __init__(self, raw: Dict):
+        self._raw = raw
+        self._nodes: Dict[str, Any] = {}
+        # (name, path) for every group and statistic in the same pre-order
+        # as ``AbstractStat.children(recursive=True)``.
+        self._entries: List[Tuple[str, str]] = []
+        self._objects: Dict[str, AbstractStat] = {}
+        self._found: Dict[str, List[AbstractStat]] = {}
+        self._index(raw, "")
+
+    def _index(self, node: Dict, path: str) -> None:
+        if node.get("type") == "SimObjectVector":
+            # Vector elements are unnamed, so only their children are
+            # findable. Their paths follow gem5's "cpu0", "cpu1" naming.
+            for i, element in enumerate(node.get("value", [])):
+                if isinstance(element, dict):
+                    self._nodes[f"{path}{i}"] = element
+                    self._index(element, f"{path}{i}")
+            return
+
+        for name, child in node.items():
+            if not isinstance(child, dict):
+                continue
+            child_path = f"{path}.{name}" if path else name
+            self._nodes[child_path] = child
+            self._entries.append((name, child_path))
+            # Elements inside statistics (e.g., vector entries) are not
+            # indexed. Fetch the statistic and index it instead.
+            if child.get("type") not in _STATISTIC_TYPES:
+                self._index(child, child_path)
+
+    def paths(self) -> List[str]:
+        """The paths of all indexed groups and statistics."""
+        return list(self._nodes)
+
+    def get(self, path: str) -> AbstractStat:
+        """
+        Returns the group or statistic at a dotted path, e.g.,
+        ``system.cpu0.ipc``.
+
+        :raises KeyError: If nothing exists at ``path``.
+        """
+        if path not in self._objects:
+            self._objects[path] = _materialize(self._nodes[path])
+        return self._objects[path]
+
+    def __getitem__(self, path: str) -> AbstractStat:
+        return self.get(path)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._nodes
+
+    def find(self, regex: Union[str, Pattern]) -> List[AbstractStat]:
+        """
+        Finds all groups and statistics whose name matches ``regex``. This
+        gives the same results as ``AbstractStat.find()`` on the loaded
+        ``SimStat``, apart from elements inside statistics, which are not
+        indexed.
+
+        :param regex: The regular expression used to search. Can be a
+                precompiled regex or a string in regex format.
+        """
+        if regex not in self._found:
+            pattern = _compile(regex) if isinstance(regex, str) else regex
+            self._found[regex] = [
+                self.get(path)
+                for name, path in self._entries
+                if pattern.match(name)
+            ]
+        return list(self._found[regex])
+
+    def find_paths(self, regex: Union[str, Pattern]) -> List[str]:
+        """
+        Returns the indexed paths that ``regex`` matches from the start,
+        without materializing anything.
+        """
+        pattern = _compile(regex) if isinstance(regex, str) else regex
+        return [path for path in self._nodes if pattern.match(path)]
+
+    def materialize(self) -> SimStat:
+        """Builds the full ``SimStat``, as ``load()`` would."""
+        return _materialize(self._raw)
+
+
+def load_lazy(json_file: IO) -> LazySimStat:
+    """
+    Loads a JSON stats file as a ``LazySimStat``.
+
+    Usage
+    -----
+
+    .. code-block::
+
+            import m5.ext.pystats as pystats
+
+            with open(path) as f:
+                stats = pystats.jsonloader.load_lazy(f)
+
+    """
+
+    return LazySimStat(json.load(json_file))
+
+
+def load_lazy_dumps(json_file: IO) -> List[LazySimStat]:
+    """
+    Loads a file holding several JSON stats dumps, written one after another,
+    and returns one ``LazySimStat`` per dump.
+    """
+
+    decoder = json.JSONDecoder()
+    text = json_file.read()
+    dumps = []
+    pos = 0
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos == len(text):
+            return dumps
+        raw, pos = decoder.raw_decode(text, pos)
+        dumps.append(LazySimStat(raw))
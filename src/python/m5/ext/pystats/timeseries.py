@@ -0,0 +1,166 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Reader and writer for the compact binary stats time-series format.
+
+The file is laid out as:
+
+  * 8 bytes of magic (``MAGIC``).
+  * A little-endian ``uint32`` giving the length of the header.
+  * The header: a UTF-8 JSON object with a ``columns`` list naming every
+    value column. It is space-padded so the rows start 8-byte aligned.
+  * One fixed-width row per stats dump: a little-endian ``uint64`` tick
+    followed by one little-endian ``float64`` per column.
+
+The row layout is fixed when the file is created, so a file can be read
+straight into NumPy (see ``load()``) or row by row without NumPy (see
+``iter_rows()``).
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from typing import (
+    IO,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+MAGIC = b"G5TSER01"
+
+_HEADER_LEN = struct.Struct("<I")
+_TICK = struct.Struct("<Q")
+
+
+class TimeSeriesWriter:
+    """
+    Appends fixed-width rows to a binary stats time-series file.
+
+    The header is written on construction. Each ``write_row()`` call is
+    flushed so the file can be read while the simulation is running.
+    """
+
+    def __init__(self, fp: IO[bytes], columns: Sequence[str]):
+        """
+        :param fp: A binary file object opened for writing.
+        :param columns: The name of each value column, in row order.
+        """
+        self._fp = fp
+        self.columns = list(columns)
+
+        header = json.dumps({"version": 1, "columns": self.columns}).encode()
+        pad = -(len(MAGIC) + _HEADER_LEN.size + len(header)) % 8
+        header += b" " * pad
+
+        fp.write(MAGIC)
+        fp.write(_HEADER_LEN.pack(len(header)))
+        fp.write(header)
+        fp.flush()
+
+    def write_row(self, tick: int, values: Sequence[float]) -> None:
+        if len(values) != len(self.columns):
+            raise ValueError(
+                f"Row has {len(values)} values but the file has "
+                f"{len(self.columns)} columns."
+            )
+
+        row = array("d", values)
+        if sys.byteorder != "little":
+            row.byteswap()
+
+        self._fp.write(_TICK.pack(tick))
+        self._fp.write(row.tobytes())
+        self._fp.flush()
+
+    def close(self) -> None:
+        self._fp.close()
+
+
+def read_header(fp: IO[bytes]) -> Dict:
+    """
+    Reads the header of a time-series file, leaving ``fp`` positioned at
+    the first row.
+
+    :returns: The decoded header. ``header["columns"]`` lists the value
+              columns.
+    """
+    if fp.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a gem5 stats time-series file.")
+    (length,) = _HEADER_LEN.unpack(fp.read(_HEADER_LEN.size))
+    return json.loads(fp.read(length).decode())
+
+
+def iter_rows(fp: IO[bytes]) -> Iterator[Tuple[int, List[float]]]:
+    """
+    Yields ``(tick, values)`` for each complete row in the file. A
+    trailing partial row (e.g., from a run that is still writing) is
+    ignored.
+    """
+    columns = read_header(fp)["columns"]
+    row_size = _TICK.size + 8 * len(columns)
+
+    while True:
+        raw = fp.read(row_size)
+        if len(raw) < row_size:
+            return
+        (tick,) = _TICK.unpack_from(raw)
+        values = array("d", raw[_TICK.size :])
+        if sys.byteorder != "little":
+            values.byteswap()
+        yield tick, values.tolist()
+
+
+def load(path: str):
+    """
+    Loads a whole time-series file with NumPy.
+
+    .. code-block::
+
+            from m5.ext.pystats import timeseries
+
+            ticks, values, cols = timeseries.load("m5out/l2.tsbin")
+            misses = values[:, cols.index("system.l2cache.demandMisses::total")]
+
+    :returns: A tuple of a ``uint64`` array of dump ticks, a 2-D ``float64``
+              array with one row per dump and one column per stat value,
+              and the list of column names.
+    """
+    import numpy as np
+
+    with open(path, "rb") as fp:
+        columns = read_header(fp)["columns"]
+        offset = fp.tell()
+
+    row = np.dtype([("tick", "<u8"), ("values", "<f8", (len(columns),))])
+    count = (os.path.getsize(path) - offset) // row.itemsize
+    data = np.fromfile(path, dtype=row, count=count, offset=offset)
+    return data["tick"], data["values"].reshape(-1, len(columns)), columns
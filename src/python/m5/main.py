@@ -248,6 +248,20 @@ def parse_options():
         default="config.json",
         help="Create JSON output of the configuration [Default: %default]",
     )
+    option(
+        "--json-config-compact",
+        action="store_true",
+        default=False,
+        help="Write the JSON configuration without indentation",
+    )
+    option(
+        "--config-dedupe-dir",
+        metavar="DIR",
+        default=None,
+        help="Store the ini and JSON configurations in DIR, named by the "
+        "hash of their contents, and link to them from the output directory. "
+        "Runs with the same configuration share one copy.",
+    )
     option(
         "--dot-config",
         metavar="FILE",
@@ -315,6 +329,12 @@ def parse_options():
         split=":",
         help="Ignore EXPR sim objects",
     )
+    option(
+        "--debug-instantiate",
+        action="store_true",
+        default=False,
+        help="Print the time taken by each phase of m5.instantiate()",
+    )
     option(
         "--remote-gdb-port",
         type="int",
@@ -481,7 +501,13 @@ def main():
         debug.help()
 
     if options.list_sim_objects:
-        from . import SimObject
+        from . import (
+            SimObject,
+            objects,
+        )
+
+        # m5.objects imports modules lazily; load them all to list them.
+        objects._import_all()
 
         done = True
         print("SimObjects:")
@@ -24,6 +24,113 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-for module in __spec__.loader_state:
-    if module.startswith("m5.objects."):
-        exec(f"from {module} import *")
+# The SimObject modules in this package are imported lazily: a module is
+# only imported the first time one of the names it defines is looked up.
+# m5.objects._index, generated at build time, maps each name to the module
+# defining it. Anything not in the index (e.g., names a module re-exports
+# from m5.params), "from m5.objects import *" and dir() fall back to
+# importing every module, which is what this package used to do eagerly.
+
+import importlib as _importlib
+import sys as _sys
+from types import ModuleType as _ModuleType
+
+_modules = sorted(
+    m
+    for m in __spec__.loader_state
+    if m.startswith(f"{__name__}.") and m != f"{__name__}._index"
+)
+_all_imported = False
+
+# A name defined by several modules is bound to the one from the module
+# whose path sorts last, whatever order they are imported in. This is the
+# order the index is built in; it does not depend on the order the modules
+# were registered with the importer.
+_module_rank = {m: i for i, m in enumerate(_modules)}
+_bound_by = {}
+
+try:
+    from ._index import index as _index
+except ImportError:
+    _index = {}
+
+
+def _public_names(module):
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [n for n in vars(module) if not n.startswith("_")]
+    return names
+
+
+def _binds(module, name):
+    """
+    Whether importing ``module`` should bind ``name`` in this package: only
+    the module the index maps the name to does, and names not in the index
+    go to the last module providing them of those imported so far.
+    """
+    owner = _index.get(name)
+    if owner in _module_rank:
+        return owner == module
+    rank = _module_rank.get(module, -1)
+    if _bound_by.get(name, -1) > rank:
+        return False
+    _bound_by[name] = rank
+    return True
+
+
+class _ObjectsModule(_ModuleType):
+    def __setattr__(self, name, value):
+        # The import system binds each submodule to its name in this
+        # package once it has been loaded. Merge the submodule's public
+        # names instead, as "from m5.objects.X import *" would, so that
+        # e.g. m5.objects.BaseCPU stays the class rather than the module.
+        if (
+            isinstance(value, _ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            names = _public_names(value)
+            for n in names:
+                if _binds(value.__name__, n):
+                    super().__setattr__(n, getattr(value, n))
+            if name in names or not _binds(value.__name__, name):
+                return
+        super().__setattr__(name, value)
+
+
+def _import_all():
+    global _all_imported
+    if not _all_imported:
+        for module in _modules:
+            _importlib.import_module(module)
+        _all_imported = True
+
+
+def __getattr__(name):
+    if name == "__all__":
+        _import_all()
+        names = [n for n in globals() if not n.startswith("_")]
+        globals()["__all__"] = names
+        return names
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = _index.get(name)
+    if module in _modules and module not in _sys.modules:
+        _importlib.import_module(module)
+    if name not in globals():
+        _import_all()
+    if name not in globals():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals()[name]
+
+
+def __dir__():
+    _import_all()
+    return list(globals())
+
+
+_sys.modules[__name__].__class__ = _ObjectsModule
+
+if not _index:
+    # Built without an index: import everything up front.
+    _import_all()
@@ -198,8 +198,14 @@ class SingleTypeParamDesc(ParamDesc):
         if attr == "ptype":
             from .. import SimObject
 
-            ptype = SimObject.allClasses[self.ptype_str]
-            assert isSimObjectClass(ptype)
+            ptype = SimObject.allClasses.get(self.ptype_str)
+            if ptype is None:
+                # m5.objects imports modules on first use, so the module
+                # defining this type may not have been imported yet.
+                import m5.objects
+
+                ptype = getattr(m5.objects, self.ptype_str)
+            assert isSimObjectClass(ptype) or self.ptype_str in allParams
             self.ptype = ptype
             return ptype
 
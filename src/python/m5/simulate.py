@@ -38,8 +38,13 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import atexit
+import hashlib
+import io
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Optional
 
 from m5.objects import Root
@@ -65,6 +70,7 @@ from . import (
 from .citations import gather_citations
 from .util import (
     fatal,
+    inform,
     warn,
 )
 
@@ -75,6 +81,23 @@ _drain_manager = drain.DrainManager.instance()
 
 _instantiated = False  # Has m5.instantiate() been called?
 
+_config_writes = []  # Futures of config files still being written
+
+
+@contextmanager
+def _phase(name):
+    """Times one phase of instantiation, printing how long it took if
+    --debug-instantiate was given."""
+    from m5 import options
+
+    if not options.debug_instantiate:
+        yield
+        return
+
+    start = time.perf_counter()
+    yield
+    inform("instantiate: %s took %.3fs", name, time.perf_counter() - start)
+
 
 def _fix_all_objects(root):
     """Makes all parameters concrete of all objects that are childred of root."""
@@ -83,23 +106,70 @@ def _fix_all_objects(root):
 
     # Make sure SimObject-valued params are in the configuration
     # hierarchy so we catch them with future descendants() walks
-    for obj in root.descendants():
-        obj.adoptOrphanParams()
+    with _phase("adopting orphan params"):
+        for obj in root.descendants():
+            obj.adoptOrphanParams()
 
     # Unproxy in sorted order for determinism
-    for obj in root.descendants():
-        obj.unproxyParams()
+    with _phase("unproxying params"):
+        for obj in root.descendants():
+            obj.unproxyParams()
+
+    # The hierarchy can't change from here on, so walk it once and let all
+    # later descendants() and path() calls reuse the result.
+    with _phase("freezing the hierarchy"):
+        root.freezeHierarchy()
 
     # Initialize the global statistics
     stats.initSimStats()
 
 
+def _write_config(path: str, encode, dedupe_dir: Optional[str]) -> None:
+    """Writes a config file. If ``dedupe_dir`` is given, the contents are
+    stored once in ``dedupe_dir``, named by their hash, and ``path`` is made
+    a symlink to that file.
+
+    :param encode: Returns the contents of the file as bytes.
+    """
+    data = encode()
+    if not dedupe_dir:
+        with open(path, "wb") as f:
+            f.write(data)
+        return
+
+    digest = hashlib.sha256(data).hexdigest()
+    blob = os.path.join(
+        os.path.abspath(dedupe_dir), digest + os.path.splitext(path)[1]
+    )
+    if not os.path.exists(blob):
+        # Other runs of a sweep may be writing the same file, so write it
+        # under a private name and move it into place.
+        os.makedirs(dedupe_dir, exist_ok=True)
+        tmp = f"{blob}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, blob)
+
+    if os.path.lexists(path):
+        os.remove(path)
+    os.symlink(blob, path)
+
+
+def _wait_for_configs() -> None:
+    """Waits for the config files started by _dump_configs() to be written,
+    raising any error that occurred while writing them."""
+    while _config_writes:
+        _config_writes.pop(0).result()
+
+
 def _dump_configs(
     root,
     outdir: Optional[str] = None,
     ini_config: Optional[str] = None,
     json_config: Optional[str] = None,
     dot_config: Optional[str] = None,
+    json_compact: Optional[bool] = None,
+    dedupe_dir: Optional[str] = None,
 ):
     # Use a slightly convoluted way to set these variables for backwards
     # compatibility. Now, this function is no longer dependent on main.py and
@@ -111,7 +181,7 @@ def _dump_configs(
     if ini_config is None:
         from m5 import options
 
-        dump_config = options.dump_config
+        ini_config = options.dump_config
     if json_config is None:
         from m5 import options
 
@@ -120,31 +190,76 @@ def _dump_configs(
         from m5 import options
 
         dot_config = options.dot_config
+    if json_compact is None:
+        from m5 import options
+
+        json_compact = options.json_config_compact
+    if dedupe_dir is None:
+        from m5 import options
+
+        dedupe_dir = options.config_dedupe_dir
+
+    # The config files are encoded and written on a background thread while
+    # the dot config and the citations are produced. Everything they contain
+    # is captured here first, since the objects must not be read from
+    # another thread.
+    writes = []
 
     if ini_config:
-        ini_file = open(os.path.join(outdir, ini_config), "w")
-        # Print ini sections in sorted order for easier diffing
-        for obj in sorted(root.descendants(), key=lambda o: o.path()):
-            obj.print_ini(ini_file)
-        ini_file.close()
+        with _phase("snapshotting the ini config"):
+            ini_file = io.StringIO()
+            # Print ini sections in sorted order for easier diffing
+            for obj in sorted(root.descendants(), key=lambda o: o.path()):
+                obj.print_ini(ini_file)
+            ini = ini_file.getvalue()
+        writes.append((ini_config, ini.encode))
 
     if json_config:
-        try:
-            import json
-
-            json_file = open(os.path.join(outdir, json_config), "w")
-            d = root.get_config_as_dict()
-            json.dump(d, json_file, indent=4)
-            json_file.close()
-        except ImportError:
-            pass
+        with _phase("snapshotting the json config"):
+            try:
+                import json
+
+                # get_config_as_dict() builds a new tree of plain values, so
+                # it is safe to encode it on another thread.
+                d = root.get_config_as_dict()
+                if json_compact:
+                    encoder = json.JSONEncoder(separators=(",", ":"))
+                else:
+                    encoder = json.JSONEncoder(indent=4)
+                writes.append(
+                    (json_config, lambda: encoder.encode(d).encode())
+                )
+            except ImportError:
+                pass
+
+    if writes:
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="config-writer"
+        )
+        for name, encode in writes:
+            _config_writes.append(
+                executor.submit(
+                    _write_config,
+                    os.path.join(outdir, name),
+                    encode,
+                    dedupe_dir,
+                )
+            )
+        # Lets the queued writes finish without blocking here.
+        executor.shutdown(wait=False)
 
     if dot_config:
-        do_dot(root, outdir, dot_config)
-        do_ruby_dot(root, outdir, dot_config)
+        with _phase("writing the dot config"):
+            do_dot(root, outdir, dot_config)
+            do_ruby_dot(root, outdir, dot_config)
 
     gather_citations(root, outdir)
 
+    # A fatal() or panic() while the C++ objects are created exits without
+    # returning to Python, and the config files are needed most then.
+    with _phase("waiting for the config files"):
+        _wait_for_configs()
+
 
 def _create_cpp_objects(root, ckpt_dir):
     """Does simboject initialization.
@@ -160,40 +275,50 @@ def _create_cpp_objects(root, ckpt_dir):
     Later, in `simulate` we will call `startup` on all objects
     """
 
+    objs = list(root.descendants())
+
     # Create the C++ sim objects and connect ports
-    for obj in root.descendants():
-        obj.createCCObject()
-    for obj in root.descendants():
-        obj.connectPorts()
+    with _phase("creating C++ objects"):
+        for obj in objs:
+            obj.createCCObject()
+    with _phase("connecting ports"):
+        for obj in objs:
+            obj.connectPorts()
 
     # Do a second pass to finish initializing the sim objects
-    for obj in root.descendants():
-        obj.init()
+    with _phase("init()"):
+        for obj in objs:
+            obj.init()
 
     # Do a third pass to initialize statistics
-    stats._bindStatHierarchy(root)
-    root.regStats()
+    with _phase("registering stats"):
+        stats._bindStatHierarchy(root)
+        root.regStats()
 
     # Do a fourth pass to initialize probe points
-    for obj in root.descendants():
-        obj.regProbePoints()
+    with _phase("registering probe points"):
+        for obj in objs:
+            obj.regProbePoints()
 
     # Do a fifth pass to connect probe listeners
-    for obj in root.descendants():
-        obj.regProbeListeners()
+    with _phase("registering probe listeners"):
+        for obj in objs:
+            obj.regProbeListeners()
 
     # We're done registering statistics.  Enable the stats package now.
     stats.enable()
 
     # Restore checkpoint (if any)
     if ckpt_dir:
-        _drain_manager.preCheckpointRestore()
-        ckpt = core.getCheckpoint(ckpt_dir)
-        for obj in root.descendants():
-            obj.loadState(ckpt)
+        with _phase("loading the checkpoint"):
+            _drain_manager.preCheckpointRestore()
+            ckpt = core.getCheckpoint(ckpt_dir)
+            for obj in objs:
+                obj.loadState(ckpt)
     else:
-        for obj in root.descendants():
-            obj.initState()
+        with _phase("initState()"):
+            for obj in objs:
+                obj.initState()
 
     # Check to see if any of the stat events are in the past after resuming from
     # a checkpoint, If so, this call will shift them to be at a valid time.
@@ -52,7 +52,10 @@ from _m5 import stats as _m5_stats
 from _m5.stats import periodicStatDump
 from _m5.stats import schedStatEvent as schedEvent
 
-from .gem5stats import JsonOutputVistor
+from .gem5stats import (
+    JsonOutputVistor,
+    TimeSeriesOutputVisitor,
+)
 
 outputList = []
 
@@ -113,9 +116,12 @@ def _url_factory(schemes, enable=True):
                 else:
                     try:
                         return key, literal_eval(values[0])
-                    except ValueError:
+                    except (ValueError, SyntaxError):
+                        # E.g., an unquoted string such as a bare regex.
                         fatal(
-                            f"{url.geturl()}: {values[0]} isn't a valid Python literal"
+                            "%s: %s isn't a valid Python literal",
+                            url.geturl(),
+                            values[0],
                         )
 
             kwargs = dict([parse_value(k, v) for k, v in qs.items()])
@@ -203,6 +209,36 @@ def _jsonFactory(fn):
     return JsonOutputVistor(fn)
 
 
+@_url_factory(["tsbin"])
+def _timeSeriesFactory(fn, include=".*", exclude=None):
+    """Output selected stats as a compact binary time series.
+
+    Each stats dump appends one fixed-width row holding only the stats
+    whose full names match the include regex(es). The header lists the
+    column names, and distributions and histograms are stored with one
+    column per bucket. This keeps frequent periodic dumps cheap and the
+    output can be loaded directly with NumPy through
+    m5.ext.pystats.timeseries.load().
+
+    At most one row is written per tick, so dumping a subtree in the same
+    tick as a full dump does not add a row.
+
+    Parameters:
+      * include (str or list): Regexes matched against the start of the
+        full stat name (default: '.*')
+      * exclude (str or list): Regexes of stats to drop (default: None)
+
+    Like all parameter values, the regexes are Python literals, so they
+    must be quoted. The query is URL-decoded first, so write '+' as %2B.
+
+    Example:
+      tsbin://l2.tsbin?include=['system.l2cache.','system.cpu.ipc']
+
+    """
+
+    return TimeSeriesOutputVisitor(fn, include=include, exclude=exclude)
+
+
 def addStatVisitor(url):
     """Add a stat visitor specified using a URL string
 
@@ -429,6 +465,8 @@ def dump(roots=None, message=""):
                 output.dump(Root.getInstance())
             else:
                 output.dump(all_roots)
+        elif isinstance(output, TimeSeriesOutputVisitor):
+            output.dump()
         else:
             if output.valid():
                 output.begin(message)
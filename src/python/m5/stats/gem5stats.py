@@ -29,19 +29,27 @@ This serves as the bridge between the gem5 statistics exposed via PyBind11 and
 the Python Stats model.
 """
 
+import os
+import re
 from datetime import datetime
 from typing import (
     IO,
+    Callable,
     List,
+    Tuple,
     Union,
 )
 
+import m5
 from m5.ext.pystats.group import *
 from m5.ext.pystats.simstat import *
 from m5.ext.pystats.statistic import *
 from m5.ext.pystats.storagetype import *
-from m5.objects import *
+from m5.ext.pystats.timeseries import TimeSeriesWriter
+from m5.objects import Root
 from m5.params import SimObjectVector
+from m5.SimObject import SimObject
+from m5.util import warn
 
 from _m5 import stats as _m5_stats
 
@@ -84,6 +92,163 @@ class JsonOutputVistor:
             simstat.dump(fp=fp, **self.json_args)
 
 
+class TimeSeriesOutputVisitor:
+    """
+    A stat visitor that appends one fixed-width binary row per stats dump,
+    holding only the stats whose names match a set of regular expressions.
+    See ``m5.ext.pystats.timeseries`` for the file format and readers.
+
+    The set of columns is fixed at the first dump. Every later dump writes
+    all of the selected stats, even when only a subtree was requested, so
+    at most one row is written per tick: a dump in the same tick as the
+    last row (e.g., ``m5.stats.dump(roots=...)`` of a subtree) is skipped.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        include: Union[str, List[str]] = ".*",
+        exclude: Union[str, List[str], None] = None,
+    ):
+        """
+        :param file: The output file. Relative paths are taken relative to
+                     the simulation output directory.
+        :param include: A regex, or list of regexes, matched against the
+                        start of each full stat name (e.g.,
+                        ``system.l2cache.demandMisses``).
+        :param exclude: Optional regex, or list of regexes, of stats to drop
+                        from the included set.
+        """
+
+        self.file = file
+        self._include = self._compile(include)
+        self._exclude = self._compile(exclude) if exclude else None
+        self._writer = None
+        self._readers: List[Callable[[], List[float]]] = []
+        self._last_tick: Optional[int] = None
+
+    @staticmethod
+    def _compile(patterns: Union[str, List[str]]) -> re.Pattern:
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+    def _selected(self, name: str) -> bool:
+        if not self._include.match(name):
+            return False
+        return not (self._exclude and self._exclude.match(name))
+
+    def _open(self, root: _m5_stats.Group) -> None:
+        columns = []
+
+        def visit(path: str, group: _m5_stats.Group) -> None:
+            for stat in group.getStats():
+                name = f"{path}.{stat.name}" if path else stat.name
+                if not self._selected(name):
+                    continue
+                layout = _timeseries_layout(name, stat)
+                if layout is None:
+                    warn(
+                        f"{self.file}: can't record '{name}' as a time "
+                        "series, skipping it."
+                    )
+                    continue
+                names, reader = layout
+                columns.extend(names)
+                self._readers.append(reader)
+
+            for child_name, child in group.getStatGroups().items():
+                visit(f"{path}.{child_name}" if path else child_name, child)
+
+        visit("", root)
+
+        path = os.path.join(m5.options.outdir, self.file)
+        self._writer = TimeSeriesWriter(open(path, "wb"), columns)
+
+    def dump(self) -> None:
+        """
+        Appends a row with the current values of the selected stats, unless
+        a row was already written in this tick.
+
+        .. warning::
+
+            This dump assumes the statistics have already been prepared.
+        """
+
+        tick = m5.curTick()
+        if tick == self._last_tick:
+            return
+
+        if self._writer is None:
+            self._open(Root.getInstance())
+
+        values = []
+        for reader in self._readers:
+            values.extend(reader())
+        self._writer.write_row(tick, values)
+        self._last_tick = tick
+
+
+def _timeseries_layout(
+    name: str, statistic: _m5_stats.Info
+) -> Optional[Tuple[List[str], Callable[[], List[float]]]]:
+    """
+    Returns the column names a stat occupies in a time-series row, and a
+    function reading its current values in that order. Returns ``None`` for
+    stats without a fixed number of values (sparse histograms).
+    """
+
+    if isinstance(statistic, _m5_stats.ScalarInfo):
+        return [name], lambda: [statistic.value]
+
+    if isinstance(statistic, _m5_stats.VectorInfo):
+        # Also covers formulas, which are vectors of results.
+        size = statistic.size
+        if size == 1 and isinstance(statistic, _m5_stats.FormulaInfo):
+            return [name], lambda: list(statistic.value)
+
+        subnames = statistic.subnames
+        names = [
+            f"{name}::{subnames[i] if i < len(subnames) and subnames[i] else i}"
+            for i in range(size)
+        ]
+        names.append(f"{name}::total")
+        return names, lambda: list(statistic.value) + [statistic.total]
+
+    if isinstance(statistic, _m5_stats.Vector2dInfo):
+        names = [
+            f"{name}::{x}::{y}"
+            for x in range(statistic.x_size)
+            for y in range(statistic.y_size)
+        ]
+        return names, lambda: list(statistic.value)
+
+    if isinstance(statistic, _m5_stats.DistInfo):
+        # Histograms rescale their buckets as samples arrive, so record
+        # the bucket geometry with each row rather than in the header.
+        buckets = [f"{name}::{i}" for i in range(len(statistic.values))]
+        names = (
+            [f"{name}::min_val", f"{name}::bucket_size", f"{name}::underflow"]
+            + buckets
+            + [f"{name}::overflow", f"{name}::sum", f"{name}::squares"]
+        )
+
+        def read() -> List[float]:
+            return (
+                [
+                    statistic.min_val,
+                    statistic.bucket_size,
+                    statistic.underflow,
+                ]
+                + list(statistic.values)
+                + [statistic.overflow, statistic.sum, statistic.squares]
+            )
+
+        return names, read
+
+    return None
+
+
 def __get_statistic(statistic: _m5_stats.Info) -> Optional[Statistic]:
     """
     Translates a _m5.stats.Info object into a Statistic object, to process
@@ -218,11 +218,11 @@ def get_node_type(simNode):
         return NodeType.SYS
     # NULL ISA has no BaseCPU or PioDevice, so check if these names
     # exists before using them
-    elif "BaseCPU" in dir(m5.objects) and isinstance(
+    elif hasattr(m5.objects, "BaseCPU") and isinstance(
         simNode, m5.objects.BaseCPU
     ):
         return NodeType.CPU
-    elif "PioDevice" in dir(m5.objects) and isinstance(
+    elif hasattr(m5.objects, "PioDevice") and isinstance(
         simNode, m5.objects.PioDevice
     ):
         return NodeType.DEV
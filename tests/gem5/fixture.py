@@ -259,6 +259,9 @@ class Gem5Fixture(SConsFixture):
         build_target = self.target
         return build_target
 
+    def cache_inputs(self):
+        return [self.path]
+
 
 class MakeFixture(Fixture):
     def __init__(self, directory, *args, **kwargs):
@@ -313,6 +316,9 @@ class TestProgram(MakeTarget):
         self.path = joinpath(make_dir, target)
         self.recompile = recompile
 
+    def cache_inputs(self):
+        return [self.path]
+
     def setup(self, testitem):
         # Check if the program exists if it does then only compile if
         # recompile was given.
@@ -350,6 +356,9 @@ class DownloadedProgram(UniqueFixture):
         self.name = "Downloaded:" + self.filename
         self.gzip_decompress = gzip_decompress
 
+    def cache_inputs(self):
+        return [self.url, self.filename]
+
     def _download(self):
         import errno
 
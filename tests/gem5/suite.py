@@ -123,6 +123,7 @@ def gem5_verify_config(
                 gem5_execution = TestFunction(
                     _create_test_run_gem5(config, config_args, gem5_args),
                     name=_name,
+                    cache_inputs=_cache_inputs(config, config_args, gem5_args),
                 )
                 tests.append(gem5_execution)
 
@@ -154,6 +155,14 @@ def gem5_verify_config(
     return testsuites
 
 
+def _cache_inputs(config, config_args, gem5_args):
+    if gem5_args is None:
+        gem5_args = ()
+    elif isinstance(gem5_args, str):
+        gem5_args = (gem5_args,)
+    return [config, *config_args, *gem5_args]
+
+
 def _create_test_run_gem5(config, config_args, gem5_args):
     def test_run_gem5(params):
         """
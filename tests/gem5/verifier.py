@@ -61,10 +61,17 @@ class Verifier:
         # traces easier to understand.
         self.test(*args, **kwargs)
 
+    def cache_inputs(self):
+        # Files (e.g., gold standards) this verifier compares against.
+        return ()
+
     def instantiate_test(self, name_pfx):
         name = "-".join([name_pfx, self.__class__.__name__])
         return test_util.TestFunction(
-            self._test, name=name, fixtures=self.fixtures
+            self._test,
+            name=name,
+            fixtures=self.fixtures,
+            cache_inputs=self.cache_inputs(),
         )
 
 
@@ -103,6 +110,9 @@ class MatchGoldStandard(Verifier):
 
         self.ignore_regex = _iterable_regex(ignore_regex)
 
+    def cache_inputs(self):
+        return [self.standard_filename]
+
     def test(self, params):
         # We need a tempdir fixture from our parent verifier suite.
         fixtures = params.fixtures
@@ -298,6 +308,9 @@ class MatchJSONStats(Verifier):
         self.test_name = test_name
         self.test_name_in_outdir = test_name_in_outdir
 
+    def cache_inputs(self):
+        return [self.truth_name]
+
     def _compare_stats(self, trusted_file, test_file):
         trusted_stats = json.load(trusted_file)
         test_stats = json.load(test_file)
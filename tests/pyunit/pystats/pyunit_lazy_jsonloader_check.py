@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import json
+import unittest
+
+from m5.ext.pystats import (
+    Group,
+    Scalar,
+    SimObjectGroup,
+    SimStat,
+)
+from m5.ext.pystats.jsonloader import (
+    load_lazy,
+    load_lazy_dumps,
+)
+
+
+def _scalar(value):
+    return {"type": "Scalar", "value": value, "description": "a stat"}
+
+
+def _mock_dump(misses):
+    return {
+        "simulated_end_time": 100,
+        "system": {
+            "type": "SimObject",
+            "name": "system",
+            "cpu": {
+                "type": "SimObjectVector",
+                "value": [
+                    {"type": "SimObject", "ipc": _scalar(1.5)},
+                    {"type": "SimObject", "ipc": _scalar(0.5)},
+                ],
+            },
+            "l2cache": {
+                "type": "SimObject",
+                "name": "l2cache",
+                "overallMisses": _scalar(misses),
+                "demand": {"type": "Group", "overallMisses": _scalar(3)},
+            },
+        },
+    }
+
+
+class LazyJsonLoaderTestSuite(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stats = load_lazy(io.StringIO(json.dumps(_mock_dump(7))))
+
+    def test_get(self):
+        misses = self.stats.get("system.l2cache.overallMisses")
+        self.assertIsInstance(misses, Scalar)
+        self.assertEqual(7, misses.value)
+        self.assertIsInstance(self.stats["system.l2cache"], SimObjectGroup)
+        self.assertIsInstance(self.stats["system.l2cache.demand"], Group)
+
+    def test_get_is_cached(self):
+        self.assertIs(
+            self.stats.get("system.l2cache"), self.stats.get("system.l2cache")
+        )
+
+    def test_vector_paths(self):
+        self.assertEqual(0.5, self.stats.get("system.cpu1.ipc").value)
+        self.assertIn("system.cpu0", self.stats)
+        self.assertNotIn("system.cpu2", self.stats)
+
+    def test_find(self):
+        found = self.stats.find("overallMisses")
+        self.assertEqual([7, 3], [stat.value for stat in found])
+        self.assertEqual([1.5, 0.5], [s.value for s in self.stats.find("ipc")])
+
+    def test_find_paths(self):
+        self.assertEqual(
+            ["system.cpu0.ipc", "system.cpu1.ipc"],
+            self.stats.find_paths(r"system\.cpu\d+\.ipc"),
+        )
+
+    def test_materialize(self):
+        simstat = self.stats.materialize()
+        self.assertIsInstance(simstat, SimStat)
+        self.assertEqual(7, simstat.system.l2cache.overallMisses.value)
+
+    def test_multiple_dumps(self):
+        text = "\n".join(json.dumps(_mock_dump(n)) for n in (1, 2, 3))
+        dumps = load_lazy_dumps(io.StringIO(text + "\n"))
+        self.assertEqual(
+            [1, 2, 3],
+            [d.get("system.l2cache.overallMisses").value for d in dumps],
+        )
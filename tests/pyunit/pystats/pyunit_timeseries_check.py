@@ -0,0 +1,70 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import unittest
+
+from m5.ext.pystats import timeseries
+
+
+class TimeSeriesTestSuite(unittest.TestCase):
+    def _write(self, columns, rows) -> io.BytesIO:
+        buf = io.BytesIO()
+        writer = timeseries.TimeSeriesWriter(buf, columns)
+        for tick, values in rows:
+            writer.write_row(tick, values)
+        buf.seek(0)
+        return buf
+
+    def test_header(self):
+        columns = ["system.l2cache.demandMisses::total", "simInsts"]
+        buf = self._write(columns, [])
+        header = timeseries.read_header(buf)
+        self.assertEqual(columns, header["columns"])
+        # Rows start 8-byte aligned so they can be mapped by NumPy.
+        self.assertEqual(0, buf.tell() % 8)
+
+    def test_round_trip(self):
+        rows = [
+            (1000, [1.0, 2.5, -3.0]),
+            (2**62, [0.0, 1e300, 4.0]),
+        ]
+        buf = self._write(["a", "b", "c"], rows)
+        self.assertEqual(rows, list(timeseries.iter_rows(buf)))
+
+    def test_partial_row_ignored(self):
+        buf = self._write(["a"], [(1, [1.0]), (2, [2.0])])
+        truncated = io.BytesIO(buf.getvalue()[:-3])
+        self.assertEqual([(1, [1.0])], list(timeseries.iter_rows(truncated)))
+
+    def test_wrong_width_row(self):
+        writer = timeseries.TimeSeriesWriter(io.BytesIO(), ["a", "b"])
+        with self.assertRaises(ValueError):
+            writer.write_row(0, [1.0])
+
+    def test_bad_magic(self):
+        with self.assertRaises(ValueError):
+            timeseries.read_header(io.BytesIO(b"not a time series"))
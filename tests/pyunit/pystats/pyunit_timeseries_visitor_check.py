@@ -0,0 +1,257 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import m5
+from m5.ext.pystats import timeseries
+from m5.stats import (
+    factories,
+    gem5stats,
+)
+
+
+class _Info:
+    def __init__(self, name, **attrs):
+        self.name = name
+        self.__dict__.update(attrs)
+
+
+class _ScalarInfo(_Info):
+    pass
+
+
+class _VectorInfo(_Info):
+    pass
+
+
+class _FormulaInfo(_VectorInfo):
+    pass
+
+
+class _Vector2dInfo(_Info):
+    pass
+
+
+class _DistInfo(_Info):
+    pass
+
+
+class _SparseHistInfo(_Info):
+    pass
+
+
+class _Group:
+    def __init__(self, stats, groups=None):
+        self._stats = stats
+        self._groups = groups or {}
+
+    def getStats(self):
+        return self._stats
+
+    def getStatGroups(self):
+        return self._groups
+
+
+# Stand-ins for the stat classes of _m5.stats, which can't be created from
+# Python.
+_fake_m5_stats = SimpleNamespace(
+    Group=_Group,
+    ScalarInfo=_ScalarInfo,
+    VectorInfo=_VectorInfo,
+    FormulaInfo=_FormulaInfo,
+    Vector2dInfo=_Vector2dInfo,
+    DistInfo=_DistInfo,
+    SparseHistInfo=_SparseHistInfo,
+)
+
+
+class TimeSeriesLayoutTestSuite(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(gem5stats, "_m5_stats", _fake_m5_stats)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_scalar(self):
+        stat = _ScalarInfo("misses", value=3.0)
+        names, read = gem5stats._timeseries_layout("l2.misses", stat)
+        self.assertEqual(["l2.misses"], names)
+        self.assertEqual([3.0], read())
+        # The reader returns the current value, not the one at layout time.
+        stat.value = 4.0
+        self.assertEqual([4.0], read())
+
+    def test_vector(self):
+        stat = _VectorInfo(
+            "hits", size=2, subnames=["read", ""], value=[1.0, 2.0], total=3.0
+        )
+        names, read = gem5stats._timeseries_layout("l2.hits", stat)
+        self.assertEqual(
+            ["l2.hits::read", "l2.hits::1", "l2.hits::total"], names
+        )
+        self.assertEqual([1.0, 2.0, 3.0], read())
+
+    def test_single_formula(self):
+        stat = _FormulaInfo("ipc", size=1, subnames=[], value=[1.5], total=1.5)
+        names, read = gem5stats._timeseries_layout("cpu.ipc", stat)
+        self.assertEqual(["cpu.ipc"], names)
+        self.assertEqual([1.5], read())
+
+    def test_distribution(self):
+        stat = _DistInfo(
+            "lat",
+            values=[1.0, 2.0],
+            min_val=0.0,
+            bucket_size=10.0,
+            underflow=0.0,
+            overflow=1.0,
+            sum=25.0,
+            squares=325.0,
+        )
+        names, read = gem5stats._timeseries_layout("l2.lat", stat)
+        self.assertEqual(len(names), len(read()))
+        self.assertEqual("l2.lat::0", names[3])
+        self.assertEqual(2.0, read()[names.index("l2.lat::1")])
+
+    def test_sparse_histogram_skipped(self):
+        stat = _SparseHistInfo("sh")
+        self.assertIsNone(gem5stats._timeseries_layout("sh", stat))
+
+
+class TimeSeriesOutputVisitorTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.outdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.outdir)
+
+        self.misses = _ScalarInfo("demandMisses", value=1.0)
+        self.ipc = _ScalarInfo("ipc", value=0.5)
+        self.root = _Group(
+            [_ScalarInfo("simInsts", value=100.0)],
+            {
+                "system": _Group(
+                    [],
+                    {
+                        "l2cache": _Group(
+                            [
+                                self.misses,
+                                _ScalarInfo("demandHits", value=9.0),
+                            ]
+                        ),
+                        "cpu": _Group([self.ipc]),
+                    },
+                )
+            },
+        )
+        self.tick = 0
+
+        for patcher in (
+            patch.object(gem5stats, "_m5_stats", _fake_m5_stats),
+            patch.object(
+                gem5stats,
+                "Root",
+                SimpleNamespace(getInstance=lambda: self.root),
+            ),
+            patch.object(m5, "curTick", lambda: self.tick, create=True),
+            patch.object(
+                m5, "options", SimpleNamespace(outdir=self.outdir), create=True
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _read(self, name):
+        path = os.path.join(self.outdir, name)
+        with open(path, "rb") as f:
+            columns = timeseries.read_header(f)["columns"]
+        with open(path, "rb") as f:
+            return columns, list(timeseries.iter_rows(f))
+
+    def test_include_exclude(self):
+        visitor = gem5stats.TimeSeriesOutputVisitor(
+            "ts.bin",
+            include=["system.l2cache.", "system.cpu.ipc"],
+            exclude="system.l2cache.demandHits",
+        )
+        visitor.dump()
+        columns, _ = self._read("ts.bin")
+        self.assertEqual(
+            ["system.l2cache.demandMisses", "system.cpu.ipc"], columns
+        )
+
+    def test_rows(self):
+        visitor = gem5stats.TimeSeriesOutputVisitor(
+            "ts.bin", include="system.l2cache.demandMisses"
+        )
+        visitor.dump()
+        self.tick, self.misses.value = 1000, 5.0
+        visitor.dump()
+        _, rows = self._read("ts.bin")
+        self.assertEqual([(0, [1.0]), (1000, [5.0])], rows)
+
+    def test_one_row_per_tick(self):
+        # E.g., a full dump followed by m5.stats.dump(roots=...) of a
+        # subtree in the same tick.
+        visitor = gem5stats.TimeSeriesOutputVisitor("ts.bin", include="sim")
+        visitor.dump()
+        visitor.dump()
+        self.tick = 10
+        visitor.dump()
+        _, rows = self._read("ts.bin")
+        self.assertEqual([0, 10], [tick for tick, _ in rows])
+
+
+class TimeSeriesURLTestSuite(unittest.TestCase):
+    def _visitor(self, url):
+        return factories["tsbin"](urlsplit(url))
+
+    def test_quoted_list(self):
+        visitor = self._visitor(
+            "tsbin://l2.tsbin?include=['system.l2cache.','system.cpu.ipc']"
+        )
+        self.assertEqual("l2.tsbin", visitor.file)
+        self.assertTrue(visitor._selected("system.l2cache.demandMisses"))
+        self.assertTrue(visitor._selected("system.cpu.ipc"))
+        self.assertFalse(visitor._selected("system.cpu.numCycles"))
+
+    def test_encoded_plus(self):
+        # The query is URL-decoded, so a literal '+' must be written %2B.
+        visitor = self._visitor("tsbin://l2.tsbin?include='sys.*a%2B'")
+        self.assertTrue(visitor._selected("system.aa"))
+        visitor = self._visitor("tsbin://l2.tsbin?include='sys.*a+'")
+        self.assertFalse(visitor._selected("system.aa"))
+
+    def test_unquoted_regex(self):
+        # Values are Python literals, so a bare regex is rejected.
+        with self.assertRaises(SystemExit):
+            self._visitor("tsbin://l2.tsbin?include=system.l2cache.")
+        with self.assertRaises(SystemExit):
+            self._visitor("tsbin://l2.tsbin?include=system")
@@ -0,0 +1,96 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gem5.resources import manifest
+
+
+class ResourceManifestTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.manifest"""
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.resource = self.dir / "resource"
+        with open(self.resource, "w") as f:
+            f.write("Some test data here")
+        self.manifest_path = self.dir / "manifest.json"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+        manifest._shared = None
+
+    def _record(self) -> None:
+        manifest.start_recording()
+        manifest.record_resource_json(
+            "test-resource", None, None, "develop", {"id": "test-resource"}
+        )
+        manifest.record_verified(str(self.resource))
+        manifest.save_manifest(manifest.stop_recording(), self.manifest_path)
+        manifest._shared = None
+
+    def test_notRecordingByDefault(self) -> None:
+        self.assertFalse(manifest.is_recording())
+        manifest.record_verified(str(self.resource))
+        self.assertEqual({}, manifest.stop_recording()["verified"])
+
+    def test_sharedManifest(self) -> None:
+        self._record()
+        with patch.dict(
+            os.environ, {manifest.MANIFEST_ENV: str(self.manifest_path)}
+        ):
+            self.assertEqual(
+                {"id": "test-resource"},
+                manifest.lookup_resource_json(
+                    "test-resource", None, None, "develop"
+                ),
+            )
+            self.assertIsNone(
+                manifest.lookup_resource_json(
+                    "test-resource", "1.0.0", None, "develop"
+                )
+            )
+            self.assertTrue(manifest.is_verified(str(self.resource)))
+
+    def test_modifiedResourceNotVerified(self) -> None:
+        self._record()
+        with open(self.resource, "a") as f:
+            f.write(" and some more")
+        with patch.dict(
+            os.environ, {manifest.MANIFEST_ENV: str(self.manifest_path)}
+        ):
+            self.assertFalse(manifest.is_verified(str(self.resource)))
+
+    def test_noSharedManifest(self) -> None:
+        self._record()
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(manifest.is_verified(str(self.resource)))
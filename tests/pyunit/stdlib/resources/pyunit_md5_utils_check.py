@@ -29,10 +29,13 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from gem5.resources.md5_utils import (
+    cached_md5,
     md5_dir,
     md5_file,
+    remove_cached_md5,
 )
 
 
@@ -116,3 +119,50 @@ class MD5DirTestSuite(unittest.TestCase):
         shutil.rmtree(dir2)
 
         self.assertEqual(first_md5, second_md5)
+
+    def test_md5DirSmallReadAheadWindow(self) -> None:
+        # This test ensures the value does not depend on how many bytes are
+        # read ahead, even when the window holds less than a file.
+
+        dir = self._create_temp_directory()
+        with patch("gem5.resources.md5_utils._READ_AHEAD_MAX_BYTES", 16):
+            md5 = md5_dir(dir)
+        shutil.rmtree(dir)
+
+        self.assertEqual("ad5ac785de44c9fc2fe2798cab2d7b1a", md5)
+
+
+class CachedMD5TestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.md5_utils.cached_md5()"""
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.resource = self.dir / "resource"
+        os.mkdir(self.resource)
+        with open(self.resource / "file1", "w") as f:
+            f.write("Some test data here")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+
+    def test_cachedMd5MatchesMd5(self) -> None:
+        self.assertEqual(md5_dir(self.resource), cached_md5(self.resource))
+        self.assertTrue((self.dir / "resource.md5cache").exists())
+
+    def test_unchangedResourceNotRehashed(self) -> None:
+        expected = cached_md5(self.resource)
+        with patch("gem5.resources.md5_utils.md5", side_effect=AssertionError):
+            self.assertEqual(expected, cached_md5(self.resource))
+
+    def test_modifiedResourceRehashed(self) -> None:
+        cached_md5(self.resource)
+        with open(self.resource / "file1", "a") as f:
+            f.write(" and some more")
+        self.assertEqual(md5_dir(self.resource), cached_md5(self.resource))
+
+    def test_removeCachedMd5(self) -> None:
+        cached_md5(self.resource)
+        remove_cached_md5(self.resource)
+        self.assertFalse((self.dir / "resource.md5cache").exists())
+        # Removing a missing sidecar is not an error.
+        remove_cached_md5(self.resource)
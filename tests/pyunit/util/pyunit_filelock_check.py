@@ -0,0 +1,87 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from gem5.utils.filelock import (
+    FileLock,
+    FileLockException,
+)
+
+
+def _hold_lock(path, acquired, release) -> None:
+    with FileLock(path):
+        acquired.set()
+        release.wait()
+
+
+class FileLockTestSuite(unittest.TestCase):
+    """Test cases for gem5.utils.filelock.FileLock"""
+
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "resource")
+        self.acquired = multiprocessing.Event()
+        self.release = multiprocessing.Event()
+        self.holder = multiprocessing.Process(
+            target=_hold_lock, args=(self.path, self.acquired, self.release)
+        )
+        self.holder.start()
+        self.assertTrue(self.acquired.wait(10))
+
+    def tearDown(self) -> None:
+        if self.holder.is_alive():
+            self.release.set()
+            self.holder.join()
+        shutil.rmtree(self.dir)
+
+    def test_noTimeoutFailsImmediately(self) -> None:
+        with self.assertRaises(FileLockException):
+            FileLock(self.path, timeout=None).acquire()
+
+    def test_timeout(self) -> None:
+        start = time.monotonic()
+        with self.assertRaises(FileLockException):
+            FileLock(self.path, timeout=0.2).acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_waitsForRelease(self) -> None:
+        lock = FileLock(self.path, timeout=10)
+        self.release.set()
+        with lock:
+            self.assertTrue(lock.is_locked)
+        self.assertFalse(lock.is_locked)
+
+    def test_releasedWhenHolderDies(self) -> None:
+        self.holder.kill()
+        self.holder.join()
+        with FileLock(self.path, timeout=None) as lock:
+            self.assertTrue(lock.is_locked)
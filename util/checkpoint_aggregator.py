@@ -30,8 +30,18 @@ import gzip
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 
+PAGE_SIZE = 1 << 12
+
+# Guest memory is copied in blocks of this many bytes. Each block becomes
+# one gzip member of the compressed output, so it is also the unit of
+# parallel compression.
+BLOCK_SIZE = 16 << 20
+COMPRESS_LEVEL = 6
+
 
 class myCP(ConfigParser):
     def __init__(self):
@@ -41,28 +51,110 @@ class myCP(ConfigParser):
         return optionstr
 
 
-def aggregate(output_dir, cpts, no_compress, memory_size):
+def read_config(cpt):
+    config = myCP()
+    with open(cpt + "/m5.cpt") as f:
+        config.read_file(f)
+    return config
+
+
+class MemWriter:
+    """Writes the aggregated guest memory image.
+
+    Compressed output is written as a sequence of gzip members, one per
+    block, which zlib's gzread() (and Python's gzip module) read back as a
+    single stream. Blocks are compressed in a thread pool while the next
+    ones are being read. Uncompressed output is sparse: all-zero blocks
+    are skipped with a seek and the file is truncated to its final size.
+    """
+
+    def __init__(self, f, compress, pool, max_pending):
+        self.f = f
+        self.compress = compress
+        self.pool = pool
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.size = 0
+        self.zero_members = {}
+
+    def write(self, block):
+        self.size += len(block)
+        if not self.compress:
+            if block.count(0) == len(block):
+                self.f.seek(len(block), os.SEEK_CUR)
+            else:
+                self.f.write(block)
+            return
+
+        self.pending.append(
+            self.pool.submit(gzip.compress, block, COMPRESS_LEVEL)
+        )
+        while len(self.pending) > self.max_pending:
+            self.f.write(self.pending.popleft().result())
+
+    def pad(self, nbytes):
+        """Append nbytes of zeros."""
+        if not self.compress:
+            self.f.seek(nbytes, os.SEEK_CUR)
+            self.size += nbytes
+            return
+
+        self.flush()
+        while nbytes > 0:
+            n = min(nbytes, BLOCK_SIZE)
+            # Every full zero block compresses to the same member.
+            if n not in self.zero_members:
+                self.zero_members[n] = gzip.compress(bytes(n), COMPRESS_LEVEL)
+            self.f.write(self.zero_members[n])
+            self.size += n
+            nbytes -= n
+
+    def flush(self):
+        while self.pending:
+            self.f.write(self.pending.popleft().result())
+
+    def close(self):
+        self.flush()
+        if not self.compress:
+            self.f.truncate(self.size)
+        self.f.close()
+
+
+def copy_mem(cpt, nbytes, writer):
+    """Copy the first nbytes of a checkpoint's memory image."""
+    with gzip.open(cpt + "/system.physmem.store0.pmem", "rb") as gf:
+        while nbytes > 0:
+            block = gf.read(min(nbytes, BLOCK_SIZE))
+            if not block:
+                print(f"WARNING: {cpt} memory image is {nbytes} bytes short")
+                break
+            writer.write(block)
+            nbytes -= len(block)
+
+
+def aggregate(output_dir, cpts, no_compress, memory_size, jobs=None):
     merged_config = None
     page_ptr = 0
 
     output_path = output_dir
-    if not os.path.isdir(output_path):
-        os.system("mkdir -p " + output_path)
+    os.makedirs(output_path, exist_ok=True)
 
     agg_mem_file = open(output_path + "/system.physmem.store0.pmem", "wb+")
-    agg_config_file = open(output_path + "/m5.cpt", "wb+")
-
-    if not no_compress:
-        merged_mem = gzip.GzipFile(fileobj=agg_mem_file, mode="wb")
+    agg_config_file = open(output_path + "/m5.cpt", "w+")
 
     max_curtick = 0
     num_digits = len(str(len(cpts) - 1))
 
-    for i, arg in enumerate(cpts):
+    jobs = jobs or os.cpu_count() or 1
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    writer = MemWriter(agg_mem_file, not no_compress, pool, 2 * jobs)
+
+    # The input configs are independent, so parse them all in parallel.
+    configs = pool.map(read_config, cpts)
+
+    for i, (arg, config) in enumerate(zip(cpts, configs)):
         print(arg)
         merged_config = myCP()
-        config = myCP()
-        config.readfp(open(cpts[i] + "/m5.cpt"))
 
         for sec in config.sections():
             if re.compile("cpu").search(sec):
@@ -73,13 +165,15 @@ def aggregate(output_dir, cpts, no_compress, memory_size):
                 for item in items:
                     if item[0] == "paddr":
                         merged_config.set(
-                            newsec, item[0], int(item[1]) + (page_ptr << 12)
+                            newsec,
+                            item[0],
+                            str(int(item[1]) + (page_ptr << 12)),
                         )
                         continue
                     merged_config.set(newsec, item[0], item[1])
 
                 if re.compile("workload.FdMap256$").search(sec):
-                    merged_config.set(newsec, "M5_pid", i)
+                    merged_config.set(newsec, "M5_pid", str(i))
 
             elif sec == "system":
                 pass
@@ -101,34 +195,17 @@ def aggregate(output_dir, cpts, no_compress, memory_size):
         page_ptr = page_ptr + pages
         print("pages to be read: ", pages)
 
-        f = open(cpts[i] + "/system.physmem.store0.pmem", "rb")
-        gf = gzip.GzipFile(fileobj=f, mode="rb")
-
-        x = 0
-        while x < pages:
-            bytesRead = gf.read(1 << 12)
-            if not no_compress:
-                merged_mem.write(bytesRead)
-            else:
-                agg_mem_file.write(bytesRead)
-            x += 1
-
-        gf.close()
-        f.close()
+        copy_mem(cpts[i], pages * PAGE_SIZE, writer)
 
     merged_config.add_section("system")
-    merged_config.set("system", "pagePtr", page_ptr)
-    merged_config.set("system", "nextPID", len(cpts))
-
-    file_size = page_ptr * 4 * 1024
-    dummy_data = "".zfill(4096)
-    while file_size < memory_size:
-        if not no_compress:
-            merged_mem.write(dummy_data)
-        else:
-            agg_mem_file.write(dummy_data)
-        file_size += 4 * 1024
-        page_ptr += 1
+    merged_config.set("system", "pagePtr", str(page_ptr))
+    merged_config.set("system", "nextPID", str(len(cpts)))
+
+    file_size = page_ptr * PAGE_SIZE
+    if memory_size and file_size < memory_size:
+        pad_pages = -(-(memory_size - file_size) // PAGE_SIZE)
+        writer.pad(pad_pages * PAGE_SIZE)
+        page_ptr += pad_pages
 
     print("WARNING: ")
     print(
@@ -136,19 +213,17 @@ def aggregate(output_dir, cpts, no_compress, memory_size):
     )
     print(page_ptr, "x 4K of memory")
     merged_config.set(
-        "system.physmem.store0", "range_size", page_ptr * 4 * 1024
+        "system.physmem.store0", "range_size", str(page_ptr * PAGE_SIZE)
     )
 
     merged_config.add_section("Globals")
-    merged_config.set("Globals", "curTick", max_curtick)
+    merged_config.set("Globals", "curTick", str(max_curtick))
 
     merged_config.write(agg_config_file)
+    agg_config_file.close()
 
-    if not no_compress:
-        merged_mem.close()
-        agg_mem_file.close()
-    else:
-        agg_mem_file.close()
+    writer.close()
+    pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -164,6 +239,14 @@ if __name__ == "__main__":
     parser.add_argument("-c", "--no-compress", action="store_true")
     parser.add_argument("--cpts", nargs="+")
     parser.add_argument("--memory-size", action="store", type=int)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        type=int,
+        help="Number of threads used to read the checkpoints and compress "
+        "the memory image (default: one per CPU)",
+    )
 
     # Assume x86 ISA.  Any other ISAs would need extra stuff in this script
     # to appropriately parse their page tables and understand page sizes.
@@ -180,4 +263,5 @@ if __name__ == "__main__":
         options.cpts,
         options.no_compress,
         options.memory_size,
+        options.jobs,
     )
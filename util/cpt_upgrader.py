@@ -44,7 +44,9 @@
 # This script provides a way to migrate checkpoints to the newer repository in
 # a programmatic way. It can be imported into another script or used on the
 # command line. From the command line the script will either migrate every
-# checkpoint it finds recursively (-r option) or a single checkpoint. When a
+# checkpoint it finds recursively (-r option) or a single checkpoint. Adding
+# -j N upgrades the checkpoints found by -r in N worker processes, skipping
+# those whose tags are already current and reporting per-file times. When a
 # change is made to the gem5 repository that breaks previous checkpoints an
 # upgrade() method should be implemented in its own .py file and placed in
 # src/util/cpt_upgraders/.  For each upgrader whose tag is not present in
@@ -74,6 +76,7 @@ import glob
 import os
 import os.path as osp
 import sys
+import time
 import types
 
 verbose_print = False
@@ -87,15 +90,22 @@ def verboseprint(*args):
     print("\n")
 
 
+class CheckpointError(Exception):
+    """Raised by process_file() for a checkpoint it cannot upgrade."""
+
+
 class Upgrader:
     tag_set = set()
     untag_set = set()  # tags to remove by downgrading
     by_tag = {}
     legacy = {}
+    order = []  # all tags, dependencies first; built by load_all()
 
     def __init__(self, filename):
         self.filename = filename
-        exec(open(filename).read(), {}, self.__dict__)
+        with open(filename) as f:
+            code = compile(f.read(), filename, "exec")
+        exec(code, {}, self.__dict__)
 
         if not hasattr(self, "tag"):
             self.tag = osp.basename(filename)[:-3]
@@ -191,6 +201,61 @@ class Upgrader:
                     )
                     sys.exit(1)
 
+        Upgrader.order = Upgrader.topological_order()
+
+    @staticmethod
+    def topological_order():
+        """Order all tags so that every tag comes after its dependencies.
+        Tags are grouped in the same generations the incremental loop in
+        process_file() would apply them in when starting from no tags."""
+        done = set()
+        order = []
+        remaining = set(Upgrader.by_tag)
+        while remaining:
+            ready = sorted(
+                t
+                for t in remaining
+                if all(d in done for d in Upgrader.by_tag[t].depends)
+            )
+            if not ready:
+                print(
+                    "Error: circular dependences between tags:",
+                    " ".join(sorted(remaining)),
+                )
+                sys.exit(1)
+            order.extend(ready)
+            done.update(ready)
+            remaining.difference_update(ready)
+        return order
+
+    @staticmethod
+    def pending(tags):
+        """Tags whose upgrader or downgrader still has to run on a
+        checkpoint that has the given tags."""
+        return (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
+
+
+def read_tags(path):
+    """Read the version tags of a checkpoint without parsing the whole
+    file. Returns None if the checkpoint uses a legacy cpt_ver or the tags
+    can't be found this way."""
+    section = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("[") and line.endswith("]"):
+                section = line[1:-1]
+            elif section in ("root", "root.globals", "Globals"):
+                key, sep, value = line.partition("=")
+                if not sep:
+                    continue
+                key = key.strip()
+                if key == "cpt_ver":
+                    return None
+                if key == "version_tags" and section != "root":
+                    return set(value.split())
+    return None
+
 
 def process_file(path, **kwargs):
     if not osp.isfile(path):
@@ -237,8 +302,7 @@ def process_file(path, **kwargs):
     elif cpt.has_option("root.globals", "version_tags"):
         tags = set(("".join(cpt.get("root.globals", "version_tags"))).split())
     else:
-        print("fatal: no version information in checkpoint")
-        exit(1)
+        raise CheckpointError("no version information in checkpoint")
 
     verboseprint("has tags", " ".join(tags))
     # If the current checkpoint has a tag we don't know about, we have
@@ -254,29 +318,103 @@ def process_file(path, **kwargs):
 
     # Apply migrations for tags not in checkpoint and tags present for which
     # downgraders are present, respecting dependences
-    to_apply = (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
-    while to_apply:
-        ready = {t for t in to_apply if Upgrader.get(t).ready(tags)}
-        if not ready:
-            print("could not apply these upgrades:", " ".join(to_apply))
-            print("update dependences impossible to resolve; aborting")
-            exit(1)
-
-        for tag in ready:
-            Upgrader.get(tag).update(cpt, tags)
-            change = True
-
-        to_apply -= ready
+    to_apply = Upgrader.pending(tags)
+    for tag in Upgrader.order:
+        if tag not in to_apply:
+            continue
+        if not Upgrader.get(tag).ready(tags):
+            raise CheckpointError(
+                "could not apply these upgrades: "
+                f"{' '.join(to_apply)}; update dependences impossible to "
+                "resolve"
+            )
+
+        Upgrader.get(tag).update(cpt, tags)
+        to_apply.remove(tag)
+        change = True
 
     if not change:
         verboseprint("...nothing to do")
-        return
+        return False
 
     cpt.set("root.globals", "version_tags", " ".join(tags))
 
     # Write the old data back
     verboseprint("...completed")
-    cpt.write(open(path, "w"))
+    with open(path, "w") as f:
+        cpt.write(f)
+    return True
+
+
+def _process_file_or_exit(path, **kwargs):
+    try:
+        return process_file(path, **kwargs)
+    except CheckpointError as e:
+        print(f"fatal: {e}")
+        sys.exit(1)
+
+
+def _init_worker(verbose):
+    global verbose_print
+    verbose_print = verbose
+    # Worker processes started with "spawn" don't inherit the upgraders.
+    if not Upgrader.by_tag:
+        Upgrader.load_all()
+
+
+def _process_timed(path, kwargs):
+    start = time.perf_counter()
+    tags = read_tags(path)
+    if tags is not None and not Upgrader.pending(tags):
+        status = "current"
+    elif process_file(path, **kwargs):
+        status = "upgraded"
+    else:
+        status = "current"
+    return path, status, time.perf_counter() - start
+
+
+def process_files(paths, jobs=None, **kwargs):
+    """Upgrade many checkpoints in a pool of worker processes.
+
+    Checkpoints whose tags are already current are skipped without being
+    parsed or backed up. Prints the status and time taken for each file
+    and returns a list of (path, status, seconds) tuples. A checkpoint that
+    cannot be upgraded does not stop the others: its status is "failed",
+    its time None, and the errors are printed after the batch."""
+    from concurrent.futures import (
+        ProcessPoolExecutor,
+        as_completed,
+    )
+
+    results = []
+    errors = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(verbose_print,)
+    ) as pool:
+        futures = {pool.submit(_process_timed, p, kwargs): p for p in paths}
+        for future in as_completed(futures):
+            try:
+                path, status, seconds = future.result()
+            except (CheckpointError, OSError, configparser.Error) as e:
+                path, status, seconds = futures[future], "failed", None
+                errors.append((path, e))
+                print(f"{status:>8} {'':>9} {path}")
+            else:
+                print(f"{status:>8} {seconds:8.3f}s {path}")
+            results.append((path, status, seconds))
+
+    upgraded = sum(1 for _, status, _ in results if status == "upgraded")
+    print(
+        f"{upgraded} of {len(results)} checkpoints upgraded in "
+        f"{time.perf_counter() - start:.3f}s"
+    )
+    if errors:
+        print(f"{len(errors)} checkpoints could not be upgraded:")
+        for path, error in sorted(errors, key=lambda e: e[0]):
+            print(f"  {path}: {error}")
+    return results
 
 
 if __name__ == "__main__":
@@ -301,6 +439,15 @@ if __name__ == "__main__":
         default=True,
         help="Do no backup each checkpoint before modifying it",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Upgrade the checkpoints found with -r in parallel using this "
+        "many worker processes, skipping those already up to date and "
+        "reporting the time taken for each",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -346,21 +493,34 @@ if __name__ == "__main__":
 
     # Process a single file if we have it
     if osp.isfile(path):
-        process_file(path, **vars(args))
+        _process_file_or_exit(path, **vars(args))
     # Process an entire directory
     elif osp.isdir(path):
         cpt_file = osp.join(path, "m5.cpt")
-        if args.recurse:
+        if args.recurse and args.jobs:
+            cpts = [
+                osp.join(root, name)
+                for root, dirs, files in os.walk(path)
+                for name in files
+                if name == "m5.cpt"
+            ]
+            kwargs = vars(args)
+            results = process_files(cpts, jobs=kwargs.pop("jobs"), **kwargs)
+            if any(status == "failed" for _, status, _ in results):
+                sys.exit(1)
+        elif args.recurse:
             # Visit very file and see if it matches
             for root, dirs, files in os.walk(path):
                 for name in files:
                     if name == "m5.cpt":
-                        process_file(osp.join(root, name), **vars(args))
+                        _process_file_or_exit(
+                            osp.join(root, name), **vars(args)
+                        )
                 for dir in dirs:
                     pass
         # Maybe someone passed a cpt.XXXXXXX directory and not m5.cpt
         elif osp.isfile(cpt_file):
-            process_file(cpt_file, **vars(args))
+            _process_file_or_exit(cpt_file, **vars(args))
         else:
             print(f"Error: checkpoint file not found in {path} ")
             print("and recurse not specified")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Reader for the binary traces written by PrefetchTraceProbe.
+
+The file is an 8-byte magic, a little-endian uint32 giving the length of
+a JSON header, the header itself (padded so that records start 8-byte
+aligned), then one 32-byte record per traced event. ``iter_chunks()``
+streams the records as NumPy structured arrays so that traces larger
+than memory can be processed:
+
+.. code-block::
+
+        import decode_prefetch_trace as pft
+
+        path = "m5out/system.l2cache.pf_trace.pftrace"
+        header = pft.read_header(path)
+        for rec in pft.iter_chunks(path):
+            demand = (rec["flags"] & pft.PREFETCH) == 0
+            ...
+
+Run as a script, it prints per-arm and per-child counts.
+"""
+
+import argparse
+import json
+import struct
+
+MAGIC = b"G5PFTR01"
+
+# Record flags, see PrefetchTraceProbe::RecordFlags.
+PREFETCH = 0x01
+HIT = 0x02
+FILL = 0x04
+PREFETCHED_BLOCK = 0x08
+VALID_PC = 0x10
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+def record_dtype():
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("tick", "<u8"),
+            ("addr", "<u8"),
+            ("pc", "<u8"),
+            ("flags", "u1"),
+            ("child", "i1"),
+            ("arm", "i1"),
+            ("reserved", "V5"),
+        ]
+    )
+
+
+def _read_header(fp):
+    if fp.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a gem5 prefetch trace.")
+    (length,) = _HEADER_LEN.unpack(fp.read(_HEADER_LEN.size))
+    return json.loads(fp.read(length).decode())
+
+
+def read_header(path):
+    """
+    :returns: The decoded header: the traced cache, the controller and its
+              children (``header["children"][i]`` names child ``i``), and
+              the tick frequency.
+    """
+    with open(path, "rb") as fp:
+        return _read_header(fp)
+
+
+def iter_chunks(path, chunk_records=1 << 20):
+    """
+    Yields the records of a trace as NumPy structured arrays of at most
+    ``chunk_records`` records each. A trailing partial record (e.g., from
+    a run that is still writing) is ignored.
+    """
+    import numpy as np
+
+    dtype = record_dtype()
+    with open(path, "rb") as fp:
+        header = _read_header(fp)
+        if header["record_size"] != dtype.itemsize:
+            raise ValueError(
+                f"Unsupported record size {header['record_size']}."
+            )
+        while True:
+            raw = fp.read(chunk_records * dtype.itemsize)
+            count = len(raw) // dtype.itemsize
+            if count:
+                yield np.frombuffer(raw, dtype=dtype, count=count)
+            if count < chunk_records:
+                return
+
+
+def summarize(path):
+    """
+    :returns: A dict with, per arm and per child, the number of demand
+              accesses, demand hits, hits on prefetched blocks and
+              prefetch fills.
+    """
+    import numpy as np
+
+    def add(table, keys, name, mask):
+        ids, counts = np.unique(keys[mask], return_counts=True)
+        for i, n in zip(ids.tolist(), counts.tolist()):
+            table.setdefault(i, {}).setdefault(name, 0)
+            table[i][name] += n
+
+    arms, children = {}, {}
+    for rec in iter_chunks(path):
+        flags = rec["flags"]
+        demand = (flags & (PREFETCH | FILL)) == 0
+        hit = demand & ((flags & HIT) != 0)
+        pf_hit = hit & ((flags & PREFETCHED_BLOCK) != 0)
+        fill = (flags & FILL) != 0
+
+        add(arms, rec["arm"], "accesses", demand)
+        add(arms, rec["arm"], "hits", hit)
+        add(arms, rec["arm"], "prefetched_hits", pf_hit)
+        add(children, rec["child"], "prefetched_hits", pf_hit)
+        add(children, rec["child"], "prefetch_fills", fill)
+    return {"arms": arms, "children": children}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarise a PrefetchTraceProbe trace by arm and child."
+    )
+    parser.add_argument("trace", help="Trace file written by the probe")
+    args = parser.parse_args()
+
+    header = read_header(args.trace)
+    names = header["children"]
+
+    def label(i, none):
+        if i < 0:
+            return none
+        return f"{i} ({names[i]})" if i < len(names) else str(i)
+
+    summary = summarize(args.trace)
+    print(f"Cache: {header['cache']}")
+    for kind, title, none in (
+        ("arms", "arm", "OFF"),
+        ("children", "issuing child", "none"),
+    ):
+        print(f"Per {title}:")
+        for i, counts in sorted(summary[kind].items()):
+            fields = ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+            print(f"  {label(i, none)}: {fields}")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,8 +35,10 @@ Some common queries can be found in common_queries.py
 """
 
 import copy
+import itertools
 import json
 import os
+import re
 import shutil
 from abc import (
     ABC,
@@ -47,7 +49,9 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Optional,
     Tuple,
     Type,
     Union,
@@ -229,8 +233,15 @@ class ArtifactFileDB(ArtifactDB):
     are stored in a JSON file.
 
     This database stores a list of serialized artifacts in a JSON file.
+    New artifacts are appended, one JSON object per line, to a journal next
+    to it (the JSON file with a ".journal" suffix), and the journal is folded
+    back into the JSON file (compacted) once it holds as many artifacts as
+    the JSON file. Inserting N artifacts therefore writes O(N) data in total.
+    The database is compacted when a connection is closed with `close()`.
     This database is not thread-safe.
 
+    Lookups by UUID, hash, name and type use in-memory indexes.
+
     If the user specifies a valid path in the environment variable
     GEM5ART_STORAGE then this database will copy all artifacts to that
     directory named with their UUIDs.
@@ -243,14 +254,19 @@ class ArtifactFileDB(ArtifactDB):
             return ArtifactFileDB.ArtifactEncoder(self, obj)
 
     _json_file: Path
+    _journal_file: Path
     _uuid_artifact_map: Dict[str, Dict[str, str]]
     _hash_uuid_map: Dict[str, List[str]]
+    _name_uuid_map: Dict[str, List[str]]
+    _type_uuid_map: Dict[str, List[str]]
+    _num_compacted: int
+    _num_journaled: int
     _storage_enabled: bool
     _storage_path: Path
 
     def __init__(self, uri: str) -> None:
-        """Initialize the file-driven database from a JSON file.
-        If the file doesn't exist, a new file will be created.
+        """Initialize the file-driven database from a JSON file and its
+        journal. If the file doesn't exist, a new file will be created.
         """
         parsed_uri = urlparse(uri)
         # using urlparse to parse relative/absolute file path
@@ -260,6 +276,9 @@ class ArtifactFileDB(ArtifactDB):
         #           (netloc='path', path='/to/file')
         # so, the filepath would be netloc+path for both cases
         self._json_file = Path(parsed_uri.netloc) / Path(parsed_uri.path)
+        self._journal_file = self._json_file.with_name(
+            self._json_file.name + ".journal"
+        )
         storage_path = os.environ.get("GEM5ART_STORAGE", "")
         self._storage_enabled = True if storage_path else False
         self._storage_path = Path(storage_path)
@@ -274,9 +293,11 @@ class ArtifactFileDB(ArtifactDB):
         if self._storage_enabled:
             os.makedirs(self._storage_path, exist_ok=True)
 
-        self._uuid_artifact_map, self._hash_uuid_map = self._load_from_file(
-            self._json_file
-        )
+        self._uuid_artifact_map = {}
+        self._hash_uuid_map = {}
+        self._name_uuid_map = {}
+        self._type_uuid_map = {}
+        self._load_from_file(self._json_file, self._journal_file)
 
     def put(self, key: UUID, artifact: Dict[str, Union[str, UUID]]) -> None:
         """Insert the artifact into the database with the key."""
@@ -320,27 +341,130 @@ class ArtifactFileDB(ArtifactDB):
         dst_path = path
         shutil.copy2(src_path, dst_path)
 
-    def _load_from_file(
-        self, json_file: Path
-    ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, List[str]]]:
-        uuid_mapping: Dict[str, Dict[str, str]] = {}
-        hash_mapping: Dict[str, List[str]] = {}
+    def searchByName(self, name: str, limit: int) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some name."""
+        yield from self._limit(
+            self._get_by_index(self._name_uuid_map, name), limit
+        )
+
+    def searchByType(self, typ: str, limit: int) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some type."""
+        yield from self._limit(
+            self._get_by_index(self._type_uuid_map, typ), limit
+        )
+
+    def searchByNameType(
+        self, name: str, typ: str, limit: int
+    ) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some name and type."""
+        yield from self._limit(
+            (
+                artifact
+                for artifact in self._get_by_index(self._name_uuid_map, name)
+                if artifact.get("type") == typ
+            ),
+            limit,
+        )
+
+    def searchByLikeNameType(
+        self, name: str, typ: str, limit: int
+    ) -> Iterable[Dict[str, Any]]:
+        """Returns an iterable of all artifacts in the database that match
+        some type and a regex name."""
+        pattern = re.compile(name)
+        yield from self._limit(
+            (
+                artifact
+                for artifact in self._get_by_index(self._type_uuid_map, typ)
+                if pattern.search(str(artifact.get("name", "")))
+            ),
+            limit,
+        )
+
+    def close(self) -> None:
+        """Fold the journal into the JSON file."""
+        if self._num_journaled > 0:
+            self._compact()
+
+    @staticmethod
+    def _limit(
+        artifacts: Iterable[Dict[str, Any]], limit: int
+    ) -> Iterator[Dict[str, Any]]:
+        # As for MongoDB, a limit of 0 means no limit.
+        if limit > 0:
+            return itertools.islice(artifacts, limit)
+        return iter(artifacts)
+
+    def _get_by_index(
+        self, index: Dict[str, List[str]], key: Any
+    ) -> Iterator[Dict[str, str]]:
+        if not isinstance(key, str):
+            return
+        for the_uuid in index.get(key, []):
+            yield self._uuid_artifact_map[the_uuid]
+
+    def _index_artifact(self, artifact: Dict[str, str]) -> bool:
+        """Add an artifact to the map and the indexes. Returns False if an
+        artifact with the same UUID is already present."""
+        the_uuid = str(artifact["_id"])
+        if the_uuid in self._uuid_artifact_map:
+            return False
+        self._uuid_artifact_map[the_uuid] = artifact
+        for index, key in (
+            (self._hash_uuid_map, artifact.get("hash")),
+            (self._name_uuid_map, artifact.get("name")),
+            (self._type_uuid_map, artifact.get("type")),
+        ):
+            if isinstance(key, str):
+                index.setdefault(key, []).append(the_uuid)
+        return True
+
+    def _load_from_file(self, json_file: Path, journal_file: Path) -> None:
+        self._num_compacted = 0
+        self._num_journaled = 0
         if json_file.exists():
             with open(json_file) as f:
                 j = json.load(f)
                 for an_artifact in j:
-                    the_uuid = an_artifact["_id"]
-                    the_hash = an_artifact["hash"]
-                    uuid_mapping[the_uuid] = an_artifact
-                    if not the_hash in hash_mapping:
-                        hash_mapping[the_hash] = []
-                    hash_mapping[the_hash].append(the_uuid)
-        return uuid_mapping, hash_mapping
+                    if self._index_artifact(an_artifact):
+                        self._num_compacted += 1
+        if journal_file.exists():
+            with open(journal_file) as f:
+                for line in f:
+                    try:
+                        an_artifact = json.loads(line)
+                    except ValueError:
+                        # A line cut short by an interrupted write.
+                        continue
+                    # Artifacts of a compaction interrupted before the
+                    # journal was removed are already in the JSON file.
+                    if self._index_artifact(an_artifact):
+                        self._num_journaled += 1
 
     def _save_to_file(self, json_file: Path) -> None:
         content = list(self._uuid_artifact_map.values())
-        with open(json_file, "w") as f:
+        tmp_file = json_file.with_name(json_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
             json.dump(content, f, indent=4, cls=ArtifactFileDB.ArtifactEncoder)
+        os.replace(tmp_file, json_file)
+
+    def _append_to_journal(self, artifact: Dict[str, str]) -> None:
+        with open(self._journal_file, "a") as f:
+            f.write(
+                json.dumps(artifact, cls=ArtifactFileDB.ArtifactEncoder) + "\n"
+            )
+        self._num_journaled += 1
+
+    def _compact(self) -> None:
+        """Rewrite the JSON file with all artifacts and drop the journal."""
+        self._save_to_file(self._json_file)
+        if self._journal_file.exists():
+            os.remove(self._journal_file)
+        self._num_compacted += self._num_journaled
+        self._num_journaled = 0
 
     def has_uuid(self, the_uuid: UUID) -> bool:
         return str(the_uuid) in self._uuid_artifact_map
@@ -355,10 +479,7 @@ class ArtifactFileDB(ArtifactDB):
         yield self._uuid_artifact_map[uuid_str]
 
     def get_artifact_by_hash(self, the_hash: str) -> Iterable[Dict[str, str]]:
-        if not the_hash in self._hash_uuid_map:
-            return
-        for the_uuid in self._hash_uuid_map[the_hash]:
-            yield self._uuid_artifact_map[the_uuid]
+        yield from self._get_by_index(self._hash_uuid_map, the_hash)
 
     def insert_artifact(
         self,
@@ -377,11 +498,12 @@ class ArtifactFileDB(ArtifactDB):
             return False
         artifact_copy = copy.deepcopy(the_artifact)
         artifact_copy["_id"] = str(artifact_copy["_id"])
-        self._uuid_artifact_map[uuid_str] = artifact_copy  # type: ignore
-        if not the_hash in self._hash_uuid_map:
-            self._hash_uuid_map[the_hash] = []
-        self._hash_uuid_map[the_hash].append(uuid_str)
-        self._save_to_file(self._json_file)
+        self._index_artifact(artifact_copy)  # type: ignore
+        self._append_to_journal(artifact_copy)  # type: ignore
+        # Compacting once the journal is as large as the JSON file keeps the
+        # total amount of data written linear in the number of artifacts.
+        if self._num_journaled >= self._num_compacted:
+            self._compact()
         return True
 
     def find_exact(
@@ -392,13 +514,43 @@ class ArtifactFileDB(ArtifactDB):
         and for every (k,v) in attr, the attribute `k` of the artifact has
         the value of `v`.
         """
-        count = 0
-        if count >= limit:
+        if limit <= 0:
             return
-        for artifact in self._uuid_artifact_map.values():
+
+        # Only look at the artifacts of the smallest matching index entry, if
+        # any of the attributes are indexed.
+        candidates: Optional[List[str]] = None
+        for key, index in (
+            ("hash", self._hash_uuid_map),
+            ("name", self._name_uuid_map),
+            ("type", self._type_uuid_map),
+        ):
+            if key in attr and isinstance(attr[key], str):
+                uuids = index.get(attr[key], [])
+                if candidates is None or len(uuids) < len(candidates):
+                    candidates = uuids
+        if "_id" in attr:
+            candidates = [str(attr["_id"])]
+
+        if candidates is None:
+            artifacts: Iterable[Dict[str, Any]] = (
+                self._uuid_artifact_map.values()
+            )
+        else:
+            artifacts = (
+                self._uuid_artifact_map[the_uuid]
+                for the_uuid in candidates
+                if the_uuid in self._uuid_artifact_map
+            )
+
+        count = 0
+        for artifact in artifacts:
             # https://docs.python.org/3/library/stdtypes.html#frozenset.issubset
             if attr.items() <= artifact.items():
                 yield artifact
+                count += 1
+                if count >= limit:
+                    return
 
 
 _db = None
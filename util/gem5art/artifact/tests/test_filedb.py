@@ -31,7 +31,10 @@ import json
 import os
 import unittest
 from pathlib import Path
-from uuid import UUID
+from uuid import (
+    UUID,
+    uuid4,
+)
 
 from gem5art.artifact import Artifact
 from gem5art.artifact._artifactdb import getDBConnection
@@ -68,3 +71,73 @@ class TestArtifactFileDB(unittest.TestCase):
         artifact = artifacts[0]
         self.assertTrue(artifact["hash"] == self.artifact.hash)
         self.assertTrue(UUID(artifact["_id"]) == self.artifact._id)
+
+
+class TestArtifactFileDBJournal(unittest.TestCase):
+    def setUp(self):
+        self.db = getDBConnection("file://test-journal.json")
+        self.uuids = [uuid4() for _ in range(10)]
+        for i, the_uuid in enumerate(self.uuids):
+            self.db.put(
+                the_uuid,
+                {
+                    "_id": the_uuid,
+                    "hash": f"hash-{i % 5}",
+                    "name": f"artifact-{i}",
+                    "type": "odd" if i % 2 else "even",
+                },
+            )
+
+    def tearDown(self):
+        for path in ("test-journal.json", "test-journal.json.journal"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_compaction(self):
+        # 10 artifacts: 8 were compacted into the JSON file, 2 are journaled.
+        with open("test-journal.json") as f:
+            self.assertEqual(len(json.load(f)), 8)
+        with open("test-journal.json.journal") as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        self.db.close()
+        self.assertFalse(Path("test-journal.json.journal").exists())
+        with open("test-journal.json") as f:
+            self.assertEqual(len(json.load(f)), 10)
+
+    def test_reload(self):
+        db = getDBConnection("file://test-journal.json")
+        for the_uuid in self.uuids:
+            self.assertIn(the_uuid, db)
+        self.assertEqual(len(list(db.get_artifact_by_hash("hash-0"))), 2)
+
+    def test_search(self):
+        self.assertEqual(
+            [a["name"] for a in self.db.searchByName("artifact-3", limit=0)],
+            ["artifact-3"],
+        )
+        self.assertEqual(len(list(self.db.searchByType("odd", limit=0))), 5)
+        self.assertEqual(len(list(self.db.searchByType("odd", limit=2))), 2)
+        self.assertEqual(
+            len(list(self.db.searchByNameType("artifact-3", "even", 0))), 0
+        )
+        self.assertEqual(
+            [
+                a["name"]
+                for a in self.db.searchByLikeNameType("act-[12]", "odd", 0)
+            ],
+            ["artifact-1"],
+        )
+
+    def test_find_exact(self):
+        found = list(
+            self.db.find_exact({"hash": "hash-1", "type": "odd"}, limit=10)
+        )
+        # hash-1 is shared by artifact-1 (odd) and artifact-6 (even).
+        self.assertEqual([a["name"] for a in found], ["artifact-1"])
+        self.assertEqual(
+            len(list(self.db.find_exact({"type": "even"}, limit=3))), 3
+        )
+        self.assertEqual(
+            len(list(self.db.find_exact({"name": "missing"}, limit=10))), 0
+        )
@@ -37,8 +37,15 @@ import json
 import os
 import signal
 import subprocess
+import threading
 import time
 import zipfile
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 from typing import (
     Any,
@@ -474,12 +481,30 @@ class gem5Run:
         # Connect to the database
         db = artifact.getDBConnection()
 
+        if not self._execute(task, cwd):
+            return
+
+        self._store(db)
+
+    def _execute(
+        self,
+        task: Any = None,
+        cwd: str = ".",
+        stop: Optional[threading.Event] = None,
+    ) -> bool:
+        """Run the gem5 command and wait for it to finish, without storing
+        anything in the database.
+
+        If stop is given, the gem5 process is killed once it is set.
+
+        Returns False if the artifact check failed and gem5 was not run.
+        """
         self.status = "Begin run"
         self.dumpJson("info.json")
 
         if not self.checkArtifacts(cwd):
             self.dumpJson("info.json")
-            return
+            return False
 
         self.status = "Spawning"
 
@@ -500,8 +525,11 @@ class gem5Run:
             # Note: We'll fall out of the while loop after this.
 
         # This makes it so if you term *this* process, it will actually kill
-        # the subprocess and then this process will die.
-        signal.signal(signal.SIGTERM, handler)
+        # the subprocess and then this process will die. Handlers can only be
+        # set from the main thread; when runs are executed by threads (see
+        # runLocally), the stop event does this instead.
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, handler)
 
         # Do this until the subprocess is done (successfully or not)
         while proc.poll() is None:
@@ -528,10 +556,17 @@ class gem5Run:
                 proc.kill()
                 self.kill_reason = "User defined kill"
 
+            if stop is not None and stop.is_set():
+                proc.kill()
+                self.kill_reason = "stopped"
+
             self.dumpJson("info.json")
 
             # Check again in five seconds
-            time.sleep(5)
+            if stop is not None:
+                stop.wait(5)
+            else:
+                time.sleep(5)
 
         print(f"Done running {' '.join(self.command)}")
 
@@ -547,6 +582,10 @@ class gem5Run:
 
         self.dumpJson("info.json")
 
+        return True
+
+    def _store(self, db: ArtifactDB) -> None:
+        """Store the results and this run in the database."""
         self.saveResults()
 
         # Store current gem5 run in the database
@@ -695,3 +734,118 @@ def getRerunnableRunsByNameLike(
     for run in getRunsByNameLike(db, name, fs_only, limit):
         if run.rerunnable:
             yield run
+
+
+def _memoryBudget() -> int:
+    """Returns the physical memory currently available, in bytes."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError):
+        # Not available on this platform: do not limit by memory.
+        return 0
+
+
+def runLocally(
+    runs: Iterable[gem5Run],
+    cwd: str = ".",
+    num_parallel_jobs: Optional[int] = None,
+    memory_per_run: Union[int, Callable[[gem5Run], int], None] = None,
+    max_memory: Optional[int] = None,
+) -> List[gem5Run]:
+    """Runs gem5 runs in parallel on this machine, without a job server.
+
+    Runs whose hash is already in the database are skipped, as are repeated
+    runs with the same hash. Every other run is stored in the database,
+    with its status and start and end times, as soon as it finishes, so an
+    interrupted sweep keeps all the runs completed so far. Starting the sweep
+    again only executes the remaining runs.
+
+    Each run is executed by `run()`'s machinery on a thread of this process,
+    which waits for its gem5 process. All database accesses are made from the
+    calling thread.
+
+    num_parallel_jobs is the maximum number of runs executed at once. By
+    default, it is the number of CPUs.
+
+    memory_per_run is an estimate, in bytes, of the memory used by a run,
+    either the same for every run or a function returning it for a given run.
+    If given, runs are only started while the sum of the estimates of the
+    runs executing fits in max_memory, which defaults to the physical memory
+    available when runLocally is called. Larger runs are started first, and
+    a run is always started if no other run is executing.
+
+    Returns the runs that were executed.
+    """
+    db = artifact.getDBConnection()
+
+    if num_parallel_jobs is None:
+        num_parallel_jobs = os.cpu_count() or 1
+    if num_parallel_jobs < 1:
+        raise ValueError("num_parallel_jobs must be at least 1")
+
+    def estimate(run: gem5Run) -> int:
+        if memory_per_run is None:
+            return 0
+        if callable(memory_per_run):
+            return memory_per_run(run)
+        return memory_per_run
+
+    if memory_per_run is not None and max_memory is None:
+        max_memory = _memoryBudget()
+
+    pending: List[gem5Run] = []
+    hashes = set()
+    for run in runs:
+        if run.hash in db or run.hash in hashes:
+            print(f"Skipping {' '.join(run.command)}: already run.")
+            continue
+        hashes.add(run.hash)
+        pending.append(run)
+    # Start the largest runs first so that smaller ones can fill the gaps.
+    pending.sort(key=estimate, reverse=True)
+
+    executed: List[gem5Run] = []
+    executing: Dict[Future, gem5Run] = {}
+    memory_used = 0
+    stop = threading.Event()
+
+    with ThreadPoolExecutor(num_parallel_jobs) as pool:
+        try:
+            while pending or executing:
+                i = 0
+                while i < len(pending) and len(executing) < num_parallel_jobs:
+                    run = pending[i]
+                    if (
+                        max_memory
+                        and executing
+                        and memory_used + estimate(run) > max_memory
+                    ):
+                        i += 1
+                        continue
+                    del pending[i]
+                    memory_used += estimate(run)
+                    print(f"Running {' '.join(run.command)}")
+                    executing[pool.submit(run._execute, None, cwd, stop)] = run
+
+                done, _ = wait(executing, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run = executing.pop(future)
+                    memory_used -= estimate(run)
+                    try:
+                        if not future.result():
+                            continue
+                    except Exception as e:
+                        print(f"Error running {' '.join(run.command)}: {e}")
+                        continue
+                    run._store(db)
+                    executed.append(run)
+                    print(
+                        f"{run.status}: {' '.join(run.command)}. "
+                        f"Total time = {run.end_time - run.start_time:.1f}s"
+                    )
+        except BaseException:
+            # Kill the gem5 processes still executing before leaving.
+            stop.set()
+            raise
+
+    return executed
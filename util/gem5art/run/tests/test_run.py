@@ -28,12 +28,19 @@
 
 import hashlib
 import os
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 from uuid import uuid4
 
 from gem5art.artifact import artifact
-from gem5art.run import gem5Run
+from gem5art.artifact._artifactdb import getDBConnection
+from gem5art.run import (
+    gem5Run,
+    runLocally,
+)
 
 
 class TestSERun(unittest.TestCase):
@@ -120,5 +127,93 @@ class TestSERun(unittest.TestCase):
         )
 
 
+class TestRunLocally(unittest.TestCase):
+    def setUp(self):
+        TestSERun.setUp(self)
+        self.db = getDBConnection("file://test-runlocally.json")
+        self.runs = [
+            gem5Run.createSERun(
+                f"test SE run {i}",
+                "configs-tests/run_test.py",
+                f"results/run_test/out{i}",
+                self.gem5art,
+                self.gem5gitart,
+                self.runscptart,
+                str(i),
+            )
+            for i in range(6)
+        ]
+        self.lock = threading.Lock()
+        self.executing = 0
+        self.max_executing = 0
+        self.memory = 0
+        self.max_memory = 0
+        self.started = []
+
+    def tearDown(self):
+        for path in ("test-runlocally.json", "test-runlocally.json.journal"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _execute(self, run, task, cwd, stop):
+        memory = int(run.params[0])
+        with self.lock:
+            self.started.append(run)
+            self.executing += 1
+            self.memory += memory
+            self.max_executing = max(self.max_executing, self.executing)
+            self.max_memory = max(self.max_memory, self.memory)
+        time.sleep(0.05)
+        with self.lock:
+            self.executing -= 1
+            self.memory -= memory
+        run.status = "Finished"
+        return True
+
+    def _store(self, run, db):
+        db.put(run._id, {"_id": run._id, "hash": run.hash})
+
+    def _runLocally(self, runs, **kwargs):
+        test = self
+        with patch.object(
+            gem5Run,
+            "_execute",
+            lambda run, task, cwd, stop: test._execute(run, task, cwd, stop),
+        ), patch.object(
+            gem5Run, "_store", lambda run, db: test._store(run, db)
+        ):
+            return runLocally(runs, **kwargs)
+
+    def test_skip_existing(self):
+        self.db.put(
+            self.runs[0]._id,
+            {"_id": self.runs[0]._id, "hash": self.runs[0].hash},
+        )
+        executed = self._runLocally(
+            self.runs + [self.runs[1]], num_parallel_jobs=2
+        )
+        self.assertEqual(len(executed), 5)
+        self.assertNotIn(self.runs[0], executed)
+        for run in self.runs:
+            self.assertIn(run.hash, self.db)
+        self.assertLessEqual(self.max_executing, 2)
+
+        # Everything is in the database now.
+        self.assertEqual(self._runLocally(self.runs), [])
+
+    def test_memory_packing(self):
+        # Run i uses i units of memory.
+        executed = self._runLocally(
+            self.runs,
+            num_parallel_jobs=6,
+            memory_per_run=lambda run: int(run.params[0]),
+            max_memory=6,
+        )
+        self.assertEqual(len(executed), 6)
+        self.assertLessEqual(self.max_memory, 6)
+        # The largest run is started first.
+        self.assertEqual(self.started[0], self.runs[5])
+
+
 if __name__ == "__main__":
     unittest.main()